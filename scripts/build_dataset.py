@@ -0,0 +1,103 @@
+"""
+Script para convertir directorios de imágenes en un conjunto de datos.
+
+Empaqueta los patrones a 1 bit en un único archivo que se abre con
+np.memmap (ver src/utils/pattern_dataset.py), junto con el índice de
+letras, tasas de corrupción y nombres de archivo originales.
+"""
+
+import sys
+from pathlib import Path
+import argparse
+
+# Agregar directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.reconstruct import parse_size
+from src.config.settings import config
+from src.utils.pattern_dataset import DATASET_EXTENSION, build_dataset
+from src.utils.validators import ValidationError
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(
+        description='Convierte imágenes de patrones en un conjunto de datos empaquetado'
+    )
+    parser.add_argument(
+        'sources',
+        type=str,
+        nargs='+',
+        help='Directorios, patrones glob o imágenes a incluir'
+    )
+    parser.add_argument(
+        '--output',
+        type=str,
+        default=f'data/patterns{DATASET_EXTENSION}',
+        help=f'Archivo de salida (default: data/patterns{DATASET_EXTENSION})'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Hilos de decodificación (default: número de núcleos)'
+    )
+    parser.add_argument(
+        '--size',
+        type=parse_size,
+        default=None,
+        help=(
+            'Resolución de los patrones, ANCHOxALTO (ej: 22x30) '
+            f'(default: {config.image.WIDTH}x{config.image.HEIGHT})'
+        )
+    )
+    parser.add_argument(
+        '--resample',
+        action='store_true',
+        help='Remuestrear por área imágenes de cualquier tamaño a --size'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=None,
+        help='Umbral de binarización sobre R+G+B, de 0 a 765 (default: 600)'
+    )
+
+    args = parser.parse_args()
+
+    try:
+        dataset = build_dataset(
+            args.sources,
+            n_workers=args.workers,
+            size=args.size,
+            resample=args.resample,
+            threshold=args.threshold
+        )
+    except ValidationError as e:
+        logger.error(f"Imágenes no válidas:\n{e}")
+        return
+
+    if len(dataset) == 0:
+        logger.error("No se encontraron imágenes de entrada")
+        return
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    dataset.save(output)
+
+    n_clean = len(dataset.select(corrupted=False))
+    print(
+        f"{len(dataset)} patrones ({n_clean} limpios, "
+        f"{len(dataset) - n_clean} corruptos o sin tasa), "
+        f"{dataset.pattern_size[0]}x{dataset.pattern_size[1]}, "
+        f"letras: {', '.join(dataset.letters) or '-'} -> {output} "
+        f"({output.stat().st_size / 1024:.1f} KB)"
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+Script para reconstruir patrones corruptos sin interfaz gráfica.
+
+Entrena (o recupera de la caché de redes entrenadas) una Red de Hopfield
+con los patrones indicados y reconstruye una o más imágenes corruptas.
+"""
+
+import sys
+from pathlib import Path
+import argparse
+
+# Agregar directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config.settings import config
+from src.models.hopfield_network import HopfieldNetwork
+from src.models.model_cache import ModelCache
+from src.utils.image_processor import ImageProcessor
+from src.utils.packed_patterns import PackedPatterns
+from src.utils.pattern_loader import cache_path_for, find_image_files, load_patterns
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def parse_size(text: str) -> tuple:
+    """
+    Convierte 'ANCHOxALTO' en una tupla (ancho, alto).
+
+    Args:
+        text: Tamaño en formato '22x30'.
+
+    Returns:
+        Tupla (ancho, alto).
+
+    Raises:
+        argparse.ArgumentTypeError: Si el formato no es válido.
+    """
+    try:
+        width, height = (int(value) for value in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Tamaño inválido: {text} (use ANCHOxALTO)")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"Tamaño inválido: {text}")
+    return width, height
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(
+        description='Reconstruye patrones corruptos con una Red de Hopfield'
+    )
+    parser.add_argument(
+        'patterns',
+        type=str,
+        help='Directorio, patrón glob o archivo con los patrones de entrenamiento'
+    )
+    parser.add_argument(
+        'corrupted',
+        type=str,
+        help='Imagen corrupta o directorio de imágenes corruptas'
+    )
+    parser.add_argument(
+        '--output',
+        type=str,
+        default='data/examples',
+        help='Directorio de salida (default: data/examples)'
+    )
+    parser.add_argument(
+        '--rule',
+        type=str,
+        default='hebbian',
+        choices=HopfieldNetwork.LEARNING_RULES,
+        help='Regla de aprendizaje (default: hebbian)'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=config.network.MODEL_CACHE_DIR,
+        help=f'Caché de redes entrenadas (default: {config.network.MODEL_CACHE_DIR})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Sin cachés en disco (redes entrenadas y patrones decodificados)'
+    )
+    parser.add_argument(
+        '--size',
+        type=parse_size,
+        default=None,
+        help=(
+            'Resolución de la red, ANCHOxALTO (ej: 22x30); las imágenes se '
+            f'remuestrean por área (default: {config.image.WIDTH}x{config.image.HEIGHT}, sin remuestreo)'
+        )
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=None,
+        help='Umbral de binarización sobre R+G+B, de 0 a 765 (default: 600)'
+    )
+    parser.add_argument(
+        '--one-bit',
+        action='store_true',
+        help='Guardar las reconstrucciones como PNG de 1 bit'
+    )
+
+    args = parser.parse_args()
+
+    # Con --size, cualquier imagen se remuestrea a la resolución de la red
+    resample = args.size is not None
+    size = args.size or config.image.size
+    decoding = {'size': size, 'resample': resample, 'threshold': args.threshold}
+
+    pattern_cache = None if args.no_cache else cache_path_for(args.patterns, size=size)
+    pattern_paths, patterns = load_patterns(args.patterns, cache_path=pattern_cache, **decoding)
+    pattern_paths = [Path(path) for path in pattern_paths]
+    corrupted_paths = [Path(path) for path in find_image_files(args.corrupted)]
+    if not pattern_paths or not corrupted_paths:
+        logger.error("No se encontraron imágenes de entrada")
+        return
+
+    cache = ModelCache(directory=None if args.no_cache else args.cache_dir)
+    network = cache.get_or_train(patterns, size, learning_rule=args.rule)
+    library = PackedPatterns.from_patterns(patterns)
+
+    output_dir = Path(args.output)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    for path in corrupted_paths:
+        corrupted = ImageProcessor.load_pattern(str(path), **decoding)
+        prediction = network.predict(corrupted)
+
+        similarities = library.similarity(prediction)
+        best = int(similarities.argmax())
+        output_file = output_dir / f"reconstructed_{path.stem}.png"
+        ImageProcessor.pattern_to_image(
+            prediction, size=size, save_path=str(output_file), one_bit=args.one_bit
+        )
+
+        print(
+            f"{path.name}: {pattern_paths[best].name} "
+            f"({similarities[best]*100:.1f}% de similitud) -> {output_file}"
+        )
+
+    logger.info(f"Caché de redes: {cache.stats()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -14,12 +14,18 @@ import logging
 class ImageSettings:
     """Configuración relacionada con procesamiento de imágenes."""
 
+    # Resolución por defecto; cada red puede usar otra (pattern_size) y
+    # ImageProcessor.load_pattern(size=..., resample=True) lleva cualquier
+    # imagen a ella
     WIDTH: int = 44
     HEIGHT: int = 60
     WHITE_PIXEL: Tuple[int, int, int, int] = (255, 255, 255, 255)
     BLACK_PIXEL: Tuple[int, int, int, int] = (0, 0, 0, 0)
     SUPPORTED_FORMATS: Tuple[str, ...] = ('png', 'jpg', 'jpeg', 'bmp')
 
+    # Caché de patrones decodificados (pattern_loader.load_patterns)
+    PATTERN_CACHE_DIR: str = '.cache/patterns'
+
     @property
     def size(self) -> Tuple[int, int]:
         """Retorna tupla (ancho, alto)."""
@@ -39,6 +45,35 @@ class NetworkSettings:
     DEFAULT_PATTERNS: int = 4
     CONVERGENCE_THRESHOLD: float = 0.001
 
+    # Política de tipos: estados ±1 y almacenamiento de pesos
+    STATE_DTYPE: str = 'int8'
+    WEIGHT_DTYPE: str = 'float64'
+    WEIGHT_DTYPES: Tuple[str, ...] = ('float64', 'float32', 'int16')
+
+    # Pesos dispersos (weight_mode='sparse')
+    PRUNING_METHOD: str = 'magnitude'
+    SPARSE_DENSITY: float = 0.1
+    PRUNING_SEED: int = 0
+
+    # Dinámica estocástica (predict_stochastic)
+    GLAUBER_REPLICAS: int = 8
+    GLAUBER_BLOCK_SIZE: int = 64
+    ANNEALING_SCHEDULE: str = 'geometric'
+    ANNEALING_SWEEPS: int = 30
+    ANNEALING_T_START: float = 0.3
+    ANNEALING_T_END: float = 0.02
+
+    # Conjunto de reinicios (predict_ensemble)
+    ENSEMBLE_RESTARTS: int = 16
+
+    # Caché de redes entrenadas (ModelCache)
+    MODEL_CACHE_ENTRIES: int = 8
+    MODEL_CACHE_DIR: str = '.cache/models'
+    MODEL_CACHE_DISK_ENTRIES: int = 32
+
+    # Caché de resultados de predicción (PredictionCache)
+    PREDICTION_CACHE_ENTRIES: int = 1024
+
     def validate(self) -> None:
         """Valida la configuración."""
         if self.MAX_ITERATIONS <= 0:
@@ -47,6 +82,22 @@ class NetworkSettings:
             raise ValueError("DEFAULT_PATTERNS debe ser positivo")
         if not 0 < self.CONVERGENCE_THRESHOLD < 1:
             raise ValueError("CONVERGENCE_THRESHOLD debe estar entre 0 y 1")
+        if self.STATE_DTYPE not in ('int8', 'int16', 'int32', 'int64', 'float32', 'float64'):
+            raise ValueError("STATE_DTYPE debe ser un tipo entero con signo o flotante")
+        if self.WEIGHT_DTYPE not in self.WEIGHT_DTYPES:
+            raise ValueError(
+                f"WEIGHT_DTYPE debe ser uno de: {', '.join(self.WEIGHT_DTYPES)}"
+            )
+        if not 0 < self.SPARSE_DENSITY <= 1:
+            raise ValueError("SPARSE_DENSITY debe estar entre 0 y 1")
+        if self.GLAUBER_REPLICAS <= 0 or self.GLAUBER_BLOCK_SIZE <= 0:
+            raise ValueError("GLAUBER_REPLICAS y GLAUBER_BLOCK_SIZE deben ser positivos")
+        if (self.MODEL_CACHE_ENTRIES <= 0 or self.MODEL_CACHE_DISK_ENTRIES <= 0
+                or self.PREDICTION_CACHE_ENTRIES <= 0):
+            raise ValueError(
+                "MODEL_CACHE_ENTRIES, MODEL_CACHE_DISK_ENTRIES y "
+                "PREDICTION_CACHE_ENTRIES deben ser positivos"
+            )
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,72 @@
+"""
+Programas de temperatura para la dinámica estocástica (Glauber).
+
+Un programa de recocido es la secuencia de temperaturas, una por barrido,
+con la que se enfría la red: a temperatura alta las neuronas cambian casi
+al azar y escapan de mínimos espurios; al bajar la temperatura la
+dinámica se vuelve determinista y la red cae en un mínimo profundo.
+"""
+
+from typing import Callable, Sequence, Union
+import numpy as np
+
+
+ANNEALING_SCHEDULES = ('geometric', 'linear', 'constant')
+
+# Programa: nombre, secuencia de temperaturas o función barrido -> T
+Schedule = Union[str, Sequence[float], np.ndarray, Callable[[int], float]]
+
+
+def annealing_schedule(
+    schedule: Schedule,
+    n_sweeps: int,
+    t_start: float,
+    t_end: float
+) -> np.ndarray:
+    """
+    Construye la secuencia de temperaturas de un recocido.
+
+    Args:
+        schedule: 'geometric' (T_k = T_0·(T_f/T_0)^(k/(n−1))), 'linear',
+            'constant' (siempre t_start), una secuencia de temperaturas o
+            una función que recibe el número de barrido y retorna T.
+        n_sweeps: Número de barridos (se ignora si schedule es una secuencia).
+        t_start: Temperatura inicial.
+        t_end: Temperatura final.
+
+    Returns:
+        Array de temperaturas no negativas, una por barrido.
+
+    Raises:
+        ValueError: Si el programa o sus parámetros no son válidos.
+    """
+    if callable(schedule):
+        temperatures = np.array([schedule(k) for k in range(n_sweeps)], dtype=float)
+    elif not isinstance(schedule, str):
+        temperatures = np.asarray(schedule, dtype=float)
+    else:
+        if schedule not in ANNEALING_SCHEDULES:
+            raise ValueError(
+                f"Programa de recocido no soportado: {schedule}. "
+                f"Opciones: {', '.join(ANNEALING_SCHEDULES)}"
+            )
+        if n_sweeps <= 0:
+            raise ValueError("n_sweeps debe ser positivo")
+        if t_start < 0 or t_end < 0:
+            raise ValueError("Las temperaturas no pueden ser negativas")
+
+        if schedule == 'constant':
+            temperatures = np.full(n_sweeps, float(t_start))
+        elif schedule == 'linear':
+            temperatures = np.linspace(t_start, t_end, n_sweeps)
+        else:
+            if t_start == 0 or t_end == 0:
+                raise ValueError("El programa geométrico requiere temperaturas positivas")
+            temperatures = np.geomspace(t_start, t_end, n_sweeps)
+
+    if temperatures.ndim != 1 or len(temperatures) == 0:
+        raise ValueError("El programa debe tener al menos una temperatura")
+    if np.any(temperatures < 0) or not np.all(np.isfinite(temperatures)):
+        raise ValueError("Las temperaturas deben ser finitas y no negativas")
+
+    return temperatures
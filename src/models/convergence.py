@@ -0,0 +1,382 @@
+"""
+Criterios de convergencia para la actualización asíncrona.
+
+Cada criterio se evalúa dentro del barrido: recibe un aviso por cada
+neurona que cambia (on_flip, O(1) o O(p)) y un resumen al final del
+barrido (número de cambios y energía), de modo que nunca hace falta
+copiar ni comparar estados completos. Los criterios se combinan con
+los operadores | (basta uno) y & (deben cumplirse todos).
+
+La red nunca ejecuta una predicción sobre el criterio configurado: usa
+una copia por llamada (spawn) y al terminar publica su estado en el
+original (adopt), así que varias predicciones concurrentes no comparten
+contadores, hashes ni historiales.
+
+Example:
+    >>> criterion = StoredPatternMatch() | EnergyPlateau(patience=2)
+    >>> network = HopfieldNetwork((44, 60), convergence=criterion)
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+import copy
+import numpy as np
+
+
+class ConvergenceCriterion(ABC):
+    """
+    Interfaz de un criterio de parada evaluado durante la predicción.
+
+    Attributes:
+        name: Nombre del criterio (se usa en los mensajes de log).
+        reason: Nombre del criterio que detuvo la última predicción.
+    """
+
+    name = 'criterion'
+
+    def __init__(self):
+        self.reason: Optional[str] = None
+
+    def start(self, network, state: np.ndarray, energy: float) -> None:
+        """
+        Prepara el criterio al comenzar una predicción.
+
+        Args:
+            network: Red que ejecuta la predicción.
+            state: Estado inicial.
+            energy: Energía del estado inicial.
+        """
+        self.reason = None
+
+    @property
+    def tracks_flips(self) -> bool:
+        """True si el criterio necesita el aviso de cada cambio."""
+        return type(self).on_flip is not ConvergenceCriterion.on_flip
+
+    def on_flip(self, i: int, new_value: int) -> None:
+        """
+        Registra el cambio de la neurona i.
+
+        Args:
+            i: Índice de la neurona.
+            new_value: Nuevo valor (-1 o 1).
+        """
+
+    @abstractmethod
+    def end_sweep(self, n_flips: int, energy: float) -> bool:
+        """
+        Decide al final de un barrido si la predicción terminó.
+
+        Args:
+            n_flips: Neuronas que cambiaron en el barrido.
+            energy: Energía tras el barrido.
+
+        Returns:
+            True si se cumple el criterio.
+        """
+
+    def reset(self) -> None:
+        """Olvida el estado de la última predicción."""
+        self.reason = None
+
+    def spawn(self) -> 'ConvergenceCriterion':
+        """
+        Crea una copia independiente para una predicción.
+
+        La copia es superficial: start debe reasignar (no modificar
+        in-place) los contenedores con estado de la predicción. Las
+        subclases que no lo hagan deben redefinir este método.
+
+        Returns:
+            Criterio con la misma configuración.
+        """
+        return copy.copy(self)
+
+    def adopt(self, other: 'ConvergenceCriterion') -> None:
+        """
+        Toma el estado de una copia que terminó su predicción.
+
+        Args:
+            other: Copia creada con spawn.
+        """
+        vars(self).update(vars(other))
+
+    def __or__(self, other: 'ConvergenceCriterion') -> 'AnyOf':
+        return AnyOf(self, other)
+
+    def __and__(self, other: 'ConvergenceCriterion') -> 'AllOf':
+        return AllOf(self, other)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class ZeroFlips(ConvergenceCriterion):
+    """Punto fijo: un barrido completo sin cambios."""
+
+    name = 'zero_flips'
+
+    def end_sweep(self, n_flips: int, energy: float) -> bool:
+        if n_flips == 0:
+            self.reason = self.name
+            return True
+        return False
+
+
+class FlipThreshold(ConvergenceCriterion):
+    """
+    Pocos cambios: como mucho max_flips neuronas cambiaron en el barrido.
+
+    Attributes:
+        max_flips: Número máximo de cambios para considerar convergencia.
+    """
+
+    name = 'flip_threshold'
+
+    def __init__(self, max_flips: int = 0):
+        """
+        Inicializa el criterio.
+
+        Args:
+            max_flips: Número máximo de cambios (no negativo).
+
+        Raises:
+            ValueError: Si max_flips es negativo.
+        """
+        super().__init__()
+        if max_flips < 0:
+            raise ValueError("max_flips no puede ser negativo")
+        self.max_flips = max_flips
+
+    def end_sweep(self, n_flips: int, energy: float) -> bool:
+        if n_flips <= self.max_flips:
+            self.reason = self.name
+            return True
+        return False
+
+    def __repr__(self) -> str:
+        return f"FlipThreshold(max_flips={self.max_flips})"
+
+
+class EnergyPlateau(ConvergenceCriterion):
+    """
+    Meseta de energía: la energía bajó como mucho tolerance durante
+    patience barridos consecutivos.
+
+    Attributes:
+        tolerance: Descenso de energía mínimo para seguir iterando.
+        patience: Barridos consecutivos en la meseta antes de parar.
+    """
+
+    name = 'energy_plateau'
+
+    def __init__(self, tolerance: float = 1e-9, patience: int = 1):
+        """
+        Inicializa el criterio.
+
+        Args:
+            tolerance: Descenso de energía considerado nulo (no negativo).
+            patience: Barridos consecutivos requeridos (al menos 1).
+
+        Raises:
+            ValueError: Si tolerance o patience no son válidos.
+        """
+        super().__init__()
+        if tolerance < 0:
+            raise ValueError("tolerance no puede ser negativo")
+        if patience < 1:
+            raise ValueError("patience debe ser al menos 1")
+        self.tolerance = tolerance
+        self.patience = patience
+        self._energy = 0.0
+        self._streak = 0
+
+    def start(self, network, state: np.ndarray, energy: float) -> None:
+        super().start(network, state, energy)
+        self._energy = energy
+        self._streak = 0
+
+    def end_sweep(self, n_flips: int, energy: float) -> bool:
+        if self._energy - energy <= self.tolerance:
+            self._streak += 1
+        else:
+            self._streak = 0
+        self._energy = energy
+
+        if self._streak >= self.patience:
+            self.reason = self.name
+            return True
+        return False
+
+    def __repr__(self) -> str:
+        return f"EnergyPlateau(tolerance={self.tolerance}, patience={self.patience})"
+
+
+class StoredPatternMatch(ConvergenceCriterion):
+    """
+    Coincidencia exacta con un patrón almacenado (solapamiento = 1).
+
+    Mantiene los solapamientos s·ξ con los p patrones almacenados; cada
+    cambio los actualiza en O(p) con la columna i de los patrones.
+
+    Attributes:
+        matched: Índice del patrón alcanzado en la última predicción.
+    """
+
+    name = 'stored_pattern'
+
+    def __init__(self):
+        super().__init__()
+        self.matched: Optional[int] = None
+        self._columns: Optional[np.ndarray] = None
+        self._overlaps: Optional[np.ndarray] = None
+        self._n_neurons = 0
+
+    def start(self, network, state: np.ndarray, energy: float) -> None:
+        super().start(network, state, energy)
+        patterns = network.stored_patterns
+        self.matched = None
+        self._n_neurons = len(state)
+        # Columnas contiguas: el cambio de la neurona i lee una sola fila
+        self._columns = np.ascontiguousarray(patterns.T, dtype=np.int32)
+        self._overlaps = np.dot(state.astype(np.int32), self._columns)
+
+    def on_flip(self, i: int, new_value: int) -> None:
+        self._overlaps += (2 * int(new_value)) * self._columns[i]
+
+    def end_sweep(self, n_flips: int, energy: float) -> bool:
+        hits = np.flatnonzero(self._overlaps == self._n_neurons)
+        if len(hits):
+            self.matched = int(hits[0])
+            self.reason = self.name
+            return True
+        return False
+
+
+class CycleDetection(ConvergenceCriterion):
+    """
+    Ciclo: el estado al final del barrido ya se había visitado.
+
+    El estado se identifica con un hash de Zobrist de 64 bits (XOR de una
+    clave aleatoria por neurona activa), que cada cambio actualiza en O(1).
+    Con pesos simétricos la dinámica asíncrona no tiene ciclos, pero el
+    criterio protege frente a pesos asimétricos o dinámicas modificadas.
+
+    Attributes:
+        seed: Semilla de las claves aleatorias.
+    """
+
+    name = 'cycle'
+
+    def __init__(self, seed: int = 0):
+        """
+        Inicializa el criterio.
+
+        Args:
+            seed: Semilla de las claves de Zobrist.
+        """
+        super().__init__()
+        self.seed = seed
+        self._keys: Optional[np.ndarray] = None
+        self._hash = 0
+        self._seen: set = set()
+
+    def start(self, network, state: np.ndarray, energy: float) -> None:
+        super().start(network, state, energy)
+        if self._keys is None or len(self._keys) != len(state):
+            rng = np.random.default_rng(self.seed)
+            keys = rng.integers(0, np.iinfo(np.int64).max, size=len(state))
+            self._keys = [int(key) for key in keys]
+        self._hash = 0
+        for i in np.flatnonzero(state > 0):
+            self._hash ^= self._keys[i]
+        self._seen = {self._hash}
+
+    def on_flip(self, i: int, new_value: int) -> None:
+        self._hash ^= self._keys[i]
+
+    def end_sweep(self, n_flips: int, energy: float) -> bool:
+        if n_flips > 0 and self._hash in self._seen:
+            self.reason = self.name
+            return True
+        self._seen.add(self._hash)
+        return False
+
+
+class AnyOf(ConvergenceCriterion):
+    """Combinación que se cumple cuando se cumple alguno de los criterios."""
+
+    name = 'any'
+
+    def __init__(self, *criteria: ConvergenceCriterion):
+        """
+        Inicializa la combinación.
+
+        Args:
+            *criteria: Criterios a combinar (al menos uno).
+
+        Raises:
+            ValueError: Si no se pasa ningún criterio.
+        """
+        super().__init__()
+        if not criteria:
+            raise ValueError("Se requiere al menos un criterio")
+        self.criteria: List[ConvergenceCriterion] = list(criteria)
+        self._flip_criteria = [c for c in self.criteria if c.tracks_flips]
+
+    @property
+    def tracks_flips(self) -> bool:
+        return bool(self._flip_criteria)
+
+    def start(self, network, state: np.ndarray, energy: float) -> None:
+        super().start(network, state, energy)
+        for criterion in self.criteria:
+            criterion.start(network, state, energy)
+
+    def on_flip(self, i: int, new_value: int) -> None:
+        for criterion in self._flip_criteria:
+            criterion.on_flip(i, new_value)
+
+    def end_sweep(self, n_flips: int, energy: float) -> bool:
+        # Todos los criterios se evalúan para mantener su estado al día
+        results = [c.end_sweep(n_flips, energy) for c in self.criteria]
+        fired = [c.reason for c, done in zip(self.criteria, results) if done]
+        if fired:
+            self.reason = fired[0]
+            return True
+        return False
+
+    def reset(self) -> None:
+        super().reset()
+        for criterion in self.criteria:
+            criterion.reset()
+
+    def spawn(self) -> 'AnyOf':
+        clone = copy.copy(self)
+        clone.criteria = [criterion.spawn() for criterion in self.criteria]
+        clone._flip_criteria = [c for c in clone.criteria if c.tracks_flips]
+        return clone
+
+    def adopt(self, other: 'AnyOf') -> None:
+        self.reason = other.reason
+        for criterion, finished in zip(self.criteria, other.criteria):
+            criterion.adopt(finished)
+
+    def __repr__(self) -> str:
+        return ' | '.join(repr(c) for c in self.criteria)
+
+
+class AllOf(AnyOf):
+    """Combinación que se cumple cuando se cumplen todos los criterios."""
+
+    name = 'all'
+
+    def end_sweep(self, n_flips: int, energy: float) -> bool:
+        results = [c.end_sweep(n_flips, energy) for c in self.criteria]
+        if all(results):
+            self.reason = ' & '.join(c.reason for c in self.criteria)
+            return True
+        return False
+
+    def __repr__(self) -> str:
+        return ' & '.join(repr(c) for c in self.criteria)
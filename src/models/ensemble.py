@@ -0,0 +1,205 @@
+"""
+Reconstrucción por conjunto de reinicios en paralelo.
+
+Cada reinicio reconstruye el mismo patrón con un orden de actualización
+aleatorio o con dinámica estocástica (y, opcionalmente, una perturbación
+aleatoria de la entrada). Los reinicios se reparten en un pool de
+procesos; los arrays de pesos se copian una sola vez a memoria
+compartida (multiprocessing.shared_memory) y cada proceso los adjunta
+sin copiarlos, en lugar de recibir la red serializada en cada tarea.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+import copy
+import logging
+import os
+
+import numpy as np
+
+from src.models.schedulers import RandomPermutationScheduler
+
+logger = logging.getLogger(__name__)
+
+
+ENSEMBLE_METHODS = ('random', 'stochastic')
+ENSEMBLE_VOTES = ('energy', 'majority')
+
+# Red y patrón de cada proceso del pool (se fijan en el inicializador)
+_worker_network = None
+_worker_pattern: Optional[np.ndarray] = None
+_worker_handles: List[shared_memory.SharedMemory] = []
+
+
+def share_network(network) -> Tuple[Dict[str, Any], List[shared_memory.SharedMemory]]:
+    """
+    Copia los pesos de una red a memoria compartida.
+
+    Args:
+        network: Red entrenada.
+
+    Returns:
+        Tupla (especificación serializable para reconstruir la red en
+        otro proceso, bloques de memoria compartida creados). El llamador
+        debe cerrar y liberar los bloques con release_shared.
+    """
+    storage = network._storage
+    shell = copy.copy(network)
+    shell._storage = None
+
+    attributes = {}
+    handles = []
+    for name, value in vars(storage).items():
+        if isinstance(value, np.ndarray) and value.nbytes > 0:
+            block = shared_memory.SharedMemory(create=True, size=value.nbytes)
+            np.ndarray(value.shape, dtype=value.dtype, buffer=block.buf)[...] = value
+            handles.append(block)
+            attributes[name] = ('shared', block.name, value.shape, value.dtype.str)
+        else:
+            attributes[name] = ('value', value)
+
+    spec = {'network': shell, 'storage_class': type(storage), 'attributes': attributes}
+    return spec, handles
+
+
+def attach_network(spec: Dict[str, Any]) -> Tuple[Any, List[shared_memory.SharedMemory]]:
+    """
+    Reconstruye una red a partir de la especificación de share_network.
+
+    Los arrays de pesos son vistas de solo lectura sobre la memoria
+    compartida.
+
+    Args:
+        spec: Especificación creada por share_network.
+
+    Returns:
+        Tupla (red, bloques adjuntados, que deben mantenerse abiertos
+        mientras se use la red).
+    """
+    storage = object.__new__(spec['storage_class'])
+    handles = []
+    for name, entry in spec['attributes'].items():
+        if entry[0] == 'shared':
+            _, block_name, shape, dtype = entry
+            block = shared_memory.SharedMemory(name=block_name)
+            array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+            array.flags.writeable = False
+            handles.append(block)
+            setattr(storage, name, array)
+        else:
+            setattr(storage, name, entry[1])
+
+    network = copy.copy(spec['network'])
+    network._storage = storage
+    return network, handles
+
+
+def release_shared(handles: List[shared_memory.SharedMemory]) -> None:
+    """Cierra y libera los bloques de memoria compartida creados."""
+    for block in handles:
+        block.close()
+        block.unlink()
+
+
+def run_restart(
+    network,
+    pattern: np.ndarray,
+    method: str,
+    seed: int,
+    perturbation: float
+) -> Tuple[np.ndarray, float]:
+    """
+    Ejecuta un reinicio de la reconstrucción.
+
+    Args:
+        network: Red entrenada.
+        pattern: Patrón corrupto.
+        method: 'random' (orden de actualización aleatorio) o
+            'stochastic' (dinámica de Glauber con recocido).
+        seed: Semilla del reinicio.
+        perturbation: Fracción de neuronas de la entrada a invertir al azar.
+
+    Returns:
+        Tupla (patrón reconstruido, energía).
+    """
+    rng = np.random.default_rng(seed)
+    state = pattern.copy()
+    n_flipped = int(round(perturbation * len(state)))
+    if n_flipped:
+        state[rng.choice(len(state), n_flipped, replace=False)] *= -1
+
+    if method == 'stochastic':
+        result, info = network.predict_stochastic(state, seed=seed, return_info=True)
+        return result, float(info['energies'][info['best']])
+
+    result, energies = network.predict(
+        state, return_energy=True, scheduler=RandomPermutationScheduler(seed)
+    )
+    return result, energies[-1]
+
+
+def _init_worker(spec: Dict[str, Any], pattern: np.ndarray) -> None:
+    """Inicializa un proceso del pool adjuntando la red compartida."""
+    global _worker_network, _worker_pattern, _worker_handles
+    # Los mensajes por reinicio saturarían el log del proceso principal
+    logging.getLogger('src.models.hopfield_network').setLevel(logging.WARNING)
+    _worker_network, _worker_handles = attach_network(spec)
+    _worker_pattern = pattern
+
+
+def _worker_restart(task: Tuple[str, int, float]) -> Tuple[np.ndarray, float]:
+    """Ejecuta un reinicio en un proceso del pool."""
+    method, seed, perturbation = task
+    return run_restart(_worker_network, _worker_pattern, method, seed, perturbation)
+
+
+def run_ensemble(
+    network,
+    pattern: np.ndarray,
+    n_restarts: int,
+    method: str,
+    perturbation: float,
+    n_workers: Optional[int],
+    seed: Optional[int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ejecuta los reinicios, en paralelo si n_workers > 1.
+
+    Args:
+        network: Red entrenada.
+        pattern: Patrón corrupto (ya validado).
+        n_restarts: Número de reinicios.
+        method: Método de cada reinicio (ver run_restart).
+        perturbation: Fracción de la entrada a invertir en cada reinicio.
+        n_workers: Procesos del pool (None para os.cpu_count()).
+        seed: Semilla base; cada reinicio recibe una semilla derivada.
+
+    Returns:
+        Tupla (resultados (n_restarts, N), energías (n_restarts,)).
+    """
+    seeds = np.random.SeedSequence(seed).generate_state(n_restarts)
+    tasks = [(method, int(task_seed), perturbation) for task_seed in seeds]
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = min(n_workers, n_restarts)
+
+    if n_workers <= 1:
+        outcomes = [run_restart(network, pattern, *task) for task in tasks]
+    else:
+        spec, handles = share_network(network)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_worker,
+                initargs=(spec, pattern)
+            ) as pool:
+                chunksize = max(1, n_restarts // (4 * n_workers))
+                outcomes = list(pool.map(_worker_restart, tasks, chunksize=chunksize))
+        finally:
+            release_shared(handles)
+
+    results = np.array([result for result, _ in outcomes])
+    energies = np.array([energy for _, energy in outcomes])
+    return results, energies
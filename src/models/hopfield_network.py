@@ -5,11 +5,55 @@ Este módulo contiene la implementación completa de una Red de Hopfield
 para reconocimiento y reconstrucción de patrones.
 """
 
-from typing import Optional, Tuple
+from pathlib import Path
+from typing import Optional, Tuple, Union
+import hashlib
+import json
+import threading
 import numpy as np
 import logging
 
 from src.models.network_interface import NeuralNetworkInterface, ConvergenceChecker
+from src.models.convergence import ConvergenceCriterion, ZeroFlips
+from src.models.annealing import Schedule, annealing_schedule
+from src.models.ensemble import ENSEMBLE_METHODS, ENSEMBLE_VOTES, run_ensemble
+from src.models.schedulers import (
+    FIELD_TIE_TOLERANCE,
+    SCHEDULERS,
+    SequentialScheduler,
+    UpdateScheduler,
+    is_unstable,
+    next_unstable,
+)
+from src.models.learning_rules import (
+    storkey_weights,
+    storkey_capacity,
+    pseudo_inverse_weights,
+    pseudo_inverse_update,
+)
+from src.models.weight_storage import (
+    WeightStorage,
+    DenseWeights,
+    CountWeights,
+    LowRankWeights,
+    SparseWeights,
+)
+from src.models.pruning import (
+    PRUNING_METHODS,
+    count_threshold,
+    local_synapses,
+    magnitude_threshold,
+    random_synapses,
+    row_blocks
+)
+from src.models.persistence import (
+    pattern_hash,
+    read_model,
+    restore_storage,
+    storage_state,
+    write_model,
+)
+from src.utils.packed_patterns import PackedPatterns
 from src.config.settings import config
 
 logger = logging.getLogger(__name__)
@@ -26,8 +70,29 @@ class HopfieldNetwork(NeuralNetworkInterface):
     Attributes:
         pattern_size: Tupla con dimensiones del patrón (ancho, alto).
         n_neurons: Número total de neuronas en la red.
-        weights: Matriz de pesos de la red.
-        convergence_checker: Verificador de convergencia.
+        weights: Matriz de pesos densa en coma flotante (None en modo
+            'low_rank', 'sparse' o con conteos int16).
+        weight_mode: Almacenamiento de pesos ('dense', 'low_rank' o
+            'sparse').
+        weight_dtype: Tipo de los pesos ('float64', 'float32' o 'int16').
+        learning_rule: Regla de aprendizaje ('hebbian', 'storkey' o
+            'pseudo_inverse').
+        pruning: Estrategia de poda en modo 'sparse' ('magnitude',
+            'random' o 'local').
+        density: Fracción de sinapsis conservadas en modo 'sparse'.
+        pruning_seed: Semilla de la poda 'random' (por defecto, la de config).
+        state_dtype: Tipo de los estados ±1 (por defecto int8).
+        convergence_checker: Verificador de convergencia por umbral.
+        convergence: Criterio de convergencia de predict (None para usar
+            convergence_checker o, sin verificación, un punto fijo).
+        scheduler: Planificador del orden de actualización de predict.
+
+    Los métodos de predicción son reentrantes y pueden llamarse desde
+    varios hilos sobre la misma red: cada llamada trabaja con su propia
+    copia del criterio de convergencia y del planificador (ver spawn), y
+    al terminar publica su estado en convergence_checker / convergence.
+    Entrenar o modificar la memoria mientras otros hilos predicen no es
+    seguro.
 
     Example:
         >>> network = HopfieldNetwork((44, 60))
@@ -37,10 +102,26 @@ class HopfieldNetwork(NeuralNetworkInterface):
         >>> reconstructed = network.predict(corrupted)
     """
 
+    # Campos con |h| menor a este valor se recalculan de forma exacta
+    _FIELD_TIE_TOLERANCE = FIELD_TIE_TOLERANCE
+
+    # Modos de almacenamiento de pesos soportados
+    WEIGHT_MODES = ('dense', 'low_rank', 'sparse')
+
+    # Reglas de aprendizaje soportadas
+    LEARNING_RULES = ('hebbian', 'storkey', 'pseudo_inverse')
+
     def __init__(
         self,
         pattern_size: Tuple[int, int],
-        use_convergence: bool = True
+        use_convergence: bool = True,
+        weight_mode: str = 'dense',
+        weight_dtype: Optional[str] = None,
+        learning_rule: str = 'hebbian',
+        pruning: Optional[str] = None,
+        density: Optional[float] = None,
+        convergence: Optional[ConvergenceCriterion] = None,
+        scheduler: Union[str, UpdateScheduler, None] = None
     ):
         """
         Inicializa la red de Hopfield.
@@ -48,83 +129,286 @@ class HopfieldNetwork(NeuralNetworkInterface):
         Args:
             pattern_size: Tupla con (ancho, alto) del patrón.
             use_convergence: Si True, usa verificación de convergencia.
+            weight_mode: 'dense' materializa la matriz N x N; 'low_rank'
+                guarda solo los patrones y calcula los campos en O(pN);
+                'sparse' poda los pesos entrenados y guarda el resto en
+                formato CSR, con campos en O(nnz).
+            weight_dtype: Tipo de los pesos. Si es None, usa config. 'int16'
+                guarda los conteos exactos de co-ocurrencia (W = C/p).
+            learning_rule: 'hebbian' (producto externo), 'storkey' o
+                'pseudo_inverse' (proyección), de mayor capacidad con
+                patrones correlacionados. Las reglas distintas de Hebb
+                requieren pesos densos o dispersos en coma flotante.
+            pruning: En modo 'sparse', 'magnitude' conserva los pesos de
+                mayor magnitud; 'random' y 'local' fijan un número de
+                sinapsis por neurona (al azar o vecinas en la imagen). Si
+                es None, usa config.
+            density: Fracción de sinapsis a conservar en modo 'sparse'. Si
+                es None, usa config.
+            convergence: Criterio de parada de predict (ver
+                src.models.convergence); tiene prioridad sobre
+                use_convergence.
+            scheduler: Orden de actualización de predict: una instancia de
+                src.models.schedulers o su nombre ('sequential', 'random',
+                'block', 'unstable_set'). Por defecto, secuencial.
 
         Raises:
-            ValueError: Si pattern_size no es válido.
+            ValueError: Si pattern_size, weight_mode, weight_dtype,
+                learning_rule, pruning, density o scheduler no son válidos
+                o no son compatibles.
         """
         if len(pattern_size) != 2:
             raise ValueError("pattern_size debe ser una tupla (ancho, alto)")
         if pattern_size[0] <= 0 or pattern_size[1] <= 0:
             raise ValueError("Las dimensiones deben ser positivas")
+        if weight_mode not in self.WEIGHT_MODES:
+            raise ValueError(
+                f"weight_mode no soportado: {weight_mode}. "
+                f"Opciones: {', '.join(self.WEIGHT_MODES)}"
+            )
+        if weight_dtype is None:
+            weight_dtype = config.network.WEIGHT_DTYPE
+        if weight_dtype not in config.network.WEIGHT_DTYPES:
+            raise ValueError(
+                f"weight_dtype no soportado: {weight_dtype}. "
+                f"Opciones: {', '.join(config.network.WEIGHT_DTYPES)}"
+            )
+        if learning_rule not in self.LEARNING_RULES:
+            raise ValueError(
+                f"learning_rule no soportada: {learning_rule}. "
+                f"Opciones: {', '.join(self.LEARNING_RULES)}"
+            )
+        if learning_rule != 'hebbian' and (weight_mode == 'low_rank' or weight_dtype == 'int16'):
+            raise ValueError(
+                f"La regla '{learning_rule}' requiere weight_mode='dense' o "
+                f"'sparse' y pesos float32 o float64"
+            )
+        if weight_mode == 'sparse' and weight_dtype == 'int16':
+            raise ValueError("weight_mode='sparse' requiere pesos float32 o float64")
+        if pruning is None:
+            pruning = config.network.PRUNING_METHOD
+        if pruning not in PRUNING_METHODS:
+            raise ValueError(
+                f"pruning no soportado: {pruning}. "
+                f"Opciones: {', '.join(PRUNING_METHODS)}"
+            )
+        if density is None:
+            density = config.network.SPARSE_DENSITY
+        if not 0 < density <= 1:
+            raise ValueError("density debe estar entre 0 y 1")
+        if scheduler is None:
+            scheduler = SequentialScheduler()
+        elif isinstance(scheduler, str):
+            if scheduler not in SCHEDULERS:
+                raise ValueError(
+                    f"scheduler no soportado: {scheduler}. "
+                    f"Opciones: {', '.join(SCHEDULERS)}"
+                )
+            scheduler = SCHEDULERS[scheduler]()
 
         self.pattern_size = pattern_size
         self.n_neurons = pattern_size[0] * pattern_size[1]
-        self.weights: Optional[np.ndarray] = None
+        self.weight_mode = weight_mode
+        self.weight_dtype = weight_dtype
+        self.learning_rule = learning_rule
+        self.pruning = pruning
+        self.density = density
+        self.state_dtype = np.dtype(config.network.STATE_DTYPE)
+        self.pruning_seed = config.network.PRUNING_SEED
+        self._weight_storage: Optional[WeightStorage] = None
         self.use_convergence = use_convergence
         self.convergence_checker = ConvergenceChecker(
             threshold=config.network.CONVERGENCE_THRESHOLD
         )
+        self.convergence = convergence
+        self.scheduler = scheduler
         self._n_patterns_trained = 0
+        self._patterns: Optional[np.ndarray] = None
+        self._projector_diagonal: Optional[np.ndarray] = None
+        self._fingerprint: Optional[Tuple[np.ndarray, str]] = None
+        self._lock = threading.RLock()
 
         logger.info(
             f"Red Hopfield inicializada: {self.n_neurons} neuronas "
             f"({pattern_size[0]}x{pattern_size[1]})"
         )
 
-    def train(self, patterns: np.ndarray) -> np.ndarray:
+    def train(self, patterns: Union[np.ndarray, PackedPatterns]) -> np.ndarray:
         """
-        Entrena la red usando la regla de Hebb.
+        Entrena la red usando la regla de aprendizaje configurada.
 
         La regla de Hebb establece que el peso entre dos neuronas aumenta
         si ambas están activas simultáneamente en los patrones de entrenamiento.
+        La regla de Storkey resta además el campo local que ya generan los
+        patrones anteriores (ver learning_rules.storkey_weights) y la de
+        proyección usa el proyector sobre el espacio de los patrones, que
+        los almacena de forma exacta (ver learning_rules.pseudo_inverse_weights).
+
+        En modo 'low_rank' la matriz no se construye: basta con guardar
+        los patrones, ya que W = PᵀP/p con diagonal en cero. En modo
+        'sparse' la matriz se calcula con la regla configurada y se poda;
+        con la regla de Hebb se construyen directamente los pesos
+        conservados, sin la matriz densa.
 
         Args:
-            patterns: Array de forma (n_patterns, n_neurons) con valores -1 o 1.
+            patterns: Array de forma (n_patterns, n_neurons) con valores -1 o
+                1, o PackedPatterns (por ejemplo, de un PatternDataset).
 
         Returns:
-            Matriz de pesos entrenada.
+            Matriz de pesos entrenada (None en modo 'low_rank', 'sparse' o
+            con conteos int16; get_weights la materializa).
 
         Raises:
             ValueError: Si los patrones no tienen la forma correcta.
         """
-        self._validate_training_patterns(patterns)
+        patterns, packed = self._unpack(patterns)
+        self._validate_training_patterns(patterns, check_values=not packed)
 
         n_patterns = patterns.shape[0]
         logger.info(f"Entrenando red con {n_patterns} patrones")
 
-        # Cálculo vectorizado de pesos usando regla de Hebb
-        self.weights = (1.0 / n_patterns) * np.dot(patterns.T, patterns)
+        self._storage = self._build_storage(patterns)
+        self._n_patterns_trained = n_patterns
+        self._patterns = patterns.astype(self.state_dtype, copy=not packed)
+        logger.info(
+            f"Entrenamiento completado. Norma de pesos: {self._storage.norm():.4f}"
+        )
 
-        # Sin auto-conexiones (diagonal en cero)
-        np.fill_diagonal(self.weights, 0)
+        return self.weights
 
-        # Verificar que la matriz es simétrica
-        if not np.allclose(self.weights, self.weights.T):
-            logger.warning("La matriz de pesos no es simétrica")
+    def add_patterns(self, patterns: np.ndarray) -> np.ndarray:
+        """
+        Agrega patrones a la memoria sin reentrenar desde cero.
+
+        Los pesos de Hebb son W = C/p con C = PᵀP, así que agregar k
+        patrones Q equivale a recuperar los conteos (p·W, redondeados a
+        entero), sumarles QᵀQ y dividir por p + k. El costo es O(kN²) en
+        lugar de O(pN²) y el resultado coincide con entrenar de nuevo con
+        todos los patrones. La regla de Storkey es incremental por
+        naturaleza: simplemente continúa la recurrencia con los nuevos
+        patrones; la de proyección aplica la actualización de Greville
+        (rango 1 por patrón). En modo 'sparse' se reentrena con todos los
+        patrones, ya que la poda depende de la matriz completa. Si la red no
+        está entrenada, equivale a train.
+
+        Args:
+            patterns: Array de forma (k, n_neurons) con valores -1 o 1.
+
+        Returns:
+            Matriz de pesos actualizada (None si no es densa en coma flotante).
+
+        Raises:
+            ValueError: Si los patrones no tienen la forma correcta.
+        """
+        if not self.is_trained():
+            return self.train(patterns)
+
+        n_total = self._n_patterns_trained + patterns.shape[0]
+        self._validate_training_patterns(patterns, n_total=n_total)
+
+        self._ensure_writable()
+        self._patterns = np.vstack([self._patterns, patterns.astype(self.state_dtype)])
+        if self.weight_mode == 'sparse':
+            self.train(self._patterns)
+        elif self.learning_rule == 'storkey':
+            storkey_weights(patterns, weights=self._storage.matrix)
+            self._n_patterns_trained = n_total
+        elif self.learning_rule == 'pseudo_inverse':
+            pseudo_inverse_update(
+                self._storage.matrix, self._projector_diagonal, patterns
+            )
+            self._n_patterns_trained = n_total
+        else:
+            self._update_hebbian(patterns, sign=1)
 
-        self._n_patterns_trained = n_patterns
         logger.info(
-            f"Entrenamiento completado. Norma de pesos: {np.linalg.norm(self.weights):.4f}"
+            f"Agregados {patterns.shape[0]} patrones "
+            f"(total: {self._n_patterns_trained})"
         )
+        return self.weights
+
+    def remove_patterns(self, patterns: np.ndarray) -> np.ndarray:
+        """
+        Elimina patrones almacenados sin reentrenar desde cero.
+
+        Es la operación inversa de add_patterns: a los conteos se les resta
+        QᵀQ y se normaliza por p − k. Cada fila elimina una aparición del
+        patrón correspondiente. Con las reglas de Storkey y de proyección
+        se reentrena con los patrones restantes (Storkey depende del orden
+        de los patrones; la proyección solo invierte una matriz p x p), al
+        igual que en modo 'sparse'.
+
+        Args:
+            patterns: Array de forma (k, n_neurons) con patrones almacenados.
+
+        Returns:
+            Matriz de pesos actualizada (None si no es densa en coma flotante).
+
+        Raises:
+            ValueError: Si la red no está entrenada, algún patrón no está
+                almacenado o se intentan eliminar todos los patrones.
+        """
+        if not self.is_trained():
+            raise ValueError("La red debe ser entrenada antes de eliminar patrones")
+
+        self._validate_training_patterns(patterns, n_total=0)
+
+        indices = self._find_stored_patterns(patterns)
+        if len(indices) >= self._n_patterns_trained:
+            raise ValueError(
+                "No se pueden eliminar todos los patrones; use reset()"
+            )
+
+        self._ensure_writable()
+        self._patterns = np.delete(self._patterns, indices, axis=0)
+        if self.learning_rule == 'hebbian' and self.weight_mode != 'sparse':
+            self._update_hebbian(patterns, sign=-1)
+        else:
+            self.train(self._patterns)
 
+        logger.info(
+            f"Eliminados {patterns.shape[0]} patrones "
+            f"(total: {self._n_patterns_trained})"
+        )
         return self.weights
 
     def predict(
         self,
         pattern: np.ndarray,
         max_iterations: Optional[int] = None,
-        return_history: bool = False
+        return_history: bool = False,
+        return_energy: bool = False,
+        return_info: bool = False,
+        scheduler: Optional[UpdateScheduler] = None
     ) -> np.ndarray:
         """
         Reconstruye un patrón corrupto usando actualización asíncrona.
 
+        El orden de visita de las neuronas lo decide el planificador
+        configurado (ver src.models.schedulers) o el recibido.
+        La convergencia se decide con el criterio configurado, evaluado
+        dentro de cada barrido sin copiar ni comparar estados completos.
+        La energía se sigue de forma incremental: la inicial es −½·s·h con
+        el campo local ya calculado (O(N)) y cada cambio de la neurona i
+        la modifica en ΔE = 2·s_i·h_i (O(1)), con h_i el campo previo al
+        cambio. La forma cuadrática completa solo se calcula con energy().
+
         Args:
             pattern: Patrón corrupto a reconstruir (valores -1 o 1).
             max_iterations: Número máximo de iteraciones (usa config si es None).
-            return_history: Si True, retorna (patrón, historial).
+            return_history: Si True, retorna también el historial de estados.
+            return_energy: Si True, retorna también la energía tras cada
+                barrido (el primer valor es la del patrón de entrada).
+            return_info: Si True, retorna también un diccionario con
+                'iterations', 'flips', 'evaluations' (neuronas evaluadas
+                por el planificador) y 'reason' (criterio que detuvo la
+                predicción, o 'max_iterations').
+            scheduler: Planificador para esta llamada (por defecto,
+                self.scheduler).
 
         Returns:
-            Patrón reconstruido, o tupla (patrón, historial) si return_history=True.
+            Patrón reconstruido, o tupla (patrón, [historial], [energías],
+            [info]) con los elementos solicitados.
 
         Raises:
             ValueError: Si la red no está entrenada o el patrón es inválido.
@@ -140,57 +424,92 @@ class HopfieldNetwork(NeuralNetworkInterface):
         logger.debug(f"Iniciando predicción (max_iter={max_iterations})")
 
         # Inicializar estado
-        state = pattern.copy()
+        state = pattern.astype(self.state_dtype)
         history = [state.copy()] if return_history else None
 
-        # Reset convergence checker
-        self.convergence_checker.reset()
+        # Campo local h = W·s, mantenido de forma incremental
+        fields = self._compute_fields(state)
+        energy = -0.5 * float(np.dot(state, fields))
+        energies = [energy] if return_energy else None
+
+        # Contexto de la llamada: copias del criterio y del planificador
+        shared_criterion = self._convergence_criterion()
+        criterion = shared_criterion.spawn()
+        criterion.start(self, state, energy)
+        on_flip = criterion.on_flip if criterion.tracks_flips else None
+
+        scheduler = (self.scheduler if scheduler is None else scheduler).spawn()
+        scheduler.start(self.n_neurons)
+        info = {'iterations': 0, 'flips': 0, 'evaluations': 0, 'reason': 'max_iterations'}
 
         # Iteraciones de actualización
         for iteration in range(max_iterations):
-            previous_state = state.copy()
-
             # Actualización asíncrona (neurona por neurona)
-            for i in range(self.n_neurons):
-                activation = np.dot(self.weights[i], state)
-                state[i] = self._activation_function(activation)
+            n_flips, energy_change, n_evaluated = scheduler.sweep(
+                self._storage, state, fields, on_flip
+            )
+            energy += energy_change
+            info['iterations'] = iteration + 1
+            info['flips'] += n_flips
+            info['evaluations'] += n_evaluated
 
             if return_history:
                 history.append(state.copy())
+            if return_energy:
+                energies.append(energy)
 
             # Verificar convergencia
-            if self.use_convergence:
-                if self.convergence_checker.check(state, previous_state):
-                    logger.debug(f"Convergencia alcanzada en iteración {iteration + 1}")
-                    break
+            if criterion.end_sweep(n_flips, energy):
+                info['reason'] = criterion.reason
+                logger.debug(
+                    f"Convergencia ({criterion.reason}) alcanzada en "
+                    f"iteración {iteration + 1}"
+                )
+                break
         else:
             logger.debug(f"Alcanzado máximo de iteraciones: {max_iterations}")
 
-        # Calcular similitud con patrones entrenados
-        energy = self._calculate_energy(state)
+        # El criterio configurado refleja la última predicción terminada
+        with self._lock:
+            shared_criterion.adopt(criterion)
+
         logger.info(f"Predicción completada. Energía: {energy:.4f}")
 
+        result = (state,)
         if return_history:
-            return state, history
-        return state
+            result += (history,)
+        if return_energy:
+            result += (energies,)
+        if return_info:
+            result += (info,)
+        return result if len(result) > 1 else state
 
     def predict_sync(
         self,
         pattern: np.ndarray,
-        max_iterations: Optional[int] = None
+        max_iterations: Optional[int] = None,
+        return_info: bool = False
     ) -> np.ndarray:
         """
         Reconstruye un patrón usando actualización síncrona.
 
         En la actualización síncrona, todas las neuronas se actualizan
-        simultáneamente en cada iteración.
+        simultáneamente en cada iteración. La dinámica síncrona con pesos
+        simétricos termina en un punto fijo o en un ciclo de período 2, así
+        que cada estado visitado se registra por su hash y, al repetirse,
+        la iteración se detiene. Para un ciclo se retorna el estado del
+        ciclo que se habría alcanzado en max_iterations, igual que si se
+        hubieran ejecutado todas las iteraciones.
 
         Args:
             pattern: Patrón corrupto a reconstruir.
             max_iterations: Número máximo de iteraciones.
+            return_info: Si True, retorna (patrón, info) donde info contiene
+                'status' ('fixed_point', 'converged', 'cycle' o
+                'max_iterations'), 'iterations' y 'period'.
 
         Returns:
-            Patrón reconstruido.
+            Patrón reconstruido, o tupla (patrón, info) si return_info=True.
         """
         if not self.is_trained():
             raise ValueError("La red debe ser entrenada antes de predecir")
@@ -200,35 +519,467 @@ class HopfieldNetwork(NeuralNetworkInterface):
         if max_iterations is None:
             max_iterations = config.network.MAX_ITERATIONS
 
-        state = pattern.copy()
-        self.convergence_checker.reset()
+        state = pattern.astype(self.state_dtype)
+        checker = self.convergence_checker.spawn()
+
+        # Estados visitados: hash -> índice en la trayectoria
+        trajectory = [state]
+        visited = {state.tobytes(): 0}
+        info = {'status': 'max_iterations', 'iterations': 0, 'period': None}
 
         for iteration in range(max_iterations):
-            previous_state = state.copy()
+            previous_state = state
 
             # Actualización síncrona (todas las neuronas a la vez)
-            activations = np.dot(self.weights, state)
-            state = np.vectorize(self._activation_function)(activations)
+            activations = self._storage.field(state)
+            state = np.where(activations > 0, 1, -1).astype(self.state_dtype)
+            n_changed = np.count_nonzero(state != previous_state)
+            info['iterations'] = iteration + 1
 
             # Verificar convergencia
-            if self.use_convergence:
-                if self.convergence_checker.check(state, previous_state):
-                    logger.debug(f"Convergencia alcanzada en iteración {iteration + 1}")
-                    break
+            if self.use_convergence and checker.check(state, previous_state):
+                info['status'] = 'fixed_point' if n_changed == 0 else 'converged'
+                logger.debug(f"Convergencia alcanzada en iteración {iteration + 1}")
+                break
+
+            if n_changed == 0:
+                info['status'] = 'fixed_point'
+                logger.debug(f"Punto fijo alcanzado en iteración {iteration + 1}")
+                break
+
+            key = state.tobytes()
+            if key in visited:
+                start = visited[key]
+                period = iteration + 1 - start
+                state = trajectory[start + (max_iterations - start) % period]
+                info['status'] = 'cycle'
+                info['period'] = period
+                logger.debug(
+                    f"Ciclo de período {period} detectado en iteración {iteration + 1}"
+                )
+                break
+
+            visited[key] = iteration + 1
+            trajectory.append(state)
+
+        with self._lock:
+            self.convergence_checker.adopt(checker)
+
+        if return_info:
+            return state, info
+        return state
+
+    def predict_stochastic(
+        self,
+        pattern: np.ndarray,
+        n_replicas: Optional[int] = None,
+        schedule: Optional[Schedule] = None,
+        n_sweeps: Optional[int] = None,
+        t_start: Optional[float] = None,
+        t_end: Optional[float] = None,
+        seed: Optional[int] = None,
+        return_info: bool = False
+    ) -> np.ndarray:
+        """
+        Reconstruye un patrón con dinámica de Glauber y recocido simulado.
+
+        Se ejecutan R réplicas independientes del patrón como un único array
+        (R, N). En cada barrido, a temperatura T, las neuronas se recorren
+        en una permutación aleatoria por bloques; cada neurona del bloque
+        toma el valor +1 con probabilidad 1 / (1 + exp(−2h/(T·σ))), y el
+        campo de todas las réplicas se actualiza con un solo producto
+        matricial por bloque. σ es la norma RMS de las filas de W (la
+        desviación típica del campo para un estado aleatorio), así que la
+        temperatura no depende de la escala de los pesos. Tras el recocido
+        cada réplica desciende a temperatura cero hasta un punto fijo y se
+        retorna la de menor energía.
+
+        Args:
+            pattern: Patrón corrupto a reconstruir (valores -1 o 1).
+            n_replicas: Número de réplicas R (usa config si es None).
+            schedule: Programa de temperaturas (ver
+                annealing.annealing_schedule); usa config si es None.
+            n_sweeps: Barridos del recocido (usa config si es None).
+            t_start: Temperatura inicial (usa config si es None).
+            t_end: Temperatura final (usa config si es None).
+            seed: Semilla del generador aleatorio.
+            return_info: Si True, retorna (patrón, info) donde info contiene
+                'replicas' (R, N), 'energies' por réplica, 'best' (índice
+                de la réplica elegida) y 'temperatures'.
+
+        Returns:
+            Patrón reconstruido, o tupla (patrón, info) si return_info=True.
+
+        Raises:
+            ValueError: Si la red no está entrenada, el patrón es inválido o
+                los parámetros del recocido no son válidos.
+        """
+        if not self.is_trained():
+            raise ValueError("La red debe ser entrenada antes de predecir")
+
+        self._validate_prediction_pattern(pattern)
+
+        settings = config.network
+        n_replicas = settings.GLAUBER_REPLICAS if n_replicas is None else n_replicas
+        if n_replicas <= 0:
+            raise ValueError("n_replicas debe ser positivo")
+        temperatures = annealing_schedule(
+            settings.ANNEALING_SCHEDULE if schedule is None else schedule,
+            settings.ANNEALING_SWEEPS if n_sweeps is None else n_sweeps,
+            settings.ANNEALING_T_START if t_start is None else t_start,
+            settings.ANNEALING_T_END if t_end is None else t_end
+        )
+
+        rng = np.random.default_rng(seed)
+        states = np.tile(pattern.astype(self.state_dtype), (n_replicas, 1))
+        fields = self._storage.fields(states)
+        field_scale = self._storage.norm() / np.sqrt(self.n_neurons)
+
+        for temperature in temperatures:
+            self._glauber_sweep(states, fields, temperature * field_scale, rng)
+
+        # Descenso a temperatura cero hasta un punto fijo por réplica
+        states = self.predict_batch(states, mode='async')
+        energies = -0.5 * np.einsum('ij,ij->i', states, self._storage.fields(states))
+        best = int(np.argmin(energies))
+
+        logger.info(
+            f"Predicción estocástica completada ({n_replicas} réplicas). "
+            f"Energía: {energies[best]:.4f}"
+        )
+
+        if return_info:
+            info = {
+                'replicas': states,
+                'energies': energies,
+                'best': best,
+                'temperatures': temperatures
+            }
+            return states[best].copy(), info
+        return states[best].copy()
+
+    def predict_ensemble(
+        self,
+        pattern: np.ndarray,
+        n_restarts: Optional[int] = None,
+        method: str = 'random',
+        vote: str = 'energy',
+        perturbation: float = 0.0,
+        n_workers: Optional[int] = None,
+        seed: Optional[int] = None,
+        return_info: bool = False
+    ) -> np.ndarray:
+        """
+        Reconstruye un patrón combinando varios reinicios aleatorios.
+
+        Cada reinicio usa un orden de actualización aleatorio ('random') o
+        dinámica de Glauber con recocido ('stochastic'), opcionalmente
+        sobre una copia de la entrada con una fracción de neuronas
+        invertidas. Los reinicios se reparten en un pool de procesos que
+        comparten los pesos en memoria compartida (ver ensemble.py), así
+        que el tiempo escala con el número de núcleos.
+
+        Args:
+            pattern: Patrón corrupto a reconstruir (valores -1 o 1).
+            n_restarts: Número de reinicios (usa config si es None).
+            method: 'random' o 'stochastic'.
+            vote: 'energy' retorna el resultado de menor energía;
+                'majority' el voto por neurona (los empates dan -1).
+            perturbation: Fracción de la entrada a invertir en cada reinicio.
+            n_workers: Procesos del pool (None para todos los núcleos; 1
+                ejecuta los reinicios en el proceso actual).
+            seed: Semilla base de los reinicios.
+            return_info: Si True, retorna (patrón, info) donde info contiene
+                'results', 'energies', 'agreement' (fracción de reinicios
+                iguales al resultado), 'neuron_agreement' (acuerdo medio
+                por neurona) y 'unique_results'.
+
+        Returns:
+            Patrón reconstruido, o tupla (patrón, info) si return_info=True.
 
+        Raises:
+            ValueError: Si la red no está entrenada o algún parámetro no es
+                válido.
+        """
+        if not self.is_trained():
+            raise ValueError("La red debe ser entrenada antes de predecir")
+
+        self._validate_prediction_pattern(pattern)
+
+        if n_restarts is None:
+            n_restarts = config.network.ENSEMBLE_RESTARTS
+        if n_restarts <= 0:
+            raise ValueError("n_restarts debe ser positivo")
+        if method not in ENSEMBLE_METHODS:
+            raise ValueError(
+                f"Método no soportado: {method}. "
+                f"Opciones: {', '.join(ENSEMBLE_METHODS)}"
+            )
+        if vote not in ENSEMBLE_VOTES:
+            raise ValueError(
+                f"Votación no soportada: {vote}. "
+                f"Opciones: {', '.join(ENSEMBLE_VOTES)}"
+            )
+        if not 0 <= perturbation < 1:
+            raise ValueError("perturbation debe estar entre 0 y 1")
+
+        results, energies = run_ensemble(
+            self, pattern.astype(self.state_dtype), n_restarts, method,
+            perturbation, n_workers, seed
+        )
+
+        if vote == 'energy':
+            state = results[int(np.argmin(energies))].copy()
+        else:
+            votes = results.sum(axis=0, dtype=np.int64)
+            state = np.where(votes > 0, 1, -1).astype(self.state_dtype)
+
+        matches = np.all(results == state, axis=1)
+        agreement = float(np.mean(matches))
+        logger.info(
+            f"Predicción por conjunto completada ({n_restarts} reinicios, "
+            f"voto '{vote}'). Acuerdo: {agreement:.1%}"
+        )
+
+        if return_info:
+            info = {
+                'results': results,
+                'energies': energies,
+                'agreement': agreement,
+                'neuron_agreement': float(np.mean(results == state)),
+                'unique_results': len(np.unique(results, axis=0))
+            }
+            return state, info
         return state
 
+    def predict_batch(
+        self,
+        patterns: Union[np.ndarray, PackedPatterns],
+        mode: str = 'async',
+        max_iterations: Optional[int] = None,
+        return_iterations: bool = False
+    ) -> np.ndarray:
+        """
+        Reconstruye varios patrones corruptos en una sola llamada.
+
+        Los campos locales de todo el lote se calculan con un único producto
+        matriz-matriz. Cada fila lleva su propia verificación de convergencia
+        y las filas que convergen salen del conjunto activo, de modo que los
+        barridos siguientes solo trabajan sobre las que aún cambian. En modo
+        síncrono también salen las filas que entran en un ciclo de período 2.
+        El resultado de cada fila coincide con el de predict (mode='async')
+        o predict_sync (mode='sync') sobre ese patrón. El criterio por fila
+        es siempre el umbral de convergence_checker (o el punto fijo sin
+        verificación); un criterio personalizado en convergence solo se
+        aplica en predict.
+
+        Args:
+            patterns: Array de forma (n_patrones, n_neurons) con valores -1 o
+                1, o PackedPatterns (por ejemplo, un lote de PatternDataset).
+            mode: 'async' (neurona a neurona) o 'sync' (todas a la vez).
+            max_iterations: Número máximo de iteraciones (usa config si es None).
+            return_iterations: Si True, retorna (patrones, iteraciones por fila).
+
+        Returns:
+            Array (n_patrones, n_neurons) con los patrones reconstruidos, o
+            tupla (patrones, iteraciones) si return_iterations=True.
+
+        Raises:
+            ValueError: Si la red no está entrenada, el modo no existe o los
+                patrones no son válidos.
+        """
+        if not self.is_trained():
+            raise ValueError("La red debe ser entrenada antes de predecir")
+
+        if mode not in ('async', 'sync'):
+            raise ValueError(f"Modo no soportado: {mode}. Use 'async' o 'sync'")
+
+        patterns, packed = self._unpack(patterns)
+        self._validate_prediction_batch(patterns, check_values=not packed)
+
+        if max_iterations is None:
+            max_iterations = config.network.MAX_ITERATIONS
+
+        logger.debug(
+            f"Iniciando predicción por lotes ({patterns.shape[0]} patrones, "
+            f"modo={mode}, max_iter={max_iterations})"
+        )
+
+        result = patterns.astype(self.state_dtype, copy=not packed)
+        iterations = np.zeros(patterns.shape[0], dtype=int)
+
+        active = np.arange(patterns.shape[0])
+        states = result.copy()
+        fields = self._storage.fields(states)
+
+        # Estados de uno y dos pasos atrás (detección de ciclos síncronos)
+        previous = None
+        before_previous = None
+
+        for iteration in range(max_iterations):
+            if mode == 'async':
+                n_flips = self._async_sweep_batch(states, fields)
+            else:
+                before_previous = previous
+                previous = states.copy()
+                n_flips = self._sync_step_batch(states, fields)
+            iterations[active] = iteration + 1
+
+            # Convergencia por fila (mismo criterio que ConvergenceChecker)
+            if self.use_convergence:
+                change = 2.0 * n_flips / self.n_neurons
+                converged = change < self.convergence_checker.threshold
+            else:
+                converged = n_flips == 0
+            result[active[converged]] = states[converged]
+
+            # Ciclo de período 2: el estado actual repite el de dos pasos atrás
+            if before_previous is not None:
+                cycled = ~converged & np.all(states == before_previous, axis=1)
+                if np.any(cycled):
+                    # Estado que tendría la fila al agotar max_iterations
+                    odd = (max_iterations - iteration - 1) % 2 == 1
+                    final = previous if odd else states
+                    result[active[cycled]] = final[cycled]
+                    converged = converged | cycled
+
+            if np.any(converged):
+                keep = ~converged
+                active = active[keep]
+                states = states[keep]
+                fields = fields[keep]
+                if previous is not None:
+                    previous = previous[keep]
+
+            if active.size == 0:
+                break
+        else:
+            result[active] = states
+            logger.debug(
+                f"{active.size} patrones alcanzaron el máximo de iteraciones"
+            )
+
+        logger.info(
+            f"Predicción por lotes completada: {patterns.shape[0]} patrones, "
+            f"{iterations.max(initial=0)} iteraciones máximas"
+        )
+
+        if return_iterations:
+            return result, iterations
+        return result
+
+    def energy(self, pattern: np.ndarray) -> float:
+        """
+        Calcula la energía de un estado con la forma cuadrática completa.
+
+        E = −½·sᵀWs cuesta O(N²) (O(nnz) u O(pN) según el almacenamiento);
+        para seguir la energía durante una predicción es preferible
+        predict(..., return_energy=True), que la actualiza en O(1) por cambio.
+
+        Args:
+            pattern: Estado de la red (valores -1 o 1).
+
+        Returns:
+            Valor de energía.
+
+        Raises:
+            ValueError: Si la red no está entrenada o el patrón es inválido.
+        """
+        if not self.is_trained():
+            raise ValueError("La red debe ser entrenada antes de calcular la energía")
+        self._validate_prediction_pattern(pattern)
+        return float(self._calculate_energy(pattern.astype(self.state_dtype)))
+
+    def fixed_points(self, patterns: np.ndarray) -> np.ndarray:
+        """
+        Indica qué estados son puntos fijos de la dinámica.
+
+        Un punto fijo no cambia con ninguna actualización (asíncrona ni
+        síncrona): predict lo retorna sin modificarlo. Los campos cercanos
+        a cero se resuelven con el producto exacto, como en predict.
+
+        Args:
+            patterns: Estados (n_patrones, n_neurons) con valores -1 o 1.
+
+        Returns:
+            Array booleano (n_patrones,).
+
+        Raises:
+            ValueError: Si la red no está entrenada o los estados no son
+                válidos.
+        """
+        if not self.is_trained():
+            raise ValueError("La red debe ser entrenada antes de predecir")
+        self._validate_prediction_batch(patterns)
+
+        states = patterns.astype(self.state_dtype)
+        fields = self._storage.fields(states)
+        candidates = fields * states <= self._FIELD_TIE_TOLERANCE
+
+        stable = ~candidates.any(axis=1)
+        for row in np.flatnonzero(~stable):
+            stable[row] = not any(
+                is_unstable(self._storage, states[row], fields[row, i], i)
+                for i in np.flatnonzero(candidates[row])
+            )
+        return stable
+
+    @property
+    def _storage(self) -> Optional[WeightStorage]:
+        """
+        Pesos de la red.
+
+        Una red cargada desde un checkpoint compacto solo tiene sus
+        patrones; los pesos se reconstruyen con la regla configurada la
+        primera vez que se necesitan.
+        """
+        if self._weight_storage is None and self._patterns is not None:
+            with self._lock:
+                # Otro hilo pudo reconstruirlos mientras se esperaba el bloqueo
+                if self._weight_storage is None:
+                    self._weight_storage = self._build_storage(self._patterns)
+                    logger.info(
+                        f"Pesos reconstruidos desde {len(self._patterns)} patrones "
+                        f"({self._weight_storage.nbytes} bytes)"
+                    )
+        return self._weight_storage
+
+    @_storage.setter
+    def _storage(self, storage: Optional[WeightStorage]) -> None:
+        self._weight_storage = storage
+
+    @property
+    def stored_patterns(self) -> Optional[np.ndarray]:
+        """Patrones almacenados (n_patrones, n_neurons), sin copiar."""
+        return self._patterns
+
+    @property
+    def weights(self) -> Optional[np.ndarray]:
+        """Matriz de pesos densa (None si no está entrenada o no es float)."""
+        if isinstance(self._storage, DenseWeights):
+            return self._storage.matrix
+        return None
+
     def is_trained(self) -> bool:
         """Verifica si la red ha sido entrenada."""
-        return self.weights is not None
+        return self._patterns is not None
 
     def get_weights(self) -> Optional[np.ndarray]:
-        """Obtiene la matriz de pesos actual."""
-        return self.weights.copy() if self.weights is not None else None
+        """
+        Obtiene la matriz de pesos actual.
+
+        En modo 'low_rank', 'sparse' o con conteos int16 la matriz se
+        materializa en esta llamada.
+        """
+        if self._storage is None:
+            return None
+        return self._storage.to_dense().copy()
 
     def reset(self) -> None:
         """Reinicia la red al estado inicial."""
-        self.weights = None
+        self._storage = None
+        self._patterns = None
+        self._projector_diagonal = None
         self._n_patterns_trained = 0
         self.convergence_checker.reset()
         logger.info("Red reiniciada")
@@ -237,11 +988,18 @@ class HopfieldNetwork(NeuralNetworkInterface):
         """
         Calcula la capacidad teórica de la red.
 
-        La capacidad de una red de Hopfield es aproximadamente 0.138 * n_neurons.
+        La capacidad de una red de Hopfield es aproximadamente 0.138 * n_neurons
+        con la regla de Hebb y n_neurons / sqrt(2 ln n_neurons) con la de Storkey.
+        La regla de proyección almacena de forma exacta hasta n_neurons
+        patrones linealmente independientes.
 
         Returns:
             Número aproximado de patrones que la red puede almacenar.
         """
+        if self.learning_rule == 'storkey':
+            return storkey_capacity(self.n_neurons)
+        if self.learning_rule == 'pseudo_inverse':
+            return float(self.n_neurons)
         return 0.138 * self.n_neurons
 
     def get_training_info(self) -> dict:
@@ -258,11 +1016,222 @@ class HopfieldNetwork(NeuralNetworkInterface):
             'n_patterns_trained': self._n_patterns_trained,
             'capacity': self.get_capacity(),
             'usage_ratio': self._n_patterns_trained / self.get_capacity() if self.is_trained() else 0,
-            'weights_norm': np.linalg.norm(self.weights) if self.weights is not None else 0
+            'learning_rule': self.learning_rule,
+            'weight_mode': self.weight_mode,
+            'weight_dtype': self.weight_dtype,
+            'pruning': self.pruning if self.weight_mode == 'sparse' else None,
+            'density': self.density if self.weight_mode == 'sparse' else None,
+            'weights_norm': self._storage.norm() if self._storage is not None else 0,
+            'weights_nbytes': self._storage.nbytes if self._storage is not None else 0
+        }
+
+    def fingerprint(
+        self,
+        patterns: Union[np.ndarray, PackedPatterns, None] = None
+    ) -> str:
+        """
+        Huella de los pesos que produce el entrenamiento.
+
+        Combina el SHA-256 de los patrones empaquetados a 1 bit con las
+        opciones de entrenamiento (tamaño, regla, modo y tipo de pesos,
+        poda), así que dos redes con la misma huella tienen los mismos
+        pesos. Es la clave de ModelCache y de PredictionCache.
+
+        Args:
+            patterns: Patrones con los que se entrenaría la red, como array
+                o PackedPatterns (por defecto, los almacenados).
+
+        Returns:
+            Huella hexadecimal.
+
+        Raises:
+            ValueError: Si no se pasan patrones y la red no está entrenada.
+        """
+        if patterns is not None:
+            return self._compute_fingerprint(patterns)
+        if not self.is_trained():
+            raise ValueError("La red debe ser entrenada para calcular su huella")
+
+        # Los patrones almacenados se reemplazan (nunca se modifican
+        # in-place) al entrenar, agregar o eliminar patrones
+        if self._fingerprint is None or self._fingerprint[0] is not self._patterns:
+            self._fingerprint = (
+                self._patterns, self._compute_fingerprint(self._patterns)
+            )
+        return self._fingerprint[1]
+
+    def save(self, path: Union[str, Path], compact: bool = False) -> None:
+        """
+        Guarda la red entrenada en el formato versionado de persistence.py.
+
+        El archivo contiene los arrays de pesos en crudo, los patrones
+        almacenados empaquetados a 1 bit y los metadatos necesarios para
+        reconstruir la red (pattern_size, regla, modo y tipo de pesos, poda
+        y huella de los patrones). El criterio de convergencia y el
+        planificador no se guardan.
+
+        Un checkpoint compacto (compact=True) omite los pesos: la red queda
+        determinada por los patrones y los parámetros de la regla, así que
+        26 letras de 2640 neuronas ocupan unos 9 KB en lugar de 55 MB. Al
+        cargarlo, los pesos se reconstruyen en el primer uso.
+
+        Args:
+            path: Ruta del archivo.
+            compact: Si True, guarda solo los patrones y los parámetros.
+
+        Raises:
+            ValueError: Si la red no está entrenada.
+        """
+        if not self.is_trained():
+            raise ValueError("La red debe ser entrenada antes de guardarla")
+
+        packed = PackedPatterns.from_patterns(self._patterns)
+        arrays = {'patterns': packed.bits}
+        description = None
+        if not compact:
+            description, storage_arrays = storage_state(self._storage)
+            arrays.update(
+                (f"storage.{name}", array) for name, array in storage_arrays.items()
+            )
+            if self._projector_diagonal is not None:
+                arrays['projector_diagonal'] = self._projector_diagonal
+
+        metadata = {
+            'pattern_size': list(self.pattern_size),
+            'use_convergence': self.use_convergence,
+            'weight_mode': self.weight_mode,
+            'weight_dtype': self.weight_dtype,
+            'learning_rule': self.learning_rule,
+            'pruning': self.pruning,
+            'density': self.density,
+            'pruning_seed': self.pruning_seed,
+            'n_patterns_trained': self._n_patterns_trained,
+            'pattern_hash': pattern_hash(packed.bits),
+            'storage': description
         }
+        write_model(path, metadata, arrays)
+        logger.info(
+            f"Red guardada en {path} "
+            f"({'checkpoint compacto' if compact else 'con pesos'})"
+        )
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, Path],
+        mmap_mode: Optional[str] = None,
+        **kwargs
+    ) -> 'HopfieldNetwork':
+        """
+        Carga una red guardada con save.
+
+        Con mmap_mode='r' los pesos se mapean desde el archivo sin leerlos:
+        la carga es inmediata y los procesos que abren el mismo archivo
+        comparten la matriz en la caché de páginas. Los pesos mapeados son
+        de solo lectura; add_patterns y remove_patterns trabajan sobre una
+        copia en memoria. Si el archivo es un checkpoint compacto, los
+        pesos se reconstruyen en el primer uso (en modo 'low_rank' nunca
+        se construye la matriz).
+
+        Args:
+            path: Ruta del archivo.
+            mmap_mode: None (lee los pesos a memoria), 'r' o 'c', como en
+                np.load.
+            **kwargs: Argumentos adicionales del constructor que no se
+                guardan (convergence, scheduler).
+
+        Returns:
+            Red entrenada.
+
+        Raises:
+            ValueError: Si mmap_mode no es None, 'r' ni 'c' ('r+' dejaría
+                que add_patterns modificara los pesos del archivo sin
+                actualizar sus metadatos), si el archivo no es válido, su
+                versión no es soportada o los patrones no coinciden con su
+                huella.
+        """
+        if mmap_mode not in (None, 'r', 'c'):
+            raise ValueError(
+                f"mmap_mode no soportado: {mmap_mode}. Opciones: None, 'r', 'c'"
+            )
+        metadata, arrays = read_model(path, mmap_mode=mmap_mode)
+
+        bits = np.asarray(arrays['patterns'])
+        if pattern_hash(bits) != metadata['pattern_hash']:
+            raise ValueError(f"Los patrones de {path} no coinciden con su huella")
+
+        network = cls(
+            tuple(metadata['pattern_size']),
+            use_convergence=metadata['use_convergence'],
+            weight_mode=metadata['weight_mode'],
+            weight_dtype=metadata['weight_dtype'],
+            learning_rule=metadata['learning_rule'],
+            pruning=metadata['pruning'],
+            density=metadata['density'],
+            **kwargs
+        )
+
+        prefix = 'storage.'
+        storage_arrays = {
+            name[len(prefix):]: array
+            for name, array in arrays.items() if name.startswith(prefix)
+        }
+        network.pruning_seed = metadata['pruning_seed']
+        if metadata['storage'] is not None:
+            network._storage = restore_storage(metadata['storage'], storage_arrays)
+        network._patterns = PackedPatterns(bits, network.n_neurons).to_patterns(
+            network.state_dtype
+        )
+        network._projector_diagonal = arrays.get('projector_diagonal')
+        network._n_patterns_trained = metadata['n_patterns_trained']
+
+        logger.info(
+            f"Red cargada desde {path}: {metadata['n_patterns_trained']} patrones "
+            f"(mmap_mode={mmap_mode})"
+        )
+        return network
 
     # Métodos privados
 
+    def _compute_fingerprint(self, patterns: Union[np.ndarray, PackedPatterns]) -> str:
+        """Huella de un conjunto de patrones con las opciones de la red."""
+        if not isinstance(patterns, PackedPatterns):
+            patterns = PackedPatterns.from_patterns(patterns)
+        description = {
+            'pattern_size': list(self.pattern_size),
+            'pattern_hash': pattern_hash(patterns.bits),
+            'weight_mode': self.weight_mode,
+            'weight_dtype': self.weight_dtype,
+            'learning_rule': self.learning_rule,
+            'pruning': self.pruning,
+            'density': self.density,
+            'pruning_seed': self.pruning_seed
+        }
+        encoded = json.dumps(description, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _ensure_writable(self) -> None:
+        """
+        Copia a memoria los pesos mapeados en solo lectura.
+
+        Las actualizaciones incrementales modifican los pesos in-place, lo
+        que no es posible sobre un archivo abierto con mmap_mode='r'.
+        """
+        arrays = [
+            value for value in vars(self._storage).values()
+            if isinstance(value, np.ndarray)
+        ]
+        if self._projector_diagonal is not None:
+            arrays.append(self._projector_diagonal)
+        if all(array.flags.writeable for array in arrays):
+            return
+
+        for name, value in vars(self._storage).items():
+            if isinstance(value, np.ndarray):
+                setattr(self._storage, name, np.array(value))
+        if self._projector_diagonal is not None:
+            self._projector_diagonal = np.array(self._projector_diagonal)
+
     def _activation_function(self, activation: float) -> float:
         """
         Función de activación sign.
@@ -275,6 +1244,433 @@ class HopfieldNetwork(NeuralNetworkInterface):
         """
         return 1.0 if activation > 0 else -1.0
 
+    def _convergence_criterion(self) -> ConvergenceCriterion:
+        """
+        Criterio de convergencia de la actualización asíncrona.
+
+        Returns:
+            El criterio configurado, el verificador por umbral o, sin
+            verificación de convergencia, la detección de punto fijo.
+        """
+        if self.convergence is not None:
+            return self.convergence
+        if self.use_convergence:
+            return self.convergence_checker
+        return ZeroFlips()
+
+    def _build_storage(self, patterns: np.ndarray) -> WeightStorage:
+        """
+        Calcula los pesos de los patrones con la regla configurada.
+
+        Args:
+            patterns: Patrones de entrenamiento validados.
+
+        Returns:
+            Almacenamiento de pesos (en modo 'low_rank', solo los patrones).
+        """
+        if self.learning_rule == 'storkey':
+            storage = DenseWeights(storkey_weights(patterns, dtype=self.weight_dtype))
+        elif self.learning_rule == 'pseudo_inverse':
+            weights, self._projector_diagonal = pseudo_inverse_weights(
+                patterns, dtype=self.weight_dtype
+            )
+            storage = DenseWeights(weights)
+        elif self.weight_mode == 'low_rank':
+            storage = self._low_rank_storage(patterns)
+        elif self.weight_mode == 'sparse':
+            # Hebb podado sin materializar la matriz N x N
+            return self._sparse_hebbian_storage(patterns)
+        else:
+            storage = self._hebbian_storage(patterns)
+
+        if self.weight_mode == 'sparse':
+            storage = self._sparse_storage(storage.matrix)
+        return storage
+
+    def _low_rank_storage(self, patterns: np.ndarray) -> LowRankWeights:
+        """
+        Construye los pesos implícitos de bajo rango.
+
+        Args:
+            patterns: Patrones de entrenamiento validados.
+
+        Returns:
+            Almacenamiento de bajo rango.
+        """
+        # int16 no aplica a los patrones; float32 es exacto para P·s
+        dtype = 'float64' if self.weight_dtype == 'float64' else 'float32'
+        return LowRankWeights(patterns, dtype=dtype)
+
+    def _sparse_storage(self, weights: np.ndarray) -> SparseWeights:
+        """
+        Poda los pesos entrenados según la estrategia configurada.
+
+        Args:
+            weights: Matriz de pesos densa con diagonal en cero.
+
+        Returns:
+            Almacenamiento disperso con las sinapsis conservadas.
+        """
+        if self.pruning != 'magnitude':
+            rows, columns = self._fixed_synapses()
+            return self._log_pruning(SparseWeights.from_entries(
+                self.n_neurons, rows, columns, weights[rows, columns]
+            ))
+
+        threshold = magnitude_threshold(weights, self.density)
+        blocks = []
+        for start, end in row_blocks(self.n_neurons, self.n_neurons):
+            block = weights[start:end]
+            magnitudes = np.abs(block)
+            rows, columns = np.nonzero((magnitudes >= threshold) & (magnitudes > 0))
+            blocks.append((rows + start, columns, block[rows, columns]))
+        rows, columns, data = (np.concatenate(parts) for parts in zip(*blocks))
+        return self._log_pruning(
+            SparseWeights.from_entries(self.n_neurons, rows, columns, data)
+        )
+
+    def _sparse_hebbian_storage(self, patterns: np.ndarray) -> SparseWeights:
+        """
+        Construye los pesos de Hebb podados sin la matriz densa.
+
+        Con 'random' y 'local' solo se calculan las sinapsis conservadas,
+        W_ij = Σ ξ_i·ξ_j / p, así que la memoria crece con nnz. Con
+        'magnitude' los conteos C = PᵀP se recorren dos veces por bloques
+        de filas: la primera arma el histograma de |C| (a lo sumo p + 1
+        valores) para el umbral y la segunda extrae los pesos conservados.
+
+        Args:
+            patterns: Patrones de entrenamiento validados.
+
+        Returns:
+            Almacenamiento disperso, igual al de podar la matriz densa.
+        """
+        n_patterns = patterns.shape[0]
+        float_patterns = patterns.astype(self.weight_dtype)
+        scale = float_patterns.dtype.type(1.0 / n_patterns)
+
+        if self.pruning != 'magnitude':
+            rows, columns = self._fixed_synapses()
+            data = np.empty(len(rows), dtype=float_patterns.dtype)
+            for start, end in row_blocks(len(rows), n_patterns):
+                counts = np.einsum(
+                    'ij,ij->j',
+                    float_patterns[:, rows[start:end]],
+                    float_patterns[:, columns[start:end]]
+                )
+                data[start:end] = counts * scale
+            return self._log_pruning(
+                SparseWeights.from_entries(self.n_neurons, rows, columns, data)
+            )
+
+        def count_blocks():
+            # Conteos exactos en coma flotante, con la diagonal en cero
+            for start, end in row_blocks(self.n_neurons, self.n_neurons):
+                counts = np.dot(float_patterns[:, start:end].T, float_patterns)
+                counts[np.arange(end - start), np.arange(start, end)] = 0
+                yield start, counts
+
+        histogram = np.zeros(n_patterns + 1, dtype=np.int64)
+        for _, counts in count_blocks():
+            magnitudes = np.abs(counts).astype(np.int64).reshape(-1)
+            histogram += np.bincount(magnitudes, minlength=n_patterns + 1)
+        threshold = count_threshold(histogram, self.n_neurons, self.density)
+
+        # El histograma da nnz: los arrays CSR se llenan sin copias intermedias
+        nnz = int(histogram[threshold:].sum())
+        indptr = np.zeros(self.n_neurons + 1, dtype=np.int64)
+        indices = np.empty(nnz, dtype=np.int32)
+        data = np.empty(nnz, dtype=float_patterns.dtype)
+        for start, counts in count_blocks():
+            keep = np.abs(counts) >= threshold
+            rows, columns = np.nonzero(keep)
+            begin = indptr[start]
+            end = begin + len(columns)
+            indices[begin:end] = columns
+            data[begin:end] = counts[rows, columns] * scale
+            indptr[start + 1:start + 1 + len(keep)] = begin + np.cumsum(
+                np.count_nonzero(keep, axis=1)
+            )
+        return self._log_pruning(SparseWeights(indptr, indices, data))
+
+    def _fixed_synapses(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Sinapsis de la poda 'random' o 'local' (no dependen de los pesos)."""
+        if self.pruning == 'random':
+            rng = np.random.default_rng(self.pruning_seed)
+            return random_synapses(self.n_neurons, self.density, rng)
+        return local_synapses(self.pattern_size, self.density)
+
+    def _log_pruning(self, storage: SparseWeights) -> SparseWeights:
+        """Registra cuántas sinapsis conservó la poda."""
+        kept = storage.nnz / max(self.n_neurons * (self.n_neurons - 1), 1)
+        logger.info(f"Pesos podados ({self.pruning}): {storage.nnz} sinapsis ({kept:.1%})")
+        return storage
+
+    def _update_hebbian(self, patterns: np.ndarray, sign: int) -> None:
+        """
+        Aplica una actualización de rango k a los pesos de Hebb.
+
+        Debe llamarse con self._patterns ya actualizado.
+
+        Args:
+            patterns: Patrones a agregar (sign=1) o eliminar (sign=-1).
+            sign: Signo de la actualización.
+        """
+        n_old = self._n_patterns_trained
+        n_new = n_old + sign * patterns.shape[0]
+
+        if isinstance(self._storage, LowRankWeights):
+            # Los pesos implícitos solo dependen de los patrones: O(pN)
+            self._storage = self._low_rank_storage(self._patterns)
+
+        elif isinstance(self._storage, CountWeights):
+            float_patterns = patterns.astype(np.float32)
+            delta = np.dot(float_patterns.T, float_patterns).astype(np.int16)
+            counts = self._storage.counts
+            counts += delta if sign > 0 else -delta
+            np.fill_diagonal(counts, 0)
+            self._storage.scale = 1.0 / n_new
+
+        else:
+            weights = self._storage.matrix
+            float_patterns = patterns.astype(weights.dtype)
+
+            # Recuperar los conteos exactos: p·W es entero salvo redondeo
+            weights *= n_old
+            np.rint(weights, out=weights)
+
+            delta = np.dot(float_patterns.T, float_patterns)
+            if sign > 0:
+                weights += delta
+            else:
+                weights -= delta
+            weights *= weights.dtype.type(1.0 / n_new)
+            np.fill_diagonal(weights, 0)
+
+        self._n_patterns_trained = n_new
+
+    def _find_stored_patterns(self, patterns: np.ndarray) -> np.ndarray:
+        """
+        Busca los índices de patrones almacenados.
+
+        Args:
+            patterns: Patrones a buscar (k, n_neurons).
+
+        Returns:
+            Índices (uno por fila, sin repetir) en los patrones almacenados.
+
+        Raises:
+            ValueError: Si algún patrón no está almacenado.
+        """
+        # Coincidencia exacta: producto escalar igual a N
+        overlaps = np.dot(
+            patterns.astype(np.float32), self._patterns.T.astype(np.float32)
+        )
+        matches = overlaps == self.n_neurons
+
+        indices = []
+        for row in range(patterns.shape[0]):
+            candidates = [j for j in np.flatnonzero(matches[row]) if j not in indices]
+            if not candidates:
+                raise ValueError(f"El patrón {row} no está almacenado en la red")
+            indices.append(candidates[0])
+
+        return np.array(indices, dtype=int)
+
+    def _hebbian_storage(self, patterns: np.ndarray) -> WeightStorage:
+        """
+        Construye los pesos densos de Hebb en el tipo configurado.
+
+        Los conteos PᵀP se calculan con BLAS en coma flotante (son enteros
+        exactos) y nunca en el tipo de los patrones, que en int8 desbordaría.
+
+        Args:
+            patterns: Patrones de entrenamiento validados.
+
+        Returns:
+            Almacenamiento denso de los pesos.
+        """
+        n_patterns = patterns.shape[0]
+
+        if self.weight_dtype == 'int16':
+            float_patterns = patterns.astype(np.float32)
+            counts = np.dot(float_patterns.T, float_patterns).astype(np.int16)
+            np.fill_diagonal(counts, 0)
+            return CountWeights(counts, 1.0 / n_patterns)
+
+        float_patterns = patterns.astype(self.weight_dtype)
+
+        # Cálculo vectorizado de pesos usando regla de Hebb
+        weights = np.dot(float_patterns.T, float_patterns)
+        weights *= weights.dtype.type(1.0 / n_patterns)
+
+        # Sin auto-conexiones (diagonal en cero)
+        np.fill_diagonal(weights, 0)
+
+        # Verificar que la matriz es simétrica
+        if not np.allclose(weights, weights.T):
+            logger.warning("La matriz de pesos no es simétrica")
+
+        return DenseWeights(weights)
+
+    def _compute_fields(self, state: np.ndarray) -> np.ndarray:
+        """
+        Calcula el campo local de todas las neuronas.
+
+        Args:
+            state: Estado actual de la red.
+
+        Returns:
+            Vector h = W·s (float64).
+        """
+        return self._storage.field(state)
+
+    def _glauber_sweep(
+        self,
+        states: np.ndarray,
+        fields: np.ndarray,
+        temperature: float,
+        rng: np.random.Generator
+    ) -> None:
+        """
+        Ejecuta un barrido de Glauber sobre todas las réplicas.
+
+        Las neuronas se recorren en una permutación aleatoria, en bloques
+        de GLAUBER_BLOCK_SIZE que se actualizan a la vez con el campo
+        vigente; el campo se corrige después con ΔS_B·W[B] (un producto
+        (R x k)(k x N)) usando solo las neuronas que cambiaron en alguna
+        réplica. A temperatura cero la regla es el signo determinista.
+
+        Args:
+            states: Estados de las réplicas (R, N), se modifican in-place.
+            fields: Campos locales (R, N), se modifican in-place.
+            temperature: Temperatura efectiva (en unidades del campo).
+            rng: Generador aleatorio.
+        """
+        order = rng.permutation(self.n_neurons)
+        block_size = config.network.GLAUBER_BLOCK_SIZE
+
+        for start in range(0, self.n_neurons, block_size):
+            block = order[start:start + block_size]
+            block_fields = fields[:, block]
+
+            if temperature > 0:
+                # P(s = +1) = 1 / (1 + exp(−2h/T)) = (1 + tanh(h/T)) / 2
+                p_up = 0.5 * (1.0 + np.tanh(block_fields / temperature))
+                new_values = np.where(rng.random(p_up.shape) < p_up, 1, -1)
+            else:
+                new_values = np.where(block_fields > 0, 1, -1)
+
+            delta = new_values - states[:, block]
+            changed = np.flatnonzero(np.any(delta != 0, axis=0))
+            if len(changed) == 0:
+                continue
+
+            states[:, block] = new_values
+            fields += np.dot(
+                delta[:, changed].astype(np.float64),
+                self._storage.rows(block[changed])
+            )
+
+    def _async_sweep_batch(self, states: np.ndarray, fields: np.ndarray) -> np.ndarray:
+        """
+        Ejecuta un barrido asíncrono sobre todas las filas de un lote.
+
+        Cada fila guarda el índice de su siguiente neurona inestable; se
+        procesa siempre el menor de ellos, actualizando a la vez todas las
+        filas que cambian en esa neurona con un producto externo. Las filas
+        que no cambian no vuelven a tocarse hasta el siguiente barrido.
+
+        Args:
+            states: Estados (n_filas, n_neurons), se modifican in-place.
+            fields: Campos locales (n_filas, n_neurons), se modifican in-place.
+
+        Returns:
+            Número de cambios por fila.
+        """
+        n_flips = np.zeros(states.shape[0], dtype=int)
+        next_index = self._next_unstable_batch(states, fields, 0)
+
+        while True:
+            i = int(next_index.min(initial=self.n_neurons))
+            if i >= self.n_neurons:
+                break
+
+            rows = np.flatnonzero(next_index == i)
+            new_values = -states[rows, i]
+            self._storage.add_scaled_row(fields, i, 2 * new_values, rows=rows)
+            states[rows, i] = new_values
+            n_flips[rows] += 1
+
+            next_index[rows] = self._next_unstable_batch(
+                states[rows], fields[rows], i + 1
+            )
+
+        return n_flips
+
+    def _next_unstable_batch(
+        self,
+        states: np.ndarray,
+        fields: np.ndarray,
+        start: int
+    ) -> np.ndarray:
+        """
+        Busca la primera neurona inestable de cada fila a partir de start.
+
+        Args:
+            states: Estados (n_filas, n_neurons).
+            fields: Campos locales (n_filas, n_neurons).
+            start: Índice desde el que buscar.
+
+        Returns:
+            Índice por fila, o n_neurons si la fila no tiene neuronas inestables.
+        """
+        if start >= self.n_neurons:
+            return np.full(states.shape[0], self.n_neurons)
+
+        candidates = (
+            fields[:, start:] * states[:, start:] <= self._FIELD_TIE_TOLERANCE
+        )
+        found = candidates.any(axis=1)
+        next_index = np.where(
+            found, start + np.argmax(candidates, axis=1), self.n_neurons
+        )
+
+        # Filas cuyo primer candidato es un empate: resolverlas una a una
+        for row in np.flatnonzero(found):
+            i = next_index[row]
+            if abs(fields[row, i]) <= self._FIELD_TIE_TOLERANCE:
+                resolved = next_unstable(self._storage, states[row], fields[row], i)
+                next_index[row] = self.n_neurons if resolved is None else resolved
+
+        return next_index
+
+    def _sync_step_batch(self, states: np.ndarray, fields: np.ndarray) -> np.ndarray:
+        """
+        Ejecuta un paso síncrono sobre todas las filas de un lote.
+
+        Las filas con algún campo cercano a cero se recalculan con el mismo
+        producto matriz-vector que predict_sync, para que el redondeo decida
+        igual que en la versión de un solo patrón.
+
+        Args:
+            states: Estados (n_filas, n_neurons), se modifican in-place.
+            fields: Campos locales W·s de cada fila, se modifican in-place.
+
+        Returns:
+            Número de cambios por fila.
+        """
+        ties = np.abs(fields) <= self._FIELD_TIE_TOLERANCE
+        for row in np.flatnonzero(ties.any(axis=1)):
+            fields[row] = self._storage.field(states[row])
+
+        new_states = np.where(fields > 0, 1, -1)
+        n_flips = np.count_nonzero(new_states != states, axis=1)
+        states[...] = new_states
+        fields[...] = self._storage.fields(states)
+
+        return n_flips
+
     def _calculate_energy(self, state: np.ndarray) -> float:
         """
         Calcula la energía del estado actual.
@@ -287,16 +1683,51 @@ class HopfieldNetwork(NeuralNetworkInterface):
         Returns:
             Valor de energía.
         """
-        if self.weights is None:
+        if self._storage is None:
             return float('inf')
-        return -0.5 * np.dot(state, np.dot(self.weights, state))
+        return -0.5 * np.dot(state, self._storage.field(state))
+
+    def _unpack(
+        self,
+        patterns: Union[np.ndarray, PackedPatterns]
+    ) -> Tuple[np.ndarray, bool]:
+        """
+        Desempaqueta PackedPatterns al tipo de estado de la red.
+
+        Args:
+            patterns: Array de patrones o PackedPatterns.
+
+        Returns:
+            Tupla (patrones, True si vienen de PackedPatterns: ya tienen
+            el tipo de estado y valores -1 o 1).
+
+        Raises:
+            ValueError: Si los patrones empaquetados no tienen n_neurons.
+        """
+        if not isinstance(patterns, PackedPatterns):
+            return patterns, False
+        if patterns.n_neurons != self.n_neurons:
+            raise ValueError(
+                f"Cada patrón debe tener {self.n_neurons} neuronas, "
+                f"recibido: {patterns.n_neurons}"
+            )
+        return patterns.to_patterns(self.state_dtype), True
 
-    def _validate_training_patterns(self, patterns: np.ndarray) -> None:
+    def _validate_training_patterns(
+        self,
+        patterns: np.ndarray,
+        n_total: Optional[int] = None,
+        check_values: bool = True
+    ) -> None:
         """
         Valida que los patrones de entrenamiento sean correctos.
 
         Args:
             patterns: Patrones a validar.
+            n_total: Patrones almacenados tras el cambio, para verificar la
+                capacidad (por defecto, los patrones recibidos).
+            check_values: Si False, no recorre los valores (patrones
+                desempaquetados, que son -1 o 1 por construcción).
 
         Raises:
             ValueError: Si los patrones no son válidos.
@@ -310,14 +1741,24 @@ class HopfieldNetwork(NeuralNetworkInterface):
                 f"recibido: {patterns.shape[1]}"
             )
 
-        if not np.all(np.isin(patterns, [-1, 1])):
+        if check_values and not np.all(np.isin(patterns, [-1, 1])):
             raise ValueError("Los patrones solo pueden contener valores -1 o 1")
 
+        if n_total is None:
+            n_total = patterns.shape[0]
+
+        # Los conteos int16 limitan el número de patrones almacenados
+        int16_max = np.iinfo(np.int16).max
+        if self.weight_mode == 'dense' and self.weight_dtype == 'int16' and n_total > int16_max:
+            raise ValueError(
+                f"int16 admite hasta {int16_max} patrones, recibidos: {n_total}"
+            )
+
         # Verificar capacidad
         capacity = self.get_capacity()
-        if patterns.shape[0] > capacity:
+        if n_total > capacity:
             logger.warning(
-                f"Número de patrones ({patterns.shape[0]}) excede la capacidad "
+                f"Número de patrones ({n_total}) excede la capacidad "
                 f"teórica ({capacity:.0f}). La red puede no funcionar correctamente."
             )
 
@@ -343,6 +1784,44 @@ class HopfieldNetwork(NeuralNetworkInterface):
         if not np.all(np.isin(pattern, [-1, 1])):
             raise ValueError("El patrón solo puede contener valores -1 o 1")
 
+    def _validate_prediction_batch(
+        self,
+        patterns: np.ndarray,
+        check_values: bool = True
+    ) -> None:
+        """
+        Valida que un lote de patrones de predicción sea correcto.
+
+        Args:
+            patterns: Lote a validar.
+            check_values: Si False, no recorre los valores (ver
+                _validate_training_patterns).
+
+        Raises:
+            ValueError: Si el lote no es válido.
+        """
+        if patterns.ndim != 2:
+            raise ValueError(f"El lote debe ser 2D, recibido: {patterns.ndim}D")
+
+        if patterns.shape[1] != self.n_neurons:
+            raise ValueError(
+                f"Cada patrón debe tener {self.n_neurons} elementos, "
+                f"recibido: {patterns.shape[1]}"
+            )
+
+        if check_values and not np.all(np.isin(patterns, [-1, 1])):
+            raise ValueError("Los patrones solo pueden contener valores -1 o 1")
+
+    def __getstate__(self) -> dict:
+        """Estado para copy/pickle (el bloqueo no se serializa)."""
+        state = vars(self).copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        vars(self).update(state)
+        self._lock = threading.RLock()
+
     def __repr__(self) -> str:
         """Representación string de la red."""
         status = "entrenada" if self.is_trained() else "no entrenada"
@@ -0,0 +1,146 @@
+"""
+Reglas de aprendizaje alternativas a la regla de Hebb.
+
+Cada regla recibe los patrones de entrenamiento (valores -1 o 1) y
+produce una matriz de pesos simétrica con diagonal en cero, calculada
+con operaciones matriciales vectorizadas.
+"""
+
+from typing import Optional, Tuple
+import numpy as np
+
+
+def storkey_weights(
+    patterns: np.ndarray,
+    weights: Optional[np.ndarray] = None,
+    dtype: str = 'float64'
+) -> np.ndarray:
+    """
+    Calcula (o continúa) los pesos con la regla de Storkey.
+
+    La regla de Storkey (1997) corrige el término de Hebb con el campo
+    local que ya generan los patrones anteriores:
+
+        ΔW_ij = (ξ_i ξ_j − ξ_i h_ji − h_ij ξ_j) / N,  h_ij = Σ_{k≠i,j} w_ik ξ_k
+
+    Con W simétrica y diagonal nula, h_ij = h_i − w_ij ξ_j, de modo que la
+    actualización completa es una operación de rango 2 sobre la matriz:
+
+        W ← (1 + 2/N)·W + (ξ(ξ − h)ᵀ − hξᵀ) / N,  h = W·ξ
+
+    La recurrencia es secuencial en los patrones (cada uno depende de los
+    pesos previos), pero cada paso es un producto matriz-vector y dos
+    productos externos, sin bucles por neurona.
+
+    Args:
+        patterns: Array (n_patterns, n_neurons) con valores -1 o 1.
+        weights: Pesos previos a continuar (se modifican in-place). Si es
+            None, se parte de una matriz nula.
+        dtype: Tipo de la matriz nueva ('float64' o 'float32').
+
+    Returns:
+        Matriz de pesos (n_neurons, n_neurons).
+    """
+    n_neurons = patterns.shape[1]
+    if weights is None:
+        weights = np.zeros((n_neurons, n_neurons), dtype=dtype)
+
+    decay = weights.dtype.type(1.0 + 2.0 / n_neurons)
+    scale = weights.dtype.type(1.0 / n_neurons)
+
+    for xi in patterns.astype(weights.dtype):
+        local_field = np.dot(weights, xi)
+
+        # Actualización de rango 2 como un solo producto (N x 2)·(2 x N)
+        left = np.stack([scale * xi, -scale * local_field], axis=1)
+        right = np.stack([xi - local_field, xi])
+
+        weights *= decay
+        weights += np.dot(left, right)
+        np.fill_diagonal(weights, 0)
+
+    return weights
+
+
+def storkey_capacity(n_neurons: int) -> float:
+    """
+    Capacidad aproximada de la regla de Storkey: N / sqrt(2 ln N).
+
+    Args:
+        n_neurons: Número de neuronas.
+
+    Returns:
+        Número aproximado de patrones almacenables.
+    """
+    if n_neurons < 2:
+        return float(n_neurons)
+    return n_neurons / np.sqrt(2.0 * np.log(n_neurons))
+
+
+def pseudo_inverse_weights(
+    patterns: np.ndarray,
+    dtype: str = 'float64'
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula los pesos con la regla de proyección (pseudo-inversa).
+
+    W es el proyector ortogonal sobre el espacio generado por los patrones,
+
+        Π = Pᵀ (P Pᵀ)⁺ P,
+
+    que solo requiere invertir la matriz de correlación p x p (no N x N).
+    Todo patrón almacenado cumple Π·ξ = ξ, así que se guardan de forma
+    exacta mientras sean linealmente independientes (hasta p ≈ N). La
+    diagonal se anula como en el resto de reglas; se devuelve aparte
+    porque las actualizaciones incrementales la necesitan.
+
+    Args:
+        patterns: Array (n_patterns, n_neurons) con valores -1 o 1.
+        dtype: Tipo de la matriz ('float64' o 'float32').
+
+    Returns:
+        Tupla (pesos con diagonal nula, diagonal del proyector).
+    """
+    float_patterns = patterns.astype(np.float64)
+    correlation = np.dot(float_patterns, float_patterns.T)
+    dual = np.dot(np.linalg.pinv(correlation, hermitian=True), float_patterns)
+
+    weights = np.dot(float_patterns.T, dual).astype(dtype, copy=False)
+    diagonal = np.einsum('ij,ij->j', float_patterns, dual)
+    np.fill_diagonal(weights, 0)
+
+    return weights, diagonal
+
+
+def pseudo_inverse_update(
+    weights: np.ndarray,
+    diagonal: np.ndarray,
+    patterns: np.ndarray
+) -> None:
+    """
+    Agrega patrones a la regla de proyección (actualización de Greville).
+
+    Para cada patrón ξ, su componente fuera del espacio ya almacenado es
+    r = ξ − Π·ξ, y el nuevo proyector es Π + r rᵀ / (rᵀ r): una
+    actualización de rango 1 en O(N²) por patrón. Si r es nulo, el patrón
+    ya está en el espacio generado y el proyector no cambia.
+
+    Args:
+        weights: Pesos con diagonal nula (se modifican in-place).
+        diagonal: Diagonal del proyector (se modifica in-place).
+        patterns: Patrones a agregar (k, n_neurons).
+    """
+    n_neurons = weights.shape[0]
+
+    for xi in patterns.astype(np.float64):
+        projected = np.dot(weights, xi) + diagonal * xi
+        residual = xi - projected
+        norm = np.dot(residual, residual)
+
+        # Dependiente de los patrones anteriores (relativo a |ξ|² = N)
+        if norm <= 1e-10 * n_neurons:
+            continue
+
+        weights += np.outer(residual / norm, residual)
+        diagonal += residual * residual / norm
+        np.fill_diagonal(weights, 0)
@@ -0,0 +1,312 @@
+"""
+Caché de redes entrenadas direccionada por contenido.
+
+Una red entrenada queda determinada por sus patrones y por las opciones
+de entrenamiento (tamaño, regla, modo y tipo de pesos, poda). La clave de
+la caché es la huella de la red (HopfieldNetwork.fingerprint): el SHA-256
+de los patrones empaquetados a 1 bit junto con esas opciones, así que
+seleccionar de nuevo las mismas imágenes (en cualquier sesión) reutiliza
+la red sin reentrenar.
+
+La caché tiene dos niveles:
+- Memoria: LRU con un número máximo de redes.
+- Disco (opcional): un archivo por clave en el formato de persistence.py,
+  escrito al entrenar y abierto con mmap_mode='r'. Por defecto se guarda
+  el checkpoint compacto (solo los patrones a 1 bit; los pesos se
+  reconstruyen en el primer uso), y el directorio conserva como máximo
+  max_disk_entries archivos: al superarlo se eliminan los usados hace
+  más tiempo (según su fecha de modificación, que se renueva al cargar).
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+import logging
+import os
+import threading
+
+import numpy as np
+
+from src.models.hopfield_network import HopfieldNetwork
+from src.config.settings import config
+
+logger = logging.getLogger(__name__)
+
+# Opciones del constructor que determinan los pesos entrenados
+TRAINING_OPTIONS = ('weight_mode', 'weight_dtype', 'learning_rule', 'pruning', 'density')
+
+MODEL_EXTENSION = '.hopfield'
+
+
+def model_key(
+    patterns: np.ndarray,
+    pattern_size: Tuple[int, int],
+    **options
+) -> str:
+    """
+    Calcula la clave de caché de una red entrenada.
+
+    Las opciones se resuelven con los valores por defecto de config, así
+    que omitir una opción y pasar su valor por defecto dan la misma clave.
+
+    Args:
+        patterns: Patrones de entrenamiento (n_patrones, n_neurons).
+        pattern_size: Tupla (ancho, alto).
+        **options: Opciones de entrenamiento (ver TRAINING_OPTIONS).
+
+    Returns:
+        Clave hexadecimal.
+
+    Raises:
+        ValueError: Si alguna opción no es de entrenamiento o no es válida.
+    """
+    return _untrained_network(pattern_size, options).fingerprint(patterns)
+
+
+def _untrained_network(pattern_size: Tuple[int, int], options: Dict) -> HopfieldNetwork:
+    """Crea la red sin entrenar (valida y resuelve las opciones)."""
+    unknown = set(options) - set(TRAINING_OPTIONS)
+    if unknown:
+        raise ValueError(
+            f"Opciones no soportadas por la caché: {', '.join(sorted(unknown))}. "
+            f"Opciones: {', '.join(TRAINING_OPTIONS)}"
+        )
+    return HopfieldNetwork(tuple(pattern_size), **options)
+
+
+class ModelCache:
+    """
+    Caché LRU de redes entrenadas con nivel opcional en disco.
+
+    Las redes retornadas se comparten entre llamadas con la misma clave y
+    no deben modificarse (add_patterns, remove_patterns, reset). Los
+    métodos son seguros entre hilos; el entrenamiento se hace fuera del
+    bloqueo.
+
+    Attributes:
+        max_entries: Número máximo de redes en memoria.
+        directory: Directorio del nivel en disco (None si no se usa).
+        max_disk_entries: Número máximo de archivos en disco.
+        compact: Si True, el nivel en disco guarda checkpoints compactos.
+        hits: Aciertos en memoria.
+        disk_hits: Aciertos en disco.
+        misses: Redes entrenadas por no estar en la caché.
+
+    Example:
+        >>> cache = ModelCache(directory='.cache/models')
+        >>> network = cache.get_or_train(patterns, (44, 60))
+        >>> reconstructed = network.predict(corrupted)
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        directory: Union[str, Path, None] = None,
+        max_disk_entries: Optional[int] = None,
+        compact: bool = True
+    ):
+        """
+        Inicializa la caché.
+
+        Args:
+            max_entries: Redes a conservar en memoria (usa config si es None).
+            directory: Directorio del nivel en disco; se crea si no existe.
+            max_disk_entries: Archivos a conservar en disco (usa config si
+                es None).
+            compact: Si True, guarda checkpoints compactos (ver
+                HopfieldNetwork.save); si False, guarda los pesos para
+                mapearlos sin reconstruirlos.
+
+        Raises:
+            ValueError: Si max_entries o max_disk_entries no son positivos.
+        """
+        if max_entries is None:
+            max_entries = config.network.MODEL_CACHE_ENTRIES
+        if max_disk_entries is None:
+            max_disk_entries = config.network.MODEL_CACHE_DISK_ENTRIES
+        if max_entries <= 0 or max_disk_entries <= 0:
+            raise ValueError("max_entries y max_disk_entries deben ser positivos")
+
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.compact = compact
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, HopfieldNetwork]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_train(
+        self,
+        patterns: np.ndarray,
+        pattern_size: Tuple[int, int],
+        **options
+    ) -> HopfieldNetwork:
+        """
+        Retorna la red entrenada con los patrones, entrenándola si no está.
+
+        Args:
+            patterns: Patrones de entrenamiento (n_patrones, n_neurons).
+            pattern_size: Tupla (ancho, alto).
+            **options: Opciones de entrenamiento (ver TRAINING_OPTIONS).
+
+        Returns:
+            Red entrenada (compartida; no debe modificarse).
+
+        Raises:
+            ValueError: Si las opciones o los patrones no son válidos.
+        """
+        network = _untrained_network(pattern_size, options)
+        key = network.fingerprint(patterns)
+
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            self.misses += 1
+        network.train(patterns)
+        self._store(key, network)
+        return network
+
+    def get(self, key: str) -> Optional[HopfieldNetwork]:
+        """
+        Busca una red por clave en memoria y luego en disco.
+
+        Args:
+            key: Clave calculada con model_key.
+
+        Returns:
+            Red entrenada o None si no está en la caché.
+        """
+        with self._lock:
+            network = self._entries.get(key)
+            if network is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return network
+
+        network = self._load_from_disk(key)
+        if network is None:
+            return None
+
+        with self._lock:
+            self.disk_hits += 1
+            self._insert(key, network)
+        return network
+
+    def prewarm(self, key: str) -> bool:
+        """
+        Carga una red del disco a memoria (por ejemplo, en segundo plano).
+
+        Args:
+            key: Clave de la red.
+
+        Returns:
+            True si la red quedó en memoria.
+        """
+        return self.get(key) is not None
+
+    def clear(self, disk: bool = False) -> None:
+        """
+        Vacía la caché en memoria y, opcionalmente, la de disco.
+
+        Args:
+            disk: Si True, elimina también los archivos del disco.
+        """
+        with self._lock:
+            self._entries.clear()
+        if disk and self.directory is not None:
+            for path in self.directory.glob(f"*{MODEL_EXTENSION}"):
+                path.unlink()
+
+    def stats(self) -> dict:
+        """
+        Estadísticas de uso de la caché.
+
+        Returns:
+            Diccionario con aciertos, fallos y redes en memoria.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries
+            }
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            if key in self._entries:
+                return True
+        return self.directory is not None and self._path(key).exists()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _path(self, key: str) -> Path:
+        """Ruta del archivo de una clave en el nivel en disco."""
+        return self.directory / f"{key}{MODEL_EXTENSION}"
+
+    def _insert(self, key: str, network: HopfieldNetwork) -> None:
+        """Inserta en memoria y descarta las menos usadas (con el bloqueo)."""
+        self._entries[key] = network
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            logger.debug(f"Red descartada de la caché: {evicted[:12]}")
+
+    def _store(self, key: str, network: HopfieldNetwork) -> None:
+        """Guarda una red recién entrenada en memoria y en disco."""
+        with self._lock:
+            self._insert(key, network)
+
+        if self.directory is not None:
+            try:
+                network.save(self._path(key), compact=self.compact)
+                self._evict_from_disk()
+            except OSError as e:
+                logger.warning(f"No se pudo guardar la red en la caché de disco: {e}")
+
+    def _evict_from_disk(self) -> None:
+        """Elimina los archivos usados hace más tiempo si se supera el máximo."""
+        entries = []
+        for path in self.directory.glob(f"*{MODEL_EXTENSION}"):
+            try:
+                entries.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                continue
+        entries.sort()
+        for _, path in entries[:max(0, len(entries) - self.max_disk_entries)]:
+            path.unlink(missing_ok=True)
+            logger.debug(f"Red descartada de la caché de disco: {path.stem[:12]}")
+
+    def _load_from_disk(self, key: str) -> Optional[HopfieldNetwork]:
+        """Carga una red del nivel en disco (None si no está o no es válida)."""
+        if self.directory is None:
+            return None
+
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            network = HopfieldNetwork.load(path, mmap_mode='r')
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Archivo de caché inválido, se descarta: {path} ({e})")
+            path.unlink(missing_ok=True)
+            return None
+
+        # Renueva la fecha para que la expulsión descarte las menos usadas
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        logger.info(f"Red cargada desde la caché de disco: {key[:12]}")
+        return network
@@ -9,6 +9,8 @@ from abc import ABC, abstractmethod
 from typing import Optional
 import numpy as np
 
+from src.models.convergence import ConvergenceCriterion
+
 
 class NeuralNetworkInterface(ABC):
     """
@@ -81,13 +83,18 @@ class NeuralNetworkInterface(ABC):
         pass
 
 
-class ConvergenceChecker:
+class ConvergenceChecker(ConvergenceCriterion):
     """
     Verificador de convergencia para redes neuronales recurrentes.
 
-    Determina cuándo un patrón ha convergido durante la reconstrucción.
+    Determina cuándo un patrón ha convergido durante la reconstrucción:
+    el cambio normalizado Σ|s − s'|/N debe quedar bajo el umbral. Como
+    criterio de la actualización asíncrona se calcula a partir del número
+    de cambios del barrido (cada cambio aporta 2/N), sin comparar estados.
     """
 
+    name = 'threshold'
+
     def __init__(self, threshold: float = 0.001):
         """
         Inicializa el verificador de convergencia.
@@ -97,8 +104,24 @@ class ConvergenceChecker:
         """
         if not 0 < threshold < 1:
             raise ValueError("El umbral debe estar entre 0 y 1")
+        super().__init__()
         self.threshold = threshold
         self.history = []
+        self._n_neurons = 0
+
+    def start(self, network, state: np.ndarray, energy: float) -> None:
+        super().start(network, state, energy)
+        self._n_neurons = len(state)
+        self.history.clear()
+
+    def end_sweep(self, n_flips: int, energy: float) -> bool:
+        normalized_change = 2.0 * n_flips / self._n_neurons
+        self.history.append(normalized_change)
+
+        if normalized_change < self.threshold:
+            self.reason = self.name
+            return True
+        return False
 
     def check(self, current_state: np.ndarray, previous_state: np.ndarray) -> bool:
         """
@@ -122,8 +145,17 @@ class ConvergenceChecker:
 
     def reset(self) -> None:
         """Reinicia el historial de convergencia."""
+        super().reset()
         self.history.clear()
 
     def get_history(self) -> list:
         """Retorna el historial de cambios."""
         return self.history.copy()
+
+    def spawn(self) -> 'ConvergenceChecker':
+        clone = super().spawn()
+        clone.history = []
+        return clone
+
+    def __repr__(self) -> str:
+        return f"ConvergenceChecker(threshold={self.threshold})"
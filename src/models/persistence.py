@@ -0,0 +1,252 @@
+"""
+Formato en disco de los modelos entrenados.
+
+Un archivo de modelo contiene una cabecera binaria, metadatos en JSON y
+los arrays en crudo, cada uno alineado a ALIGNMENT bytes:
+
+    MAGIC (8 bytes) | versión (uint32) | largo del JSON (uint32) | JSON |
+    relleno | array 0 | relleno | array 1 | ...
+
+El JSON describe cada array (tipo, forma y desplazamiento desde el
+inicio de la zona de datos), de modo que los pesos pueden abrirse con
+np.memmap sin copiarlos: varios procesos que cargan el mismo archivo
+comparten las páginas de la caché del sistema operativo y la carga no
+depende del tamaño de la matriz.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+import hashlib
+import json
+import os
+import struct
+
+import numpy as np
+
+from src.models.weight_storage import (
+    WeightStorage,
+    DenseWeights,
+    CountWeights,
+    LowRankWeights,
+    SparseWeights,
+)
+
+MAGIC = b'HOPFNET\x00'
+FORMAT_VERSION = 1
+
+# Alineación de la cabecera y de cada array, en bytes
+ALIGNMENT = 64
+
+_PREAMBLE = struct.Struct('<8sII')
+
+# Clases de almacenamiento que pueden reconstruirse desde un archivo
+STORAGE_CLASSES = {
+    cls.__name__: cls
+    for cls in (DenseWeights, CountWeights, LowRankWeights, SparseWeights)
+}
+
+PathLike = Union[str, Path]
+
+
+def _aligned(offset: int) -> int:
+    """Redondea un desplazamiento al siguiente múltiplo de ALIGNMENT."""
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def pattern_hash(bits: np.ndarray) -> str:
+    """
+    Huella de un conjunto de patrones empaquetados.
+
+    Args:
+        bits: Array uint8 (n_patrones, n_bytes) de PackedPatterns.
+
+    Returns:
+        SHA-256 en hexadecimal de la forma y los bits.
+    """
+    digest = hashlib.sha256()
+    digest.update(str(bits.shape).encode())
+    digest.update(np.ascontiguousarray(bits).tobytes())
+    return digest.hexdigest()
+
+
+def storage_state(storage: WeightStorage) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """
+    Separa un almacenamiento de pesos en metadatos y arrays.
+
+    Args:
+        storage: Almacenamiento de pesos.
+
+    Returns:
+        Tupla (descripción serializable en JSON, arrays por nombre).
+
+    Raises:
+        ValueError: Si la clase de almacenamiento no es serializable.
+    """
+    class_name = type(storage).__name__
+    if class_name not in STORAGE_CLASSES:
+        raise ValueError(f"Almacenamiento no serializable: {class_name}")
+
+    values = {}
+    arrays = {}
+    for name, value in vars(storage).items():
+        if isinstance(value, np.ndarray):
+            arrays[name] = value
+        elif isinstance(value, np.generic):
+            values[name] = value.item()
+        else:
+            values[name] = value
+
+    return {'class': class_name, 'values': values}, arrays
+
+
+def restore_storage(description: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> WeightStorage:
+    """
+    Reconstruye un almacenamiento a partir de storage_state.
+
+    Los arrays se asignan tal cual (sin copiar), así que pueden ser
+    vistas de un np.memmap.
+
+    Args:
+        description: Descripción creada por storage_state.
+        arrays: Arrays por nombre.
+
+    Returns:
+        Almacenamiento de pesos.
+
+    Raises:
+        ValueError: Si la clase de almacenamiento no es conocida.
+    """
+    class_name = description['class']
+    if class_name not in STORAGE_CLASSES:
+        raise ValueError(f"Almacenamiento desconocido: {class_name}")
+
+    storage = object.__new__(STORAGE_CLASSES[class_name])
+    for name, value in description['values'].items():
+        setattr(storage, name, value)
+    for name, value in arrays.items():
+        setattr(storage, name, value)
+    return storage
+
+
+def write_model(path: PathLike, metadata: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> None:
+    """
+    Escribe un archivo de modelo.
+
+    El archivo se escribe en una ruta temporal y se renombra al terminar,
+    así que un lector nunca ve un archivo a medio escribir.
+
+    Args:
+        path: Ruta del archivo.
+        metadata: Metadatos serializables en JSON.
+        arrays: Arrays a guardar, por nombre.
+    """
+    path = Path(path)
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        layout[name] = {
+            'dtype': array.dtype.str,
+            'shape': list(array.shape),
+            'offset': offset
+        }
+        offset = _aligned(offset + array.nbytes)
+
+    header = dict(metadata, format_version=FORMAT_VERSION, arrays=layout)
+    header_bytes = json.dumps(header).encode('utf-8')
+    data_start = _aligned(_PREAMBLE.size + len(header_bytes))
+
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temporary, 'wb') as handle:
+            handle.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_bytes)))
+            handle.write(header_bytes)
+            for name, array in arrays.items():
+                handle.seek(data_start + layout[name]['offset'])
+                handle.write(np.ascontiguousarray(array).tobytes())
+            handle.truncate(data_start + offset)
+        os.replace(temporary, path)
+    finally:
+        if temporary.exists():
+            temporary.unlink()
+
+
+def _read_header(handle) -> Tuple[Dict[str, Any], int]:
+    """Lee y valida la cabecera; retorna (metadatos, inicio de los datos)."""
+    preamble = handle.read(_PREAMBLE.size)
+    if len(preamble) != _PREAMBLE.size:
+        raise ValueError("El archivo no es un modelo de Hopfield")
+    magic, version, header_length = _PREAMBLE.unpack(preamble)
+    if magic != MAGIC:
+        raise ValueError("El archivo no es un modelo de Hopfield")
+    if version != FORMAT_VERSION:
+        raise ValueError(
+            f"Versión de formato no soportada: {version} "
+            f"(se esperaba {FORMAT_VERSION})"
+        )
+
+    header = json.loads(handle.read(header_length).decode('utf-8'))
+    return header, _aligned(_PREAMBLE.size + header_length)
+
+
+def read_metadata(path: PathLike) -> Dict[str, Any]:
+    """
+    Lee solo los metadatos de un archivo de modelo.
+
+    Args:
+        path: Ruta del archivo.
+
+    Returns:
+        Metadatos (incluye 'format_version' y la tabla 'arrays').
+
+    Raises:
+        ValueError: Si el archivo no es un modelo o su versión no es
+            soportada.
+    """
+    with open(path, 'rb') as handle:
+        header, _ = _read_header(handle)
+    return header
+
+
+def read_model(
+    path: PathLike,
+    mmap_mode: Optional[str] = None
+) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """
+    Lee un archivo de modelo.
+
+    Args:
+        path: Ruta del archivo.
+        mmap_mode: None lee los arrays a memoria; 'r' (solo lectura), 'c'
+            (copia al escribir) o 'r+' los mapea con np.memmap, como en
+            np.load.
+
+    Returns:
+        Tupla (metadatos, arrays por nombre).
+
+    Raises:
+        ValueError: Si el archivo no es un modelo, su versión no es
+            soportada o mmap_mode no es válido.
+    """
+    if mmap_mode not in (None, 'r', 'c', 'r+'):
+        raise ValueError(f"mmap_mode no soportado: {mmap_mode}")
+
+    arrays = {}
+    with open(path, 'rb') as handle:
+        header, data_start = _read_header(handle)
+        for name, entry in header['arrays'].items():
+            dtype = np.dtype(entry['dtype'])
+            shape = tuple(entry['shape'])
+            offset = data_start + entry['offset']
+            count = int(np.prod(shape))
+
+            if count == 0:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            elif mmap_mode is None:
+                handle.seek(offset)
+                arrays[name] = np.fromfile(handle, dtype=dtype, count=count).reshape(shape)
+            else:
+                arrays[name] = np.memmap(
+                    path, dtype=dtype, mode=mmap_mode, offset=offset, shape=shape
+                )
+
+    return header, arrays
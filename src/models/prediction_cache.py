@@ -0,0 +1,306 @@
+"""
+Caché de resultados de predicción.
+
+La reconstrucción es determinista: la misma red, la misma entrada y las
+mismas opciones del motor producen siempre el mismo resultado (salvo con
+un planificador aleatorio sin semilla, cuyas predicciones no se cachean). La clave
+de un resultado combina la huella de la red (HopfieldNetwork.fingerprint),
+el SHA-256 de la entrada empaquetada a 1 bit y las opciones del motor
+(modo, iteraciones, planificador y criterio de convergencia).
+
+Los resultados se guardan empaquetados a 1 bit en un LRU en memoria y,
+opcionalmente, en una base SQLite local que se comparte entre procesos y
+sesiones. Si la entrada es exactamente un patrón almacenado que es punto
+fijo de la red, el resultado es la propia entrada y se retorna sin
+ejecutar la dinámica.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import FrozenSet, Optional, Union
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+
+import numpy as np
+
+from src.models.hopfield_network import HopfieldNetwork
+from src.models.persistence import pattern_hash
+from src.utils.packed_patterns import PackedPatterns
+from src.config.settings import config
+
+logger = logging.getLogger(__name__)
+
+PREDICTION_MODES = ('async', 'sync')
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS predictions ("
+    "key TEXT PRIMARY KEY, n_neurons INTEGER NOT NULL, bits BLOB NOT NULL)"
+)
+
+
+class PredictionCache:
+    """
+    Memoización de predicciones con LRU y nivel opcional en SQLite.
+
+    Los métodos son seguros entre hilos; la dinámica de una predicción no
+    cacheada se ejecuta fuera del bloqueo.
+
+    Attributes:
+        max_entries: Número máximo de resultados en memoria.
+        path: Ruta de la base SQLite (None si no se usa).
+        hits: Aciertos en memoria.
+        database_hits: Aciertos en SQLite.
+        stored_hits: Entradas que eran un patrón almacenado estable.
+        misses: Predicciones ejecutadas.
+
+    Example:
+        >>> cache = PredictionCache(path='.cache/predictions.sqlite')
+        >>> reconstructed = cache.predict(network, corrupted)
+        >>> cache.stats()['hits']
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        path: Union[str, Path, None] = None
+    ):
+        """
+        Inicializa la caché.
+
+        Args:
+            max_entries: Resultados a conservar en memoria (usa config si
+                es None).
+            path: Base SQLite para persistir los resultados; se crea si no
+                existe.
+
+        Raises:
+            ValueError: Si max_entries no es positivo.
+        """
+        if max_entries is None:
+            max_entries = config.network.PREDICTION_CACHE_ENTRIES
+        if max_entries <= 0:
+            raise ValueError("max_entries debe ser positivo")
+
+        self.max_entries = max_entries
+        self.path = Path(path) if path is not None else None
+        self.hits = 0
+        self.database_hits = 0
+        self.stored_hits = 0
+        self.misses = 0
+
+        self._entries: 'OrderedDict[str, np.ndarray]' = OrderedDict()
+        self._stable: 'OrderedDict[str, FrozenSet[str]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._connection.execute(_SCHEMA)
+            self._connection.commit()
+
+    def predict(
+        self,
+        network: HopfieldNetwork,
+        pattern: np.ndarray,
+        mode: str = 'async',
+        max_iterations: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Reconstruye un patrón, reutilizando el resultado si ya se calculó.
+
+        Args:
+            network: Red entrenada.
+            pattern: Patrón corrupto (valores -1 o 1).
+            mode: 'async' (predict) o 'sync' (predict_sync).
+            max_iterations: Iteraciones máximas (usa config si es None).
+
+        Returns:
+            Patrón reconstruido (una copia nueva en cada llamada).
+
+        Raises:
+            ValueError: Si la red no está entrenada, el modo no es válido o
+                el patrón no tiene N valores -1 o 1.
+        """
+        if mode not in PREDICTION_MODES:
+            raise ValueError(
+                f"Modo no soportado: {mode}. Opciones: {', '.join(PREDICTION_MODES)}"
+            )
+        if not network.is_trained():
+            raise ValueError("La red debe ser entrenada antes de predecir")
+        if np.shape(pattern) != (network.n_neurons,) or not np.all(np.isin(pattern, (-1, 1))):
+            raise ValueError(
+                f"El patrón debe tener {network.n_neurons} valores -1 o 1"
+            )
+        if max_iterations is None:
+            max_iterations = config.network.MAX_ITERATIONS
+
+        fingerprint = network.fingerprint()
+        input_hash = pattern_hash(PackedPatterns.from_patterns(pattern).bits)
+
+        if input_hash in self._stable_patterns(network, fingerprint):
+            with self._lock:
+                self.stored_hits += 1
+            return pattern.astype(network.state_dtype)
+
+        key = self._key(network, fingerprint, input_hash, mode, max_iterations)
+        bits = self._lookup(key) if key is not None else None
+        if bits is not None:
+            return PackedPatterns(bits, network.n_neurons).to_patterns(network.state_dtype)[0]
+
+        with self._lock:
+            self.misses += 1
+        if mode == 'sync':
+            result = network.predict_sync(pattern, max_iterations=max_iterations)
+        else:
+            result = network.predict(pattern, max_iterations=max_iterations)
+
+        if key is not None:
+            self._store(key, PackedPatterns.from_patterns(result).bits, network.n_neurons)
+        return result
+
+    def clear(self, database: bool = False) -> None:
+        """
+        Vacía la caché en memoria y, opcionalmente, la base SQLite.
+
+        Args:
+            database: Si True, elimina también los resultados persistidos.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._stable.clear()
+            if database and self._connection is not None:
+                self._connection.execute("DELETE FROM predictions")
+                self._connection.commit()
+
+    def close(self) -> None:
+        """Cierra la conexión con la base SQLite."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def stats(self) -> dict:
+        """
+        Estadísticas de uso de la caché.
+
+        Returns:
+            Diccionario con aciertos por nivel, fallos, tasa de aciertos y
+            resultados en memoria.
+        """
+        with self._lock:
+            served = self.hits + self.database_hits + self.stored_hits
+            total = served + self.misses
+            return {
+                'hits': self.hits,
+                'database_hits': self.database_hits,
+                'stored_hits': self.stored_hits,
+                'misses': self.misses,
+                'hit_rate': served / total if total else 0.0,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _key(
+        self,
+        network: HopfieldNetwork,
+        fingerprint: str,
+        input_hash: str,
+        mode: str,
+        max_iterations: int
+    ) -> Optional[str]:
+        """
+        Clave de un resultado: red, entrada y opciones del motor.
+
+        Retorna None si el resultado no es reproducible (planificador
+        aleatorio sin semilla) y por tanto no se debe cachear.
+        """
+        if mode == 'async' and getattr(network.scheduler, 'seed', 0) is None:
+            return None
+        description = {
+            'model': fingerprint,
+            'input': input_hash,
+            'mode': mode,
+            'max_iterations': max_iterations,
+            # Ambos modos se detienen antes según el umbral de convergencia
+            'use_convergence': network.use_convergence,
+            'threshold': network.convergence_checker.threshold
+        }
+        if mode == 'async':
+            # El resultado asíncrono depende además del orden y del criterio
+            description.update(
+                scheduler=repr(network.scheduler),
+                convergence=repr(network.convergence)
+            )
+        encoded = json.dumps(description, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _stable_patterns(self, network: HopfieldNetwork, fingerprint: str) -> FrozenSet[str]:
+        """Huellas de los patrones almacenados que son puntos fijos."""
+        with self._lock:
+            stable = self._stable.get(fingerprint)
+            if stable is not None:
+                self._stable.move_to_end(fingerprint)
+                return stable
+
+        patterns = network.stored_patterns
+        bits = PackedPatterns.from_patterns(patterns).bits
+        fixed = network.fixed_points(patterns)
+        stable = frozenset(
+            pattern_hash(bits[i:i + 1]) for i in np.flatnonzero(fixed)
+        )
+
+        with self._lock:
+            self._stable[fingerprint] = stable
+            while len(self._stable) > config.network.MODEL_CACHE_ENTRIES:
+                self._stable.popitem(last=False)
+        return stable
+
+    def _lookup(self, key: str) -> Optional[np.ndarray]:
+        """Busca un resultado empaquetado en memoria y luego en SQLite."""
+        with self._lock:
+            bits = self._entries.get(key)
+            if bits is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return bits
+
+            if self._connection is None:
+                return None
+            row = self._connection.execute(
+                "SELECT bits FROM predictions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            bits = np.frombuffer(row[0], dtype=np.uint8).reshape(1, -1)
+            self.database_hits += 1
+            self._insert(key, bits)
+            return bits
+
+    def _insert(self, key: str, bits: np.ndarray) -> None:
+        """Inserta en memoria y descarta los menos usados (con el bloqueo)."""
+        self._entries[key] = bits
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _store(self, key: str, bits: np.ndarray, n_neurons: int) -> None:
+        """Guarda un resultado nuevo en memoria y en SQLite."""
+        with self._lock:
+            self._insert(key, bits)
+            if self._connection is not None:
+                try:
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO predictions VALUES (?, ?, ?)",
+                        (key, n_neurons, bits.tobytes())
+                    )
+                    self._connection.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"No se pudo guardar la predicción en SQLite: {e}")
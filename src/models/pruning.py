@@ -0,0 +1,177 @@
+"""
+Estrategias de poda de sinapsis para pesos dispersos.
+
+Cada estrategia elige qué pesos conservar sin materializar máscaras N x N:
+'random' y 'local' devuelven directamente las sinapsis (filas y columnas,
+en orden CSR) y 'magnitude' calcula el umbral de magnitud, que luego se
+aplica por bloques de filas. Las sinapsis elegidas son simétricas y sin
+diagonal, así que los pesos podados siguen definiendo una red de Hopfield
+con función de energía.
+"""
+
+from typing import Iterator, Optional, Tuple
+import numpy as np
+
+
+PRUNING_METHODS = ('magnitude', 'random', 'local')
+
+# Elementos por bloque de filas (256K de float64 son 2 MB)
+BLOCK_ELEMENTS = 1 << 18
+
+
+def fan_in(n_neurons: int, density: float) -> int:
+    """
+    Número de sinapsis por neurona para una densidad dada.
+
+    Args:
+        n_neurons: Número de neuronas.
+        density: Fracción de sinapsis a conservar (0, 1].
+
+    Returns:
+        Sinapsis por neurona (al menos 1).
+    """
+    return max(1, int(round(density * (n_neurons - 1))))
+
+
+def row_blocks(n_rows: int, n_columns: int) -> Iterator[Tuple[int, int]]:
+    """
+    Divide las filas en bloques de unos BLOCK_ELEMENTS elementos.
+
+    Args:
+        n_rows: Número de filas.
+        n_columns: Elementos por fila.
+
+    Yields:
+        Tuplas (inicio, fin) de cada bloque.
+    """
+    size = max(1, BLOCK_ELEMENTS // max(n_columns, 1))
+    for start in range(0, n_rows, size):
+        yield start, min(start + size, n_rows)
+
+
+def magnitude_threshold(weights: np.ndarray, density: float):
+    """
+    Umbral de poda por magnitud de una matriz densa.
+
+    El umbral es la magnitud del peso en la posición density·N(N−1) del
+    orden descendente; se conservan los pesos no nulos con magnitud mayor
+    o igual (los empates se conservan todos para no romper la simetría).
+
+    Args:
+        weights: Matriz de pesos (N, N) con diagonal en cero.
+        density: Fracción de sinapsis a conservar.
+
+    Returns:
+        Umbral, en el tipo de los pesos.
+    """
+    n_neurons = weights.shape[0]
+    n_keep = fan_in(n_neurons, density) * n_neurons
+
+    magnitudes = np.abs(weights)
+    # La diagonal nunca queda entre los n_keep mayores
+    np.fill_diagonal(magnitudes, -1)
+    magnitudes = magnitudes.reshape(-1)
+    return np.partition(magnitudes, -n_keep)[-n_keep]
+
+
+def count_threshold(histogram: np.ndarray, n_neurons: int, density: float) -> int:
+    """
+    Umbral de poda por magnitud a partir del histograma de conteos de Hebb.
+
+    Con la regla de Hebb W = C/p y los conteos C toman a lo sumo p + 1
+    magnitudes distintas, así que el umbral de magnitude_threshold sale
+    de su histograma sin guardar la matriz.
+
+    Args:
+        histogram: histogram[c] es el número de pesos fuera de la diagonal
+            con |C_ij| = c.
+        n_neurons: Número de neuronas.
+        density: Fracción de sinapsis a conservar.
+
+    Returns:
+        Conteo mínimo (al menos 1) de los pesos conservados.
+    """
+    n_keep = fan_in(n_neurons, density) * n_neurons
+    # at_least[c]: pesos con |C| >= c
+    at_least = np.cumsum(histogram[::-1])[::-1]
+    candidates = np.flatnonzero(at_least >= n_keep)
+    threshold = int(candidates[-1]) if len(candidates) else 0
+    return max(threshold, 1)
+
+
+def random_synapses(
+    n_neurons: int,
+    density: float,
+    rng: Optional[np.random.Generator] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Conecta cada neurona con un número fijo de neuronas al azar.
+
+    Cada fila elige fan_in columnas distintas; las sinapsis se simetrizan
+    con una unión, por lo que cada neurona queda con entre fan_in y
+    2·fan_in. Las claves aleatorias se generan por bloques de filas, con
+    la misma secuencia que una única matriz N x N.
+
+    Args:
+        n_neurons: Número de neuronas.
+        density: Fracción de sinapsis por neurona.
+        rng: Generador aleatorio (por defecto, uno sin semilla).
+
+    Returns:
+        Tupla (filas, columnas) ordenada por fila y columna.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    k = fan_in(n_neurons, density)
+
+    chosen = np.empty((n_neurons, k), dtype=np.int64)
+    for start, end in row_blocks(n_neurons, n_neurons):
+        # Claves aleatorias por fila; la diagonal nunca se elige
+        keys = rng.random((end - start, n_neurons))
+        keys[np.arange(end - start), np.arange(start, end)] = np.inf
+        chosen[start:end] = np.argpartition(keys, k - 1, axis=1)[:, :k]
+
+    rows = np.repeat(np.arange(n_neurons, dtype=np.int64), k)
+    columns = chosen.reshape(-1)
+    linear = np.unique(np.concatenate([
+        rows * n_neurons + columns, columns * n_neurons + rows
+    ]))
+    return linear // n_neurons, linear % n_neurons
+
+
+def local_synapses(
+    pattern_size: Tuple[int, int],
+    density: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Conecta cada neurona con sus vecinas en la imagen.
+
+    Las neuronas se ubican en la cuadrícula (ancho, alto) en el orden de
+    los píxeles (por filas). Se conservan las sinapsis con distancia
+    euclídea al cuadrado menor o igual a r², con r tal que el disco tenga
+    unas fan_in neuronas (π·r² ≈ fan_in); en los bordes hay menos.
+
+    Args:
+        pattern_size: Tupla (ancho, alto) del patrón.
+        density: Fracción de sinapsis por neurona.
+
+    Returns:
+        Tupla (filas, columnas) ordenada por fila.
+    """
+    width, height = pattern_size
+    n_neurons = width * height
+    radius_squared = max(fan_in(n_neurons, density) / np.pi, 1.0)
+
+    # Desplazamientos del disco, sin el centro
+    reach = int(np.sqrt(radius_squared))
+    dy, dx = np.mgrid[-reach:reach + 1, -reach:reach + 1]
+    inside = (dy * dy + dx * dx <= radius_squared) & ((dy != 0) | (dx != 0))
+    dy, dx = dy[inside], dx[inside]
+
+    index = np.arange(n_neurons, dtype=np.int64)
+    y = index[:, np.newaxis] // width + dy
+    x = index[:, np.newaxis] % width + dx
+    valid = (y >= 0) & (y < height) & (x >= 0) & (x < width)
+
+    rows = np.broadcast_to(index[:, np.newaxis], valid.shape)[valid]
+    return rows, (y * width + x)[valid]
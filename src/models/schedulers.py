@@ -0,0 +1,397 @@
+"""
+Planificadores del orden de actualización asíncrona.
+
+Un planificador decide en qué orden se visitan las neuronas durante un
+barrido asíncrono. Todos trabajan sobre el campo local h = W·s, que se
+mantiene de forma incremental: cambiar la neurona i suma Δs_i·W[i] a h y
+modifica la energía en ΔE = 2·s_i·h_i (con h_i previo al cambio).
+
+- SequentialScheduler: orden fijo 0..N-1 (el de siempre).
+- RandomPermutationScheduler: una permutación aleatoria por barrido, con
+  semilla para que la predicción sea reproducible.
+- BlockScheduler: Gauss-Seidel por bloques de k neuronas; las filas del
+  bloque se leen juntas y el campo global se actualiza con un solo
+  producto matricial por bloque.
+- UnstableSetScheduler: dirigido por eventos; cada ronda solo visita las
+  neuronas cuyo campo contradice su estado.
+
+Cada barrido informa cuántas neuronas evaluó: los planificadores de
+barrido completo evalúan N por barrido (la búsqueda vectorizada de la
+siguiente neurona inestable da el mismo resultado que visitarlas una a
+una), mientras que el de conjunto inestable solo evalúa las candidatas.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, Optional, Tuple
+import copy
+import numpy as np
+
+from src.models.weight_storage import WeightStorage
+
+# Campos con |h| menor a este valor se recalculan de forma exacta
+FIELD_TIE_TOLERANCE = 1e-9
+
+# Función llamada con (i, nuevo valor) tras cada cambio
+FlipCallback = Optional[Callable[[int, int], None]]
+
+
+def is_unstable(
+    storage: WeightStorage,
+    state: np.ndarray,
+    field: float,
+    i: int
+) -> bool:
+    """
+    Indica si la neurona i debe cambiar de estado.
+
+    Los campos cercanos a cero se recalculan con el producto directo
+    W[i]·s, ya que su signo depende del redondeo acumulado; así el
+    resultado es idéntico al de la actualización neurona a neurona.
+
+    Args:
+        storage: Pesos de la red.
+        state: Estado actual.
+        field: Campo local h_i mantenido de forma incremental.
+        i: Índice de la neurona.
+
+    Returns:
+        True si sign(h_i) (con 0 → -1) es distinto de s_i.
+    """
+    if abs(field) > FIELD_TIE_TOLERANCE:
+        return field * state[i] < 0
+    exact = storage.row_dot(i, state)
+    return (1 if exact > 0 else -1) != state[i]
+
+
+def next_unstable(
+    storage: WeightStorage,
+    state: np.ndarray,
+    fields: np.ndarray,
+    start: int,
+    order: Optional[np.ndarray] = None,
+    offset: int = 0
+) -> Optional[int]:
+    """
+    Busca la primera neurona inestable a partir de la posición start.
+
+    Args:
+        storage: Pesos de la red.
+        state: Estado actual (completo).
+        fields: Campo local h = W·s, o solo el tramo de un bloque.
+        start: Posición desde la que buscar.
+        order: Orden de visita (None para 0..N-1).
+        offset: Neurona correspondiente a fields[0] cuando fields es el
+            tramo de un bloque (solo sin order).
+
+    Returns:
+        Posición (en order o en fields) de la neurona inestable, o None.
+    """
+    if order is None:
+        window_fields = fields[start:]
+        window_state = state[offset + start:offset + len(fields)]
+    else:
+        window = order[start:]
+        window_fields, window_state = fields[window], state[window]
+
+    # h_i·s_i <= 0 indica neurona inestable; los empates también son
+    # candidatos y se resuelven con el producto exacto
+    candidates = np.flatnonzero(
+        window_fields * window_state <= FIELD_TIE_TOLERANCE
+    )
+    for k in candidates:
+        position = start + int(k)
+        if order is None:
+            field, i = fields[position], offset + position
+        else:
+            i = int(order[position])
+            field = fields[i]
+        if is_unstable(storage, state, field, i):
+            return position
+    return None
+
+
+def flip(
+    storage: WeightStorage,
+    state: np.ndarray,
+    fields: np.ndarray,
+    i: int,
+    on_flip: FlipCallback = None
+) -> float:
+    """
+    Cambia la neurona i y actualiza el campo local.
+
+    Args:
+        storage: Pesos de la red.
+        state: Estado actual (se modifica in-place).
+        fields: Campo local (se modifica in-place).
+        i: Índice de la neurona.
+        on_flip: Función llamada con (i, nuevo valor).
+
+    Returns:
+        Cambio de energía del cambio.
+    """
+    new_value = -state[i]
+    energy_change = 2.0 * state[i] * fields[i]
+    storage.add_scaled_row(fields, i, new_value - state[i])
+    state[i] = new_value
+    if on_flip is not None:
+        on_flip(i, new_value)
+    return float(energy_change)
+
+
+class UpdateScheduler(ABC):
+    """
+    Interfaz de un planificador de la actualización asíncrona.
+
+    Attributes:
+        name: Nombre del planificador.
+    """
+
+    name = 'scheduler'
+
+    def start(self, n_neurons: int) -> None:
+        """
+        Prepara el planificador al comenzar una predicción.
+
+        Args:
+            n_neurons: Número de neuronas de la red.
+        """
+
+    def spawn(self) -> 'UpdateScheduler':
+        """
+        Crea una copia independiente para una predicción.
+
+        La red usa una copia por llamada para que las predicciones
+        concurrentes no compartan estado (por ejemplo, el generador de
+        RandomPermutationScheduler). La copia es superficial: start debe
+        reasignar el estado de la predicción.
+
+        Returns:
+            Planificador con la misma configuración.
+        """
+        return copy.copy(self)
+
+    @abstractmethod
+    def sweep(
+        self,
+        storage: WeightStorage,
+        state: np.ndarray,
+        fields: np.ndarray,
+        on_flip: FlipCallback = None
+    ) -> Tuple[int, float, int]:
+        """
+        Ejecuta un barrido (o una ronda) de actualización asíncrona.
+
+        Args:
+            storage: Pesos de la red.
+            state: Estado actual (se modifica in-place).
+            fields: Campo local h = W·s (se modifica in-place).
+            on_flip: Función llamada con (i, nuevo valor) tras cada cambio.
+
+        Returns:
+            Tupla (cambios, cambio de energía, neuronas evaluadas).
+        """
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class SequentialScheduler(UpdateScheduler):
+    """
+    Barrido en orden fijo 0..N-1.
+
+    Entre dos cambios el campo no varía, así que en lugar de visitar
+    neurona a neurona se busca de forma vectorizada la siguiente neurona
+    inestable. Solo cuando una neurona cambia se actualiza el campo con la
+    fila correspondiente de W (W es simétrica). Un barrido sin cambios
+    cuesta O(N) en lugar de O(N²).
+    """
+
+    name = 'sequential'
+
+    def _order(self, n_neurons: int) -> Optional[np.ndarray]:
+        """Orden de visita del barrido (None para 0..N-1)."""
+        return None
+
+    def sweep(
+        self,
+        storage: WeightStorage,
+        state: np.ndarray,
+        fields: np.ndarray,
+        on_flip: FlipCallback = None
+    ) -> Tuple[int, float, int]:
+        n_neurons = len(state)
+        order = self._order(n_neurons)
+
+        n_flips = 0
+        energy_change = 0.0
+        start = 0
+        while start < n_neurons:
+            position = next_unstable(storage, state, fields, start, order)
+            if position is None:
+                break
+
+            i = position if order is None else int(order[position])
+            energy_change += flip(storage, state, fields, i, on_flip)
+            n_flips += 1
+            start = position + 1
+
+        return n_flips, energy_change, n_neurons
+
+
+class RandomPermutationScheduler(SequentialScheduler):
+    """
+    Barrido en una permutación aleatoria nueva en cada barrido.
+
+    El generador se reinicia con la semilla al comenzar cada predicción,
+    de modo que el mismo patrón produce siempre el mismo resultado.
+
+    Attributes:
+        seed: Semilla de las permutaciones.
+    """
+
+    name = 'random'
+
+    def __init__(self, seed: Optional[int] = 0):
+        """
+        Inicializa el planificador.
+
+        Args:
+            seed: Semilla (None para permutaciones no reproducibles).
+        """
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
+
+    def start(self, n_neurons: int) -> None:
+        self._rng = np.random.default_rng(self.seed)
+
+    def _order(self, n_neurons: int) -> Optional[np.ndarray]:
+        return self._rng.permutation(n_neurons)
+
+    def __repr__(self) -> str:
+        return f"RandomPermutationScheduler(seed={self.seed})"
+
+
+class BlockScheduler(UpdateScheduler):
+    """
+    Gauss-Seidel por bloques de k neuronas consecutivas.
+
+    Para cada bloque B con alguna neurona candidata se leen sus k filas de
+    W de una vez. Dentro del bloque las neuronas se actualizan en orden
+    con el campo local del bloque, corregido con la submatriz k x k tras
+    cada cambio; al terminar, el campo global se actualiza con un único
+    producto W[:, B]·Δs_B. El orden de actualización (y el resultado) es
+    el mismo que el del barrido secuencial, pero los cambios se aplican
+    al campo con una operación matricial por bloque en lugar de una por
+    cambio.
+
+    Attributes:
+        block_size: Neuronas por bloque.
+    """
+
+    name = 'block'
+
+    def __init__(self, block_size: int = 64):
+        """
+        Inicializa el planificador.
+
+        Args:
+            block_size: Neuronas por bloque (positivo).
+
+        Raises:
+            ValueError: Si block_size no es positivo.
+        """
+        if block_size <= 0:
+            raise ValueError("block_size debe ser positivo")
+        self.block_size = block_size
+
+    def sweep(
+        self,
+        storage: WeightStorage,
+        state: np.ndarray,
+        fields: np.ndarray,
+        on_flip: FlipCallback = None
+    ) -> Tuple[int, float, int]:
+        n_neurons = len(state)
+        n_flips = 0
+        energy_change = 0.0
+
+        for start in range(0, n_neurons, self.block_size):
+            end = min(start + self.block_size, n_neurons)
+            candidates = fields[start:end] * state[start:end] <= FIELD_TIE_TOLERANCE
+            if not candidates.any():
+                continue
+
+            rows = storage.rows(slice(start, end))
+            block = rows[:, start:end]
+            local = fields[start:end].copy()
+            changed = []
+
+            # Posición en el bloque de la siguiente neurona inestable
+            position = next_unstable(storage, state, local, 0, offset=start)
+            while position is not None:
+                i = start + position
+                new_value = -state[i]
+                energy_change += 2.0 * state[i] * local[position]
+                local += (new_value - state[i]) * block[:, position]
+                state[i] = new_value
+                changed.append(position)
+                if on_flip is not None:
+                    on_flip(i, new_value)
+                position = next_unstable(
+                    storage, state, local, position + 1, offset=start
+                )
+
+            if changed:
+                # Δs = 2·s_nuevo para las neuronas que cambiaron
+                deltas = 2.0 * state[start:end][changed]
+                fields += np.dot(deltas, rows[changed])
+                n_flips += len(changed)
+
+        return n_flips, float(energy_change), n_neurons
+
+    def __repr__(self) -> str:
+        return f"BlockScheduler(block_size={self.block_size})"
+
+
+class UnstableSetScheduler(UpdateScheduler):
+    """
+    Actualización dirigida por eventos sobre el conjunto inestable.
+
+    Cada ronda calcula de forma vectorizada el conjunto de neuronas cuyo
+    campo contradice su estado y solo visita esas, en orden de índice;
+    cada una se vuelve a comprobar antes de cambiarla, porque los cambios
+    previos de la ronda pueden haberla estabilizado. Las neuronas que se
+    vuelven inestables durante la ronda se atienden en la siguiente. Con
+    una entrada poco corrupta el conjunto es pequeño desde el principio y
+    el número de evaluaciones es proporcional a los cambios, no a N por
+    barrido.
+    """
+
+    name = 'unstable_set'
+
+    def sweep(
+        self,
+        storage: WeightStorage,
+        state: np.ndarray,
+        fields: np.ndarray,
+        on_flip: FlipCallback = None
+    ) -> Tuple[int, float, int]:
+        unstable = np.flatnonzero(fields * state <= FIELD_TIE_TOLERANCE)
+
+        n_flips = 0
+        energy_change = 0.0
+        for i in unstable:
+            if is_unstable(storage, state, fields[i], i):
+                energy_change += flip(storage, state, fields, int(i), on_flip)
+                n_flips += 1
+
+        return n_flips, energy_change, len(unstable)
+
+
+SCHEDULERS = {
+    'sequential': SequentialScheduler,
+    'random': RandomPermutationScheduler,
+    'block': BlockScheduler,
+    'unstable_set': UnstableSetScheduler,
+}
@@ -0,0 +1,437 @@
+"""
+Almacenamiento de pesos para la Red de Hopfield.
+
+Este módulo separa cómo se guardan los pesos de cómo se usan: los motores
+de actualización solo necesitan el campo local W·s y filas individuales
+de W, de modo que la matriz puede estar materializada (densa), definida
+de forma implícita a partir de los patrones (bajo rango) o podada a un
+subconjunto de sinapsis (dispersa, en formato CSR).
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional, Union
+import numpy as np
+
+
+class WeightStorage(ABC):
+    """
+    Interfaz para el almacenamiento de una matriz de pesos simétrica.
+
+    Attributes:
+        n_neurons: Número de neuronas (W es de n_neurons x n_neurons).
+    """
+
+    n_neurons: int
+
+    @abstractmethod
+    def field(self, state: np.ndarray) -> np.ndarray:
+        """
+        Calcula el campo local h = W·s.
+
+        Args:
+            state: Estado de la red (n_neurons,).
+
+        Returns:
+            Vector de campos (float64).
+        """
+        pass
+
+    @abstractmethod
+    def fields(self, states: np.ndarray) -> np.ndarray:
+        """
+        Calcula los campos locales de un lote de estados.
+
+        Args:
+            states: Estados (n_filas, n_neurons).
+
+        Returns:
+            Matriz (n_filas, n_neurons) con S·W (W es simétrica).
+        """
+        pass
+
+    @abstractmethod
+    def row(self, i: int) -> np.ndarray:
+        """
+        Obtiene la fila i de W como vector denso.
+
+        Args:
+            i: Índice de la neurona.
+
+        Returns:
+            Fila W[i] (float64, no debe modificarse).
+        """
+        pass
+
+    @abstractmethod
+    def to_dense(self) -> np.ndarray:
+        """Materializa la matriz de pesos completa."""
+        pass
+
+    @abstractmethod
+    def norm(self) -> float:
+        """Norma de Frobenius de W."""
+        pass
+
+    @property
+    @abstractmethod
+    def nbytes(self) -> int:
+        """Memoria ocupada por el almacenamiento, en bytes."""
+        pass
+
+    def row_dot(self, i: int, state: np.ndarray) -> float:
+        """
+        Calcula W[i]·s de forma directa.
+
+        Se usa para decidir el signo de campos cercanos a cero, donde el
+        redondeo acumulado del campo incremental no es fiable.
+
+        Args:
+            i: Índice de la neurona.
+            state: Estado de la red.
+
+        Returns:
+            Campo de la neurona i.
+        """
+        return np.dot(self.row(i), state)
+
+    def rows(self, indices: Union[slice, np.ndarray]) -> np.ndarray:
+        """
+        Obtiene varias filas de W como matriz densa.
+
+        Args:
+            indices: Índices de las neuronas (array o slice; un slice
+                permite devolver una vista sin copiar).
+
+        Returns:
+            Matriz (n_filas, n_neurons) con las filas W[indices] (no debe
+            modificarse).
+        """
+        return np.stack([self.row(int(i)) for i in np.arange(self.n_neurons)[indices]])
+
+    def add_scaled_row(
+        self,
+        fields: np.ndarray,
+        i: int,
+        delta,
+        rows: Optional[np.ndarray] = None
+    ) -> None:
+        """
+        Suma delta·W[i] a los campos tras el cambio de la neurona i.
+
+        Args:
+            fields: Campos (n_neurons,) o (n_filas, n_neurons), in-place.
+            i: Índice de la neurona que cambió.
+            delta: Cambio de estado (escalar, o un valor por fila de rows).
+            rows: Filas de fields a actualizar (None para un campo 1D).
+        """
+        if rows is None:
+            fields += delta * self.row(i)
+        else:
+            fields[rows] += np.outer(delta, self.row(i))
+
+
+class DenseWeights(WeightStorage):
+    """
+    Pesos almacenados como matriz densa N x N.
+
+    Attributes:
+        matrix: Matriz de pesos.
+    """
+
+    def __init__(self, matrix: np.ndarray):
+        """
+        Inicializa el almacenamiento denso.
+
+        Args:
+            matrix: Matriz de pesos cuadrada y simétrica (float64 o float32).
+        """
+        self.matrix = matrix
+        self.n_neurons = matrix.shape[0]
+
+    def field(self, state: np.ndarray) -> np.ndarray:
+        # El producto se hace en el tipo de la matriz (sgemv para float32)
+        result = np.dot(self.matrix, state.astype(self.matrix.dtype))
+        return result.astype(np.float64, copy=False)
+
+    def fields(self, states: np.ndarray) -> np.ndarray:
+        result = np.dot(states.astype(self.matrix.dtype), self.matrix)
+        return result.astype(np.float64, copy=False)
+
+    def row(self, i: int) -> np.ndarray:
+        return self.matrix[i]
+
+    def rows(self, indices: Union[slice, np.ndarray]) -> np.ndarray:
+        return self.matrix[indices]
+
+    def to_dense(self) -> np.ndarray:
+        return self.matrix
+
+    def norm(self) -> float:
+        return float(np.linalg.norm(self.matrix))
+
+    @property
+    def nbytes(self) -> int:
+        return self.matrix.nbytes
+
+
+class CountWeights(WeightStorage):
+    """
+    Pesos de Hebb guardados como conteos enteros de co-ocurrencia.
+
+    Se almacena C = PᵀP con diagonal en cero en int16 y W = C/p. Los
+    conteos son exactos y ocupan la cuarta parte que float64. Los productos
+    se calculan por bloques de filas convertidos a float32, que representa
+    sin error los enteros resultantes mientras p·N < 2**24; así el signo del
+    campo no depende del redondeo. Las filas se devuelven como (1/p)·C[i]
+    en float64, igual que la matriz densa equivalente.
+
+    Attributes:
+        counts: Matriz de conteos (N, N) en int16.
+        scale: Factor 1/p que convierte conteos en pesos.
+    """
+
+    # Filas por bloque al convertir a float32 (limita la memoria temporal)
+    BLOCK_ROWS = 512
+
+    def __init__(self, counts: np.ndarray, scale: float):
+        """
+        Inicializa el almacenamiento de conteos.
+
+        Args:
+            counts: Matriz de conteos simétrica (int16) con diagonal en cero.
+            scale: Factor de escala 1/p.
+        """
+        self.counts = counts
+        self.scale = scale
+        self.n_neurons = counts.shape[0]
+
+    def field(self, state: np.ndarray) -> np.ndarray:
+        state = state.astype(np.float32)
+        result = np.empty(self.n_neurons, dtype=np.float64)
+        for start in range(0, self.n_neurons, self.BLOCK_ROWS):
+            block = self.counts[start:start + self.BLOCK_ROWS].astype(np.float32)
+            result[start:start + self.BLOCK_ROWS] = np.dot(block, state)
+        return self.scale * result
+
+    def fields(self, states: np.ndarray) -> np.ndarray:
+        states = states.astype(np.float32)
+        result = np.empty(states.shape, dtype=np.float64)
+        for start in range(0, self.n_neurons, self.BLOCK_ROWS):
+            block = self.counts[start:start + self.BLOCK_ROWS].astype(np.float32)
+            result[:, start:start + self.BLOCK_ROWS] = np.dot(states, block.T)
+        return self.scale * result
+
+    def row(self, i: int) -> np.ndarray:
+        return self.scale * self.counts[i].astype(np.float64)
+
+    def rows(self, indices: Union[slice, np.ndarray]) -> np.ndarray:
+        return self.scale * self.counts[indices].astype(np.float64)
+
+    def to_dense(self) -> np.ndarray:
+        return self.scale * self.counts.astype(np.float64)
+
+    def norm(self) -> float:
+        return float(self.scale * np.linalg.norm(self.counts.astype(np.float64)))
+
+    @property
+    def nbytes(self) -> int:
+        return self.counts.nbytes
+
+
+class LowRankWeights(WeightStorage):
+    """
+    Pesos de Hebb implícitos: W = PᵀP/p con diagonal en cero.
+
+    Solo se guarda la matriz de patrones P (p x N). Como los patrones son
+    ±1, la diagonal de PᵀP/p vale 1 y el campo es h = Pᵀ(P·s)/p − s, que
+    cuesta O(pN) en lugar de O(N²). La memoria es lineal en N.
+
+    Attributes:
+        patterns: Matriz de patrones almacenados (p, N).
+    """
+
+    def __init__(self, patterns: np.ndarray, dtype: str = 'float64'):
+        """
+        Inicializa el almacenamiento de bajo rango.
+
+        Args:
+            patterns: Patrones de entrenamiento (p, N) con valores -1 o 1.
+            dtype: Tipo de almacenamiento ('float64' o 'float32'). Los
+                productos P·s son enteros, exactos en float32 si p·N < 2**24.
+        """
+        self.patterns = np.ascontiguousarray(patterns, dtype=dtype)
+        self.n_neurons = patterns.shape[1]
+        self._scale = 1.0 / patterns.shape[0]
+
+    def field(self, state: np.ndarray) -> np.ndarray:
+        overlaps = np.dot(self.patterns, state.astype(self.patterns.dtype))
+        products = np.dot(overlaps, self.patterns).astype(np.float64)
+        return self._scale * products - state
+
+    def fields(self, states: np.ndarray) -> np.ndarray:
+        overlaps = np.dot(states.astype(self.patterns.dtype), self.patterns.T)
+        products = np.dot(overlaps, self.patterns).astype(np.float64)
+        return self._scale * products - states
+
+    def row(self, i: int) -> np.ndarray:
+        # Misma aritmética que la versión densa: (1/p) · (PᵀP)[i]
+        products = np.dot(self.patterns[:, i], self.patterns).astype(np.float64)
+        row = self._scale * products
+        row[i] = 0.0
+        return row
+
+    def rows(self, indices: Union[slice, np.ndarray]) -> np.ndarray:
+        products = np.dot(self.patterns[:, indices].T, self.patterns).astype(np.float64)
+        rows = self._scale * products
+        rows[np.arange(len(rows)), np.arange(self.n_neurons)[indices]] = 0.0
+        return rows
+
+    def to_dense(self) -> np.ndarray:
+        products = np.dot(self.patterns.T, self.patterns).astype(np.float64)
+        matrix = self._scale * products
+        np.fill_diagonal(matrix, 0)
+        return matrix
+
+    def norm(self) -> float:
+        # ||PᵀP||_F = ||PPᵀ||_F; restar la diagonal (unos) quita N
+        gram = np.dot(self.patterns, self.patterns.T).astype(np.float64)
+        squared = (self._scale ** 2) * np.sum(gram ** 2) - self.n_neurons
+        return float(np.sqrt(max(squared, 0.0)))
+
+    @property
+    def nbytes(self) -> int:
+        return self.patterns.nbytes
+
+
+class SparseWeights(WeightStorage):
+    """
+    Pesos podados guardados en formato CSR (filas comprimidas).
+
+    Solo se guardan las sinapsis conservadas: para la fila i, sus columnas
+    son indices[indptr[i]:indptr[i+1]] y sus pesos data[...]. El campo se
+    calcula multiplicando cada peso por el estado de su columna y sumando
+    por tramos de fila (np.add.reduceat), y un cambio de neurona solo toca
+    las entradas de su fila. Memoria y costo son O(nnz) en lugar de O(N²).
+
+    Attributes:
+        indptr: Inicio de cada fila en indices/data (N + 1,).
+        indices: Columna de cada peso conservado (int32).
+        data: Valor de cada peso conservado (float64 o float32).
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, data: np.ndarray):
+        """
+        Inicializa el almacenamiento disperso.
+
+        Args:
+            indptr: Punteros de fila (N + 1,), no decrecientes.
+            indices: Índices de columna de cada peso.
+            data: Pesos conservados.
+        """
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.n_neurons = len(indptr) - 1
+
+        # reduceat no admite tramos vacíos: se suma solo sobre los inicios
+        # de las filas con pesos y las filas vacías quedan en cero
+        self._nonempty = np.flatnonzero(indptr[:-1] != indptr[1:])
+        self._starts = indptr[:-1][self._nonempty]
+
+    @classmethod
+    def from_dense(cls, matrix: np.ndarray, mask: np.ndarray) -> 'SparseWeights':
+        """
+        Construye el almacenamiento con las entradas seleccionadas.
+
+        Args:
+            matrix: Matriz de pesos densa (N, N).
+            mask: Máscara booleana (N, N) de sinapsis a conservar.
+
+        Returns:
+            Almacenamiento disperso.
+        """
+        rows, columns = np.nonzero(mask)
+        return cls.from_entries(matrix.shape[0], rows, columns, matrix[rows, columns])
+
+    @classmethod
+    def from_entries(
+        cls,
+        n_neurons: int,
+        rows: np.ndarray,
+        columns: np.ndarray,
+        data: np.ndarray
+    ) -> 'SparseWeights':
+        """
+        Construye el almacenamiento con entradas ya ordenadas por fila.
+
+        Args:
+            n_neurons: Número de neuronas.
+            rows: Fila de cada peso (no decreciente).
+            columns: Columna de cada peso.
+            data: Valor de cada peso.
+
+        Returns:
+            Almacenamiento disperso.
+        """
+        indptr = np.zeros(n_neurons + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n_neurons), out=indptr[1:])
+        return cls(indptr, columns.astype(np.int32), data)
+
+    @property
+    def nnz(self) -> int:
+        """Número de pesos conservados."""
+        return len(self.data)
+
+    def _sum_rows(self, products: np.ndarray) -> np.ndarray:
+        """Suma los productos por tramos de fila (última dimensión)."""
+        result = np.zeros(products.shape[:-1] + (self.n_neurons,), dtype=np.float64)
+        if self.nnz > 0:
+            result[..., self._nonempty] = np.add.reduceat(products, self._starts, axis=-1)
+        return result
+
+    def field(self, state: np.ndarray) -> np.ndarray:
+        return self._sum_rows(self.data * np.take(state, self.indices))
+
+    def fields(self, states: np.ndarray) -> np.ndarray:
+        return self._sum_rows(self.data * np.take(states, self.indices, axis=1))
+
+    def row(self, i: int) -> np.ndarray:
+        start, end = self.indptr[i], self.indptr[i + 1]
+        row = np.zeros(self.n_neurons, dtype=np.float64)
+        row[self.indices[start:end]] = self.data[start:end]
+        return row
+
+    def row_dot(self, i: int, state: np.ndarray) -> float:
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return float(np.dot(
+            self.data[start:end].astype(np.float64),
+            state[self.indices[start:end]]
+        ))
+
+    def add_scaled_row(
+        self,
+        fields: np.ndarray,
+        i: int,
+        delta,
+        rows: Optional[np.ndarray] = None
+    ) -> None:
+        start, end = self.indptr[i], self.indptr[i + 1]
+        columns = self.indices[start:end]
+        values = self.data[start:end]
+        if rows is None:
+            fields[columns] += delta * values
+        else:
+            fields[np.ix_(rows, columns)] += np.outer(delta, values)
+
+    def to_dense(self) -> np.ndarray:
+        matrix = np.zeros((self.n_neurons, self.n_neurons), dtype=np.float64)
+        rows = np.repeat(np.arange(self.n_neurons), np.diff(self.indptr))
+        matrix[rows, self.indices] = self.data
+        return matrix
+
+    def norm(self) -> float:
+        return float(np.linalg.norm(self.data.astype(np.float64)))
+
+    @property
+    def nbytes(self) -> int:
+        return self.indptr.nbytes + self.indices.nbytes + self.data.nbytes
@@ -8,12 +8,17 @@ import tkinter as tk
 from tkinter import Frame, Button, filedialog, messagebox
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.pyplot as plt
+import numpy as np
+import json
 import logging
+import threading
 from pathlib import Path
 
 from src.config.settings import config
 from src.models.hopfield_network import HopfieldNetwork
+from src.models.model_cache import ModelCache
 from src.utils.image_processor import ImageProcessor
+from src.utils.packed_patterns import PackedPatterns
 from src.utils.validators import ValidationError
 from src.ui.widgets import PatternDisplay, PatternFrame, StyledLabel
 
@@ -41,15 +46,19 @@ class MainWindow(tk.Frame):
         super().__init__(parent)
         self.parent = parent
 
-        # Inicializar red de Hopfield
+        # Inicializar red de Hopfield y caché de redes entrenadas
         self.network = HopfieldNetwork(config.image.size)
+        self.model_cache = ModelCache(directory=config.network.MODEL_CACHE_DIR)
+        self.session_path = Path(config.network.MODEL_CACHE_DIR) / 'last_session.json'
 
         # Inicializar procesador de imágenes
         self.image_processor = ImageProcessor()
 
-        # Rutas de archivos
+        # Rutas de archivos y patrones ya decodificados
         self.pattern_paths = []
         self.corrupt_path = None
+        self.patterns = None
+        self.corrupt_pattern = None
 
         # UI components
         self.pattern_display = None
@@ -59,6 +68,9 @@ class MainWindow(tk.Frame):
         self._setup_window()
         self._create_widgets()
 
+        # Cargar en segundo plano la red de la sesión anterior
+        threading.Thread(target=self._prewarm_model, daemon=True).start()
+
         logger.info("Ventana principal inicializada")
 
     def _setup_window(self) -> None:
@@ -187,12 +199,20 @@ class MainWindow(tk.Frame):
                 )
                 return
 
-            # Validar y cargar patrones
-            self.pattern_paths = list(paths)
+            # Validar y decodificar cada imagen con una sola apertura,
+            # reportando todos los archivos inválidos a la vez
+            patterns = []
+            errors = []
+            for path in paths:
+                try:
+                    patterns.append(ImageProcessor.load_pattern(path, validate=True))
+                except ValidationError as e:
+                    errors.append(f"{Path(path).name}: {e}")
+            if errors:
+                raise ValidationError('\n'.join(errors))
 
-            # Validar cada imagen
-            for path in self.pattern_paths:
-                ImageProcessor.load_pattern(path, validate=True)
+            self.pattern_paths = list(paths)
+            self.patterns = np.array(patterns)
 
             # Mostrar en UI
             self.pattern_display.set_patterns(self.pattern_paths)
@@ -235,8 +255,8 @@ class MainWindow(tk.Frame):
                 return
 
             # Validar y cargar
+            self.corrupt_pattern = ImageProcessor.load_pattern(path, validate=True)
             self.corrupt_path = path
-            ImageProcessor.load_pattern(path, validate=True)
 
             # Mostrar en UI
             self.corrupt_frame.set_image(path)
@@ -252,8 +272,26 @@ class MainWindow(tk.Frame):
             messagebox.showerror('Error', f'Error al cargar patrón: {e}')
             logger.error(f"Error al cargar patrón corrupto: {e}", exc_info=True)
 
+    def _prewarm_model(self) -> None:
+        """Carga a memoria la red usada en la sesión anterior, si existe."""
+        try:
+            if not self.session_path.exists():
+                return
+            key = json.loads(self.session_path.read_text())['key']
+            if self.model_cache.prewarm(key):
+                logger.info("Red de la sesión anterior lista en la caché")
+        except Exception as e:
+            logger.warning(f"No se pudo precargar la red de la sesión anterior: {e}")
+
+    def _remember_session(self, key: str) -> None:
+        """Guarda la clave de la red usada para precargarla al reiniciar."""
+        try:
+            self.session_path.write_text(json.dumps({'key': key}))
+        except OSError as e:
+            logger.warning(f"No se pudo guardar la sesión: {e}")
+
     def _predict_pattern(self) -> None:
-        """Entrena la red y predice el patrón corrupto."""
+        """Obtiene la red entrenada (de la caché) y predice el patrón corrupto."""
         try:
             # Validar que se hayan cargado los archivos necesarios
             if not self.pattern_paths:
@@ -274,28 +312,20 @@ class MainWindow(tk.Frame):
             progress_window = self._show_progress("Procesando...")
 
             try:
-                # Cargar y entrenar
-                patterns = self.image_processor.load_multiple_patterns(
-                    self.pattern_paths,
-                    validate=False  # Ya validados
-                )
-                self.network.train(patterns)
-
-                # Cargar patrón corrupto
-                corrupt_pattern = self.image_processor.load_pattern(
-                    self.corrupt_path,
-                    validate=False
+                # Patrones decodificados al seleccionarlos; solo se entrena
+                # si la selección es nueva
+                patterns = self.patterns
+                self.network = self.model_cache.get_or_train(
+                    patterns, config.image.size
                 )
+                self._remember_session(self.network.fingerprint())
 
                 # Predecir
-                prediction = self.network.predict(corrupt_pattern)
+                prediction = self.network.predict(self.corrupt_pattern)
 
                 # Calcular similitud con patrones originales
-                similarities = [
-                    self.image_processor.calculate_similarity(prediction, p)
-                    for p in patterns
-                ]
-                best_match = max(similarities)
+                similarities = PackedPatterns.from_patterns(patterns).similarity(prediction)
+                best_match = float(similarities.max())
 
                 # Mostrar resultado
                 self._display_prediction(prediction)
@@ -1,6 +1,39 @@
 """Módulo de utilidades."""
 
 from src.utils.image_processor import ImageProcessor
-from src.utils.validators import ImageValidator, PatternValidator
+from src.utils.packed_patterns import PackedPatterns
+from src.utils.pattern_loader import cache_path_for, find_image_files, load_patterns
+from src.utils.pattern_dataset import PatternDataset, build_dataset, parse_pattern_filename
+from src.utils.validators import (
+    ValidationError,
+    check_image_size,
+    open_image,
+    validate_image_directory,
+    validate_image_file,
+    validate_image_files,
+    validate_image_format,
+    validate_image_size,
+    validate_pattern,
+    validate_patterns_array,
+)
 
-__all__ = ['ImageProcessor', 'ImageValidator', 'PatternValidator']
+__all__ = [
+    'ImageProcessor',
+    'PackedPatterns',
+    'PatternDataset',
+    'build_dataset',
+    'parse_pattern_filename',
+    'cache_path_for',
+    'find_image_files',
+    'load_patterns',
+    'ValidationError',
+    'check_image_size',
+    'open_image',
+    'validate_image_directory',
+    'validate_image_file',
+    'validate_image_files',
+    'validate_image_format',
+    'validate_image_size',
+    'validate_pattern',
+    'validate_patterns_array',
+]
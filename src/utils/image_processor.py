@@ -4,16 +4,19 @@ Procesador de imágenes para conversión a patrones binarios.
 Convierte imágenes en patrones numéricos para la red de Hopfield.
 """
 
-from typing import List
+from typing import List, Optional, Tuple
 import numpy as np
 from PIL import Image
 import logging
 
 from src.config.settings import config
-from src.utils.validators import validate_image_file, validate_image_size
+from src.utils.validators import open_image
 
 logger = logging.getLogger(__name__)
 
+# Un píxel es blanco (1) si R + G + B supera este umbral (de 0 a 765)
+WHITE_THRESHOLD = 600
+
 
 class ImageProcessor:
     """
@@ -24,13 +27,26 @@ class ImageProcessor:
     """
 
     @staticmethod
-    def load_pattern(image_path: str, validate: bool = True) -> np.ndarray:
+    def load_pattern(
+        image_path: str,
+        validate: bool = True,
+        size: Optional[Tuple[int, int]] = None,
+        resample: bool = False,
+        threshold: Optional[float] = None
+    ) -> np.ndarray:
         """
         Carga una imagen y la convierte en patrón binario.
 
         Args:
             image_path: Ruta de la imagen.
-            validate: Si True, valida la imagen antes de procesarla.
+            validate: Si True, valida formato, existencia y tamaño con la
+                misma apertura que se usa para decodificar.
+            size: Tamaño del patrón (ancho, alto). Si es None, usa config.
+            resample: Si True, acepta imágenes de cualquier tamaño y las
+                lleva a size promediando el brillo por área (ver
+                resample_brightness); si False, la imagen debe medir size.
+            threshold: Umbral de binarización sobre R + G + B (o su promedio
+                por área). Si es None, usa WHITE_THRESHOLD.
 
         Returns:
             Array 1D con valores -1 (negro) y 1 (blanco).
@@ -39,18 +55,18 @@ class ImageProcessor:
             ValidationError: Si validate=True y la imagen no es válida.
             IOError: Si hay error al leer la imagen.
         """
-        if validate:
-            validate_image_file(image_path)
-            validate_image_size(image_path)
+        if size is None:
+            size = config.image.size
 
         try:
-            with Image.open(image_path) as img:
-                # Convertir a RGBA si no lo está
-                if img.mode != 'RGBA':
-                    img = img.convert('RGBA')
-
-                pixels = list(img.getdata())
-                pattern = ImageProcessor._pixels_to_pattern(pixels)
+            if validate:
+                img = open_image(image_path, size, check_size=not resample)
+            else:
+                img = Image.open(image_path)
+            with img:
+                pattern = ImageProcessor._image_to_pattern(
+                    img, size if resample else None, threshold
+                )
 
             logger.debug(f"Imagen cargada: {image_path}")
             return pattern
@@ -62,7 +78,10 @@ class ImageProcessor:
     @staticmethod
     def load_multiple_patterns(
         image_paths: List[str],
-        validate: bool = True
+        validate: bool = True,
+        size: Optional[Tuple[int, int]] = None,
+        resample: bool = False,
+        threshold: Optional[float] = None
     ) -> np.ndarray:
         """
         Carga múltiples imágenes como array de patrones.
@@ -70,13 +89,18 @@ class ImageProcessor:
         Args:
             image_paths: Lista de rutas de imágenes.
             validate: Si True, valida cada imagen.
+            size: Tamaño del patrón (ver load_pattern).
+            resample: Si True, lleva cada imagen a size (ver load_pattern).
+            threshold: Umbral de binarización (ver load_pattern).
 
         Returns:
             Array 2D de forma (n_patterns, n_neurons).
         """
         patterns = []
         for path in image_paths:
-            pattern = ImageProcessor.load_pattern(path, validate=validate)
+            pattern = ImageProcessor.load_pattern(
+                path, validate=validate, size=size, resample=resample, threshold=threshold
+            )
             patterns.append(pattern)
 
         logger.info(f"Cargados {len(patterns)} patrones")
@@ -86,7 +110,8 @@ class ImageProcessor:
     def pattern_to_image(
         pattern: np.ndarray,
         size: tuple = None,
-        save_path: str = None
+        save_path: str = None,
+        one_bit: bool = False
     ) -> Image.Image:
         """
         Convierte un patrón binario de vuelta a imagen.
@@ -95,24 +120,36 @@ class ImageProcessor:
             pattern: Array 1D con valores -1 y 1.
             size: Tupla (ancho, alto). Si es None, usa config.
             save_path: Si se proporciona, guarda la imagen en esta ruta.
+            one_bit: Si True, crea una imagen de 1 bit (modo '1'), que se
+                guarda como PNG de 1 bit por píxel. Si False, crea una
+                imagen RGBA con WHITE_PIXEL y BLACK_PIXEL.
 
         Returns:
             Objeto Image de PIL.
+
+        Raises:
+            ValueError: Si el patrón no tiene ancho x alto valores.
         """
         if size is None:
             size = config.image.size
-
-        # Convertir patrón a píxeles
-        pixels = []
-        for value in pattern:
-            if value == 1:
-                pixels.append(config.image.WHITE_PIXEL)
-            else:
-                pixels.append(config.image.BLACK_PIXEL)
-
-        # Crear imagen
-        img = Image.new('RGBA', size)
-        img.putdata(pixels)
+        width, height = size
+
+        pattern = np.asarray(pattern)
+        if pattern.size != width * height:
+            raise ValueError(
+                f"El patrón tiene {pattern.size} valores, se esperaban "
+                f"{width * height} ({width}x{height})"
+            )
+        white = (pattern == 1).reshape(height, width)
+
+        if one_bit:
+            # Modo '1': cada fila empaquetada a 1 bit, el bit más alto primero
+            img = Image.frombytes('1', (width, height), np.packbits(white, axis=1).tobytes())
+        else:
+            palette = np.array(
+                [config.image.BLACK_PIXEL, config.image.WHITE_PIXEL], dtype=np.uint8
+            )
+            img = Image.fromarray(palette[white.view(np.uint8)], 'RGBA')
 
         if save_path:
             img.save(save_path)
@@ -121,25 +158,112 @@ class ImageProcessor:
         return img
 
     @staticmethod
-    def _pixels_to_pattern(pixels: list) -> np.ndarray:
+    def resample_brightness(brightness: np.ndarray, size: Tuple[int, int]) -> np.ndarray:
         """
-        Convierte lista de píxeles a patrón binario.
+        Lleva un mapa de brillo a otro tamaño promediando por área.
+
+        Cada píxel de salida es el promedio de los píxeles de entrada que
+        cubre, ponderado por la fracción de cada uno dentro de su área
+        (también para factores no enteros). El filtro es separable y se
+        aplica como dos productos de matrices: B' = Wh · B · Wwᵀ.
 
         Args:
-            pixels: Lista de tuplas RGBA.
+            brightness: Array 2D (alto, ancho) de brillo.
+            size: Tamaño de salida (ancho, alto).
 
         Returns:
-            Array con valores -1 y 1.
+            Array float64 (alto, ancho) con el brillo promediado.
         """
-        pattern = []
-        for pixel in pixels:
-            # Considerar blanco (o cercano) como 1, resto como -1
-            if pixel == config.image.WHITE_PIXEL or sum(pixel[:3]) > 600:
-                pattern.append(1)
-            else:
-                pattern.append(-1)
+        width, height = size
+        rows = ImageProcessor._area_weights(brightness.shape[0], height)
+        cols = ImageProcessor._area_weights(brightness.shape[1], width)
+        brightness = brightness.astype(np.float64)
+        # El primer producto recorre toda la imagen: reducir primero la
+        # dimensión que queda más pequeña
+        if height <= width:
+            return (rows @ brightness) @ cols.T
+        return rows @ (brightness @ cols.T)
+
+    @staticmethod
+    def _area_weights(n_in: int, n_out: int) -> np.ndarray:
+        """
+        Matriz (n_out, n_in) de promedio por área en una dimensión.
+
+        La celda de salida i cubre [i·n_in/n_out, (i+1)·n_in/n_out) y su
+        peso sobre la celda de entrada j es la longitud de la intersección
+        con [j, j+1), normalizada para que cada fila sume 1.
+        """
+        edges = np.arange(n_out + 1) * (n_in / n_out)
+        cells = np.arange(n_in)
+        overlap = (
+            np.minimum(edges[1:, np.newaxis], cells + 1)
+            - np.maximum(edges[:-1, np.newaxis], cells)
+        )
+        return np.clip(overlap, 0, None) * (n_out / n_in)
+
+    @staticmethod
+    def _image_to_pattern(
+        img: Image.Image,
+        size: Optional[Tuple[int, int]] = None,
+        threshold: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Convierte una imagen abierta a patrón binario.
+
+        Args:
+            img: Imagen de PIL en cualquier modo.
+            size: Si se indica y difiere del tamaño de la imagen, el brillo
+                se promedia por área a ese tamaño antes de binarizar.
+            threshold: Umbral de binarización (WHITE_THRESHOLD si es None).
 
-        return np.array(pattern)
+        Returns:
+            Array 1D con valores -1 y 1 (tipo config.network.STATE_DTYPE).
+        """
+        if img.mode in ('1', 'L'):
+            # En gris R = G = B, así que R + G + B = 3·L
+            brightness = np.asarray(img.convert('L'), dtype=np.uint16) * 3
+        else:
+            if img.mode not in ('RGB', 'RGBA'):
+                img = img.convert('RGBA')
+            brightness = ImageProcessor._brightness(np.asarray(img))
+
+        if size is not None and tuple(size) != img.size:
+            brightness = ImageProcessor.resample_brightness(brightness, size)
+        return ImageProcessor._threshold(brightness, threshold)
+
+    @staticmethod
+    def _pixels_to_pattern(pixels, threshold: Optional[float] = None) -> np.ndarray:
+        """
+        Convierte píxeles a patrón binario.
+
+        Args:
+            pixels: Array (..., 3 o 4) o lista de tuplas RGB(A).
+            threshold: Umbral de binarización (WHITE_THRESHOLD si es None).
+
+        Returns:
+            Array 1D con valores -1 y 1 (tipo config.network.STATE_DTYPE).
+        """
+        # WHITE_PIXEL también supera el umbral, así que basta con la suma
+        brightness = ImageProcessor._brightness(np.asarray(pixels))
+        return ImageProcessor._threshold(brightness, threshold)
+
+    @staticmethod
+    def _brightness(pixels: np.ndarray) -> np.ndarray:
+        """R + G + B de cada píxel en uint16."""
+        # Sumar canal por canal es mucho más rápido que reducir con
+        # sum(axis=-1) sobre el eje de canales en imágenes grandes
+        brightness = pixels[..., 0].astype(np.uint16)
+        brightness += pixels[..., 1]
+        brightness += pixels[..., 2]
+        return brightness
+
+    @staticmethod
+    def _threshold(brightness: np.ndarray, threshold: Optional[float] = None) -> np.ndarray:
+        """Blanco (o cercano) es 1 y el resto -1, aplanado a 1D."""
+        if threshold is None:
+            threshold = WHITE_THRESHOLD
+        white = brightness > threshold
+        return np.where(white, 1, -1).astype(config.network.STATE_DTYPE).ravel()
 
     @staticmethod
     def corrupt_pattern(
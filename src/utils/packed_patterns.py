@@ -0,0 +1,231 @@
+"""
+Patrones binarios empaquetados a 1 bit por neurona.
+
+Un patrón ±1 se guarda como bits (1 = blanco, 0 = negro) con np.packbits,
+lo que ocupa 64 veces menos que un array int64. Las comparaciones se hacen
+con XOR y conteo de bits (popcount) sobre palabras completas, de forma
+vectorizada para uno contra muchos y muchos contra muchos.
+"""
+
+from typing import Union
+import numpy as np
+
+# Máscaras del popcount SWAR sobre palabras de 64 bits
+_M1 = np.uint64(0x5555555555555555)
+_M2 = np.uint64(0x3333333333333333)
+_M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+_H01 = np.uint64(0x0101010101010101)
+
+# Tamaño objetivo de los temporales en comparaciones muchos contra muchos
+_PAIRWISE_CHUNK_BYTES = 1 << 20
+
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """
+    Cuenta los bits a 1 en la última dimensión.
+
+    Usa np.bitwise_count si está disponible (numpy >= 2.0) y, si no, el
+    popcount SWAR clásico con operaciones in-place sobre uint64.
+
+    Args:
+        words: Array uint64 (resultado de un XOR); puede modificarse.
+
+    Returns:
+        Array int64 con el conteo por fila.
+    """
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+
+    x = words
+    t = x >> np.uint64(1)
+    t &= _M1
+    x -= t
+    t = x >> np.uint64(2)
+    t &= _M2
+    x &= _M2
+    x += t
+    t = x >> np.uint64(4)
+    x += t
+    x &= _M4
+    x *= _H01
+    x >>= np.uint64(56)
+    return x.sum(axis=-1, dtype=np.int64)
+
+
+class PackedPatterns:
+    """
+    Colección de patrones ±1 empaquetados a 1 bit por neurona.
+
+    Cada fila se rellena con ceros hasta un múltiplo de 8 bytes para poder
+    operar sobre palabras uint64; el relleno es igual en todas las filas y
+    no afecta las distancias.
+
+    Attributes:
+        bits: Array uint8 (n_patrones, n_bytes) con los bits empaquetados.
+        n_neurons: Número de neuronas (bits válidos) por patrón.
+
+    Example:
+        >>> library = PackedPatterns.from_patterns(patterns)
+        >>> distances = library.hamming(reconstructed)
+        >>> best = int(np.argmin(distances))
+    """
+
+    def __init__(self, bits: np.ndarray, n_neurons: int):
+        """
+        Inicializa la colección a partir de bits ya empaquetados.
+
+        Args:
+            bits: Array uint8 (n_patrones, n_bytes) con n_bytes múltiplo de 8.
+            n_neurons: Número de neuronas por patrón.
+
+        Raises:
+            ValueError: Si la forma de bits no es válida.
+        """
+        if bits.ndim != 2 or bits.dtype != np.uint8:
+            raise ValueError("bits debe ser un array uint8 2D")
+        if bits.shape[1] % 8 != 0 or bits.shape[1] * 8 < n_neurons:
+            raise ValueError(
+                f"Cada fila debe tener un múltiplo de 8 bytes y al menos "
+                f"{n_neurons} bits"
+            )
+        self.bits = np.ascontiguousarray(bits)
+        self.n_neurons = n_neurons
+
+    @classmethod
+    def from_patterns(cls, patterns: np.ndarray) -> 'PackedPatterns':
+        """
+        Empaqueta patrones con valores -1 y 1.
+
+        Args:
+            patterns: Array 1D (un patrón) o 2D (n_patrones, n_neurons).
+
+        Returns:
+            Colección empaquetada.
+        """
+        patterns = np.atleast_2d(patterns)
+        n_neurons = patterns.shape[1]
+        n_bytes = -(-n_neurons // 64) * 8
+
+        bits = np.zeros((patterns.shape[0], n_bytes), dtype=np.uint8)
+        packed = np.packbits(patterns > 0, axis=1)
+        bits[:, :packed.shape[1]] = packed
+        return cls(bits, n_neurons)
+
+    def to_patterns(self, dtype: Union[str, np.dtype] = np.int8) -> np.ndarray:
+        """
+        Desempaqueta a patrones con valores -1 y 1.
+
+        Args:
+            dtype: Tipo del array resultante.
+
+        Returns:
+            Array (n_patrones, n_neurons).
+        """
+        unpacked = np.unpackbits(self.bits, axis=1, count=self.n_neurons)
+        return unpacked.astype(dtype) * 2 - 1
+
+    @property
+    def words(self) -> np.ndarray:
+        """Vista uint64 de los bits (n_patrones, n_bytes // 8)."""
+        return self.bits.view(np.uint64)
+
+    @property
+    def nbytes(self) -> int:
+        """Memoria ocupada por los bits, en bytes."""
+        return self.bits.nbytes
+
+    def hamming(self, pattern: Union[np.ndarray, 'PackedPatterns']) -> np.ndarray:
+        """
+        Distancia de Hamming de un patrón contra toda la colección.
+
+        Args:
+            pattern: Patrón ±1 (1D) o colección empaquetada de un patrón.
+
+        Returns:
+            Array (n_patrones,) con el número de neuronas distintas.
+        """
+        query = self._as_packed(pattern)
+        if len(query) != 1:
+            raise ValueError("Se esperaba un único patrón; use pairwise_hamming")
+        return _popcount(self.words ^ query.words[0])
+
+    def pairwise_hamming(self, other: Union[np.ndarray, 'PackedPatterns']) -> np.ndarray:
+        """
+        Distancias de Hamming de todos contra todos.
+
+        Se procesa por bloques de filas para acotar la memoria temporal.
+
+        Args:
+            other: Patrones ±1 (2D) o colección empaquetada.
+
+        Returns:
+            Array (len(self), len(other)) de distancias.
+        """
+        other = self._as_packed(other)
+        result = np.empty((len(self), len(other)), dtype=np.int64)
+
+        row_bytes = max(1, len(other) * self.bits.shape[1])
+        chunk = max(1, _PAIRWISE_CHUNK_BYTES // row_bytes)
+        for start in range(0, len(self), chunk):
+            block = self.words[start:start + chunk, np.newaxis, :]
+            result[start:start + chunk] = _popcount(block ^ other.words[np.newaxis])
+        return result
+
+    def overlap(self, pattern: Union[np.ndarray, 'PackedPatterns']) -> np.ndarray:
+        """
+        Solapamiento normalizado m = s·ξ / N contra toda la colección.
+
+        Args:
+            pattern: Patrón ±1 (1D) o colección empaquetada de un patrón.
+
+        Returns:
+            Array (n_patrones,) con valores entre -1 y 1.
+        """
+        return 1.0 - 2.0 * self.hamming(pattern) / self.n_neurons
+
+    def pairwise_overlap(self, other: Union[np.ndarray, 'PackedPatterns']) -> np.ndarray:
+        """
+        Solapamientos normalizados de todos contra todos.
+
+        Args:
+            other: Patrones ±1 (2D) o colección empaquetada.
+
+        Returns:
+            Array (len(self), len(other)) con valores entre -1 y 1.
+        """
+        return 1.0 - 2.0 * self.pairwise_hamming(other) / self.n_neurons
+
+    def similarity(self, pattern: Union[np.ndarray, 'PackedPatterns']) -> np.ndarray:
+        """
+        Fracción de neuronas iguales (como ImageProcessor.calculate_similarity).
+
+        Args:
+            pattern: Patrón ±1 (1D) o colección empaquetada de un patrón.
+
+        Returns:
+            Array (n_patrones,) con valores entre 0 y 1.
+        """
+        return 1.0 - self.hamming(pattern) / self.n_neurons
+
+    def _as_packed(self, patterns: Union[np.ndarray, 'PackedPatterns']) -> 'PackedPatterns':
+        """Convierte la entrada a PackedPatterns y verifica el tamaño."""
+        if not isinstance(patterns, PackedPatterns):
+            patterns = PackedPatterns.from_patterns(patterns)
+        if patterns.n_neurons != self.n_neurons:
+            raise ValueError(
+                f"Los patrones deben tener {self.n_neurons} neuronas, "
+                f"recibido: {patterns.n_neurons}"
+            )
+        return patterns
+
+    def __len__(self) -> int:
+        return self.bits.shape[0]
+
+    def __getitem__(self, index) -> 'PackedPatterns':
+        bits = self.bits[index]
+        if bits.ndim == 1:
+            bits = bits[np.newaxis]
+        return PackedPatterns(bits, self.n_neurons)
+
+    def __repr__(self) -> str:
+        return f"PackedPatterns(patrones={len(self)}, neuronas={self.n_neurons})"
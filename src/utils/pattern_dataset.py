@@ -0,0 +1,321 @@
+"""
+Conjuntos de patrones empaquetados y mapeados en memoria.
+
+Un conjunto de datos reemplaza miles de imágenes sueltas por un único
+archivo (formato de src/models/persistence.py) con:
+
+- bits: array uint8 (n_patrones, n_bytes) con los patrones empaquetados a
+  1 bit, con la misma disposición que PackedPatterns.
+- labels: índice de la letra de origen de cada patrón en la lista
+  'letters' de los metadatos (-1 si el nombre no sigue la convención).
+- corruption: tasa de corrupción (0.0 para patrones limpios, NaN si el
+  nombre no la indica).
+- filenames: nombre del archivo de imagen original.
+
+El archivo se abre con np.memmap: abrirlo solo lee la cabecera y las
+páginas se cargan cuando se accede a ellas. Los patrones se entregan como
+PackedPatterns sobre el archivo mapeado, que HopfieldNetwork.train y
+predict_batch aceptan directamente.
+"""
+
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+import logging
+import re
+
+import numpy as np
+
+from src.config.settings import config
+from src.models.persistence import read_model, write_model
+from src.utils.packed_patterns import PackedPatterns
+from src.utils.pattern_loader import load_patterns
+
+logger = logging.getLogger(__name__)
+
+DATASET_KIND = 'pattern_dataset'
+DATASET_EXTENSION = '.dataset'
+
+PathLike = Union[str, Path]
+
+# Convención de data/README.md: pattern_A.png y corrupted_A_20.png
+# (corrupt_patterns.py genera también corrupted_pattern_A_20.png)
+_CLEAN_NAME = re.compile(r'^pattern_(?P<letter>[^_]+)$')
+_CORRUPTED_NAME = re.compile(r'^corrupted_(?:pattern_)?(?P<letter>[^_]+)_(?P<rate>\d+)$')
+
+
+def parse_pattern_filename(filename: str) -> Tuple[Optional[str], float]:
+    """
+    Extrae la letra de origen y la tasa de corrupción de un nombre.
+
+    Args:
+        filename: Nombre o ruta del archivo (por ejemplo 'corrupted_A_20.png').
+
+    Returns:
+        Tupla (letra, tasa de corrupción entre 0 y 1). Los patrones limpios
+        tienen tasa 0.0; si el nombre no sigue la convención, retorna
+        (None, nan).
+    """
+    stem = Path(filename).stem
+    match = _CORRUPTED_NAME.match(stem)
+    if match:
+        return match.group('letter'), int(match.group('rate')) / 100
+    match = _CLEAN_NAME.match(stem)
+    if match:
+        return match.group('letter'), 0.0
+    return None, float('nan')
+
+
+class PatternDataset:
+    """
+    Conjunto de patrones empaquetados con índice de etiquetas.
+
+    Attributes:
+        packed: Patrones como PackedPatterns (sobre el archivo mapeado si
+            el conjunto se abrió con open).
+        labels: Array int32 con el índice de la letra de cada patrón.
+        corruption: Array float32 con la tasa de corrupción de cada patrón.
+        filenames: Array de bytes con el nombre de archivo de cada patrón.
+        letters: Letras de origen; labels indexa esta lista.
+        pattern_size: Tupla (ancho, alto).
+
+    Example:
+        >>> dataset = PatternDataset.open('data/letters.dataset')
+        >>> network.train(dataset.packed[dataset.select(corrupted=False)])
+        >>> for batch in dataset.batches(4096):
+        ...     reconstructed = network.predict_batch(batch)
+    """
+
+    def __init__(
+        self,
+        packed: PackedPatterns,
+        labels: np.ndarray,
+        corruption: np.ndarray,
+        filenames: np.ndarray,
+        letters: Sequence[str],
+        pattern_size: Tuple[int, int]
+    ):
+        """
+        Inicializa el conjunto a partir de arrays ya construidos.
+
+        Args:
+            packed: Patrones empaquetados.
+            labels: Índice de la letra de cada patrón (-1 si no tiene).
+            corruption: Tasa de corrupción de cada patrón.
+            filenames: Nombre de archivo de cada patrón.
+            letters: Letras de origen.
+            pattern_size: Tupla (ancho, alto).
+
+        Raises:
+            ValueError: Si los arrays no tienen un elemento por patrón o el
+                tamaño no corresponde al número de neuronas.
+        """
+        n_patterns = len(packed)
+        if not len(labels) == len(corruption) == len(filenames) == n_patterns:
+            raise ValueError("El índice debe tener una entrada por patrón")
+        if pattern_size[0] * pattern_size[1] != packed.n_neurons:
+            raise ValueError(
+                f"El tamaño {pattern_size[0]}x{pattern_size[1]} no corresponde "
+                f"a {packed.n_neurons} neuronas"
+            )
+
+        self.packed = packed
+        self.labels = labels
+        self.corruption = corruption
+        self.filenames = filenames
+        self.letters = list(letters)
+        self.pattern_size = tuple(pattern_size)
+
+    @classmethod
+    def from_packed(
+        cls,
+        packed: PackedPatterns,
+        filenames: Sequence[str],
+        pattern_size: Optional[Tuple[int, int]] = None
+    ) -> 'PatternDataset':
+        """
+        Construye el índice a partir de los nombres de archivo.
+
+        Args:
+            packed: Patrones empaquetados, en el orden de filenames.
+            filenames: Nombres o rutas de las imágenes originales.
+            pattern_size: Tupla (ancho, alto). Si es None, usa config.
+
+        Returns:
+            Conjunto en memoria (guardarlo con save).
+        """
+        if pattern_size is None:
+            pattern_size = config.image.size
+
+        names = [Path(filename).name for filename in filenames]
+        parsed = [parse_pattern_filename(name) for name in names]
+        letters = sorted({letter for letter, _ in parsed if letter is not None})
+        index = {letter: i for i, letter in enumerate(letters)}
+
+        labels = np.array(
+            [index.get(letter, -1) for letter, _ in parsed], dtype=np.int32
+        )
+        corruption = np.array([rate for _, rate in parsed], dtype=np.float32)
+        encoded = np.array([name.encode('utf-8') for name in names], dtype=np.bytes_)
+        return cls(packed, labels, corruption, encoded, letters, pattern_size)
+
+    @classmethod
+    def open(cls, path: PathLike, mmap_mode: str = 'r') -> 'PatternDataset':
+        """
+        Abre un archivo de conjunto de datos sin leer los patrones.
+
+        Args:
+            path: Ruta del archivo.
+            mmap_mode: Modo de np.memmap ('r', 'c' o 'r+'), o None para
+                leer todo a memoria.
+
+        Returns:
+            Conjunto cuyos arrays son vistas del archivo mapeado.
+
+        Raises:
+            ValueError: Si el archivo no es un conjunto de datos.
+        """
+        metadata, arrays = read_model(path, mmap_mode=mmap_mode)
+        if metadata.get('kind') != DATASET_KIND:
+            raise ValueError(f"El archivo no es un conjunto de patrones: {path}")
+
+        packed = PackedPatterns(arrays['bits'], metadata['n_neurons'])
+        logger.info(f"Conjunto abierto: {path} ({len(packed)} patrones)")
+        return cls(
+            packed,
+            arrays['labels'],
+            arrays['corruption'],
+            arrays['filenames'],
+            metadata['letters'],
+            tuple(metadata['pattern_size'])
+        )
+
+    def save(self, path: PathLike) -> None:
+        """
+        Guarda el conjunto (de forma atómica).
+
+        Args:
+            path: Ruta del archivo.
+        """
+        metadata = {
+            'kind': DATASET_KIND,
+            'pattern_size': list(self.pattern_size),
+            'n_neurons': self.packed.n_neurons,
+            'n_patterns': len(self),
+            'letters': self.letters
+        }
+        arrays = {
+            'bits': self.packed.bits,
+            'labels': self.labels,
+            'corruption': self.corruption,
+            'filenames': self.filenames
+        }
+        write_model(path, metadata, arrays)
+        logger.info(f"Conjunto guardado: {path} ({len(self)} patrones)")
+
+    def select(
+        self,
+        letter: Optional[str] = None,
+        corrupted: Optional[bool] = None
+    ) -> np.ndarray:
+        """
+        Índices de los patrones que cumplen los filtros.
+
+        Args:
+            letter: Letra de origen (None para todas).
+            corrupted: True solo corruptos, False solo limpios, None ambos.
+
+        Returns:
+            Array de índices, utilizable con packed[índices].
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if letter is not None:
+            if letter not in self.letters:
+                return np.empty(0, dtype=np.intp)
+            mask &= self.labels == self.letters.index(letter)
+        if corrupted is not None:
+            mask &= (self.corruption > 0) if corrupted else (self.corruption == 0)
+        return np.flatnonzero(mask)
+
+    def batches(self, batch_size: int) -> Iterator[PackedPatterns]:
+        """
+        Recorre el conjunto en lotes consecutivos.
+
+        Cada lote es una vista del archivo mapeado (no se copia).
+
+        Args:
+            batch_size: Patrones por lote.
+
+        Yields:
+            PackedPatterns con hasta batch_size patrones.
+
+        Raises:
+            ValueError: Si batch_size no es positivo.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size debe ser positivo")
+        for start in range(0, len(self), batch_size):
+            yield self.packed[start:start + batch_size]
+
+    def letter(self, index: int) -> Optional[str]:
+        """Letra de origen de un patrón (None si no tiene)."""
+        label = int(self.labels[index])
+        return self.letters[label] if label >= 0 else None
+
+    def filename(self, index: int) -> str:
+        """Nombre de archivo original de un patrón."""
+        return bytes(self.filenames[index]).decode('utf-8')
+
+    def __len__(self) -> int:
+        return len(self.packed)
+
+    def __repr__(self) -> str:
+        return (
+            f"PatternDataset(n_patterns={len(self)}, "
+            f"pattern_size={self.pattern_size}, letters={self.letters})"
+        )
+
+
+def build_dataset(
+    sources: List[PathLike],
+    n_workers: Optional[int] = None,
+    validate: bool = True,
+    size: Optional[Tuple[int, int]] = None,
+    resample: bool = False,
+    threshold: Optional[float] = None
+) -> PatternDataset:
+    """
+    Construye un conjunto a partir de directorios o patrones glob de imágenes.
+
+    Args:
+        sources: Directorios, patrones glob o rutas de imágenes.
+        n_workers: Hilos de decodificación (ver pattern_loader.load_patterns).
+        validate: Si True, valida cada imagen.
+        size: Tamaño de los patrones (ancho, alto). Si es None, usa config.
+        resample: Si True, lleva cada imagen a size promediando por área.
+        threshold: Umbral de binarización (WHITE_THRESHOLD si es None).
+
+    Returns:
+        Conjunto en memoria (guardarlo con save).
+    """
+    if size is None:
+        size = config.image.size
+
+    filenames = []
+    blocks = []
+    for source in sources:
+        paths, packed = load_patterns(
+            source,
+            n_workers=n_workers,
+            validate=validate,
+            packed=True,
+            size=size,
+            resample=resample,
+            threshold=threshold
+        )
+        filenames.extend(paths)
+        blocks.append(packed.bits)
+
+    n_neurons = size[0] * size[1]
+    n_bytes = -(-n_neurons // 64) * 8
+    bits = np.concatenate(blocks) if blocks else np.empty((0, n_bytes), dtype=np.uint8)
+    return PatternDataset.from_packed(PackedPatterns(bits, n_neurons), filenames, size)
@@ -0,0 +1,251 @@
+"""
+Carga de directorios de imágenes con caché de patrones decodificados.
+
+Las imágenes se decodifican en un pool de hilos y los patrones se guardan
+empaquetados a 1 bit en un archivo de caché (formato de
+src/models/persistence.py) junto con la ruta, la fecha de modificación y
+el tamaño de cada imagen. En la siguiente carga solo se decodifican las
+imágenes nuevas o modificadas; si ninguna cambió, los patrones salen de
+una única lectura del archivo mapeado en memoria.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+import glob
+import hashlib
+import logging
+import os
+
+import numpy as np
+
+from src.config.settings import config
+from src.models.persistence import read_model, write_model
+from src.utils.image_processor import ImageProcessor, WHITE_THRESHOLD
+from src.utils.packed_patterns import PackedPatterns
+from src.utils.validators import ValidationError
+
+logger = logging.getLogger(__name__)
+
+CACHE_KIND = 'decoded_patterns'
+CACHE_EXTENSION = '.patterns'
+
+PathLike = Union[str, Path]
+
+# Identidad de una imagen en la caché: (ruta absoluta, mtime en ns, tamaño)
+FileKey = Tuple[str, int, int]
+
+
+def find_image_files(source: PathLike) -> List[str]:
+    """
+    Lista las imágenes de un directorio, de un patrón glob o un archivo.
+
+    Args:
+        source: Directorio, patrón glob (por ejemplo 'data/*/*.png') o
+            ruta de una imagen.
+
+    Returns:
+        Rutas de las imágenes con extensión soportada, ordenadas.
+
+    Raises:
+        ValidationError: Si source es una ruta (sin comodines) que no existe.
+    """
+    source = str(source)
+    if os.path.isdir(source):
+        with os.scandir(source) as entries:
+            paths = [entry.path for entry in entries if entry.is_file()]
+    elif glob.has_magic(source):
+        paths = [path for path in glob.glob(source) if os.path.isfile(path)]
+    elif os.path.exists(source):
+        paths = [source]
+    else:
+        raise ValidationError(f"El archivo no existe: {source}")
+
+    return sorted(
+        path for path in paths
+        if Path(path).suffix.lower().lstrip('.') in config.image.SUPPORTED_FORMATS
+    )
+
+
+def cache_path_for(
+    source: PathLike,
+    directory: Optional[PathLike] = None,
+    size: Optional[Tuple[int, int]] = None
+) -> Path:
+    """
+    Ruta por defecto del archivo de caché de un directorio o patrón glob.
+
+    Args:
+        source: Directorio o patrón glob que se carga.
+        directory: Directorio de cachés (usa config si es None).
+        size: Tamaño de los patrones; cada tamaño usa su propio archivo
+            (usa config si es None).
+
+    Returns:
+        Ruta del archivo de caché, derivada de la ruta absoluta de source
+        y del tamaño.
+    """
+    if directory is None:
+        directory = config.image.PATTERN_CACHE_DIR
+    if size is None:
+        size = config.image.size
+    key = f"{os.path.abspath(str(source))}:{size[0]}x{size[1]}"
+    digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+    return Path(directory) / f"{digest[:32]}{CACHE_EXTENSION}"
+
+
+def load_patterns(
+    source: PathLike,
+    cache_path: Optional[PathLike] = None,
+    n_workers: Optional[int] = None,
+    validate: bool = True,
+    packed: bool = False,
+    size: Optional[Tuple[int, int]] = None,
+    resample: bool = False,
+    threshold: Optional[float] = None
+) -> Tuple[List[str], Union[np.ndarray, PackedPatterns]]:
+    """
+    Carga todas las imágenes de un directorio o patrón glob.
+
+    Args:
+        source: Directorio, patrón glob o ruta de una imagen.
+        cache_path: Archivo de caché de patrones decodificados (None para
+            no usar caché). Se crea o actualiza si alguna imagen cambió.
+        n_workers: Hilos de decodificación (None para os.cpu_count()).
+        validate: Si True, valida cada imagen decodificada.
+        packed: Si True, retorna PackedPatterns (sobre el archivo mapeado
+            si la caché estaba al día) en lugar de patrones ±1.
+        size: Tamaño del patrón (ancho, alto). Si es None, usa config.
+        resample: Si True, lleva cada imagen a size promediando por área
+            (ver ImageProcessor.load_pattern).
+        threshold: Umbral de binarización (WHITE_THRESHOLD si es None).
+
+    Returns:
+        Tupla (rutas ordenadas, patrones (n_imágenes, n_neurons) con tipo
+        config.network.STATE_DTYPE, o PackedPatterns si packed=True).
+
+    Raises:
+        ValidationError: Si source no existe o alguna imagen no es válida;
+            el mensaje incluye todas las imágenes con error.
+    """
+    options = {
+        'pattern_size': list(size if size is not None else config.image.size),
+        'resample': resample,
+        'threshold': threshold if threshold is not None else WHITE_THRESHOLD
+    }
+    paths = find_image_files(source)
+    keys = [_file_key(path) for path in paths]
+
+    cached = _read_cache(cache_path, options) if cache_path is not None else None
+    if cached is not None and [tuple(entry) for entry in cached[0]] == keys:
+        logger.debug(f"Patrones cargados de la caché: {cache_path}")
+        library = cached[1]
+    else:
+        library = _decode(paths, keys, cached, n_workers, validate, options)
+        if cache_path is not None:
+            _write_cache(cache_path, keys, library, options)
+
+    logger.info(f"Cargados {len(paths)} patrones de {source}")
+    if packed:
+        return paths, library
+    return paths, library.to_patterns(config.network.STATE_DTYPE)
+
+
+def _file_key(path: str) -> FileKey:
+    """Identidad de una imagen: ruta absoluta, mtime y tamaño."""
+    info = os.stat(path)
+    return (os.path.abspath(path), info.st_mtime_ns, info.st_size)
+
+
+def _decode(
+    paths: List[str],
+    keys: List[FileKey],
+    cached: Optional[Tuple[List[list], PackedPatterns]],
+    n_workers: Optional[int],
+    validate: bool,
+    options: Dict
+) -> PackedPatterns:
+    """Decodifica las imágenes que no están al día en la caché."""
+    width, height = options['pattern_size']
+    n_neurons = width * height
+    n_bytes = -(-n_neurons // 64) * 8
+    bits = np.zeros((len(paths), n_bytes), dtype=np.uint8)
+
+    rows: Dict[FileKey, int] = {}
+    if cached is not None:
+        rows = {tuple(entry): row for row, entry in enumerate(cached[0])}
+
+    pending = []
+    for index, key in enumerate(keys):
+        row = rows.get(key)
+        if row is None:
+            pending.append(index)
+        else:
+            bits[index] = cached[1].bits[row]
+
+    def decode(index: int) -> Optional[str]:
+        try:
+            pattern = ImageProcessor.load_pattern(
+                paths[index],
+                validate=validate,
+                size=(width, height),
+                resample=options['resample'],
+                threshold=options['threshold']
+            )
+            bits[index] = PackedPatterns.from_patterns(pattern).bits[0]
+        except (ValidationError, IOError, ValueError) as e:
+            return f"{paths[index]}: {e}"
+        return None
+
+    if pending:
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=max(1, min(n_workers, len(pending)))) as pool:
+            errors = [error for error in pool.map(decode, pending) if error]
+        if errors:
+            raise ValidationError(
+                f"{len(errors)} imágenes no válidas:\n" + '\n'.join(errors)
+            )
+        logger.info(f"Decodificadas {len(pending)} de {len(paths)} imágenes")
+
+    return PackedPatterns(bits, n_neurons)
+
+
+def _read_cache(
+    cache_path: PathLike,
+    options: Dict
+) -> Optional[Tuple[List[list], PackedPatterns]]:
+    """Abre la caché con mmap (None si no existe o se decodificó con otras opciones)."""
+    if not os.path.exists(cache_path):
+        return None
+
+    try:
+        metadata, arrays = read_model(cache_path, mmap_mode='r')
+        if metadata.get('kind') != CACHE_KIND or any(
+            metadata.get(name) != value for name, value in options.items()
+        ):
+            return None
+        return metadata['files'], PackedPatterns(arrays['bits'], metadata['n_neurons'])
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Caché de patrones inválida, se ignora: {cache_path} ({e})")
+        return None
+
+
+def _write_cache(
+    cache_path: PathLike,
+    keys: List[FileKey],
+    library: PackedPatterns,
+    options: Dict
+) -> None:
+    """Escribe la caché de patrones decodificados (de forma atómica)."""
+    metadata = dict(
+        options,
+        kind=CACHE_KIND,
+        n_neurons=library.n_neurons,
+        files=[list(key) for key in keys]
+    )
+    try:
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        write_model(cache_path, metadata, {'bits': library.bits})
+    except OSError as e:
+        logger.warning(f"No se pudo guardar la caché de patrones: {e}")
@@ -5,7 +5,9 @@ Módulo simple con validaciones esenciales.
 """
 
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, Iterable, Tuple, Union
+import os
+import stat
 import numpy as np
 from PIL import Image
 
@@ -17,6 +19,26 @@ class ValidationError(Exception):
     pass
 
 
+def validate_image_format(image_path: Union[str, Path]) -> None:
+    """
+    Valida que la extensión de un archivo sea un formato soportado.
+
+    No accede al sistema de archivos.
+
+    Args:
+        image_path: Ruta del archivo de imagen.
+
+    Raises:
+        ValidationError: Si el formato no es soportado.
+    """
+    extension = Path(image_path).suffix.lower().lstrip('.')
+    if extension not in config.image.SUPPORTED_FORMATS:
+        raise ValidationError(
+            f"Formato no soportado: {extension}. "
+            f"Formatos válidos: {', '.join(config.image.SUPPORTED_FORMATS)}"
+        )
+
+
 def validate_image_file(image_path: str) -> None:
     """
     Valida que un archivo de imagen existe y es del formato correcto.
@@ -27,22 +49,88 @@ def validate_image_file(image_path: str) -> None:
     Raises:
         ValidationError: Si el archivo no es válido.
     """
-    path = Path(image_path)
-
-    if not path.exists():
+    # Una sola llamada a stat cubre existencia y tipo de archivo
+    try:
+        mode = os.stat(image_path).st_mode
+    except FileNotFoundError:
         raise ValidationError(f"El archivo no existe: {image_path}")
 
-    if not path.is_file():
+    if not stat.S_ISREG(mode):
         raise ValidationError(f"La ruta no es un archivo: {image_path}")
 
-    extension = path.suffix.lower().lstrip('.')
-    if extension not in config.image.SUPPORTED_FORMATS:
+    validate_image_format(image_path)
+
+
+def check_image_size(
+    img: Image.Image,
+    expected_size: Tuple[int, int] = None
+) -> None:
+    """
+    Valida el tamaño de una imagen ya abierta.
+
+    Image.open solo lee la cabecera, así que comprobar el tamaño no
+    decodifica los píxeles.
+
+    Args:
+        img: Imagen de PIL.
+        expected_size: Tamaño esperado (ancho, alto). Si es None, usa config.
+
+    Raises:
+        ValidationError: Si el tamaño no coincide.
+    """
+    if expected_size is None:
+        expected_size = config.image.size
+
+    if img.size != tuple(expected_size):
         raise ValidationError(
-            f"Formato no soportado: {extension}. "
-            f"Formatos válidos: {', '.join(config.image.SUPPORTED_FORMATS)}"
+            f"Tamaño incorrecto. Esperado: {expected_size[0]}x{expected_size[1]}, "
+            f"Actual: {img.size[0]}x{img.size[1]}"
         )
 
 
+def open_image(
+    image_path: Union[str, Path],
+    expected_size: Tuple[int, int] = None,
+    check_size: bool = True
+) -> Image.Image:
+    """
+    Abre una imagen validando formato, existencia y tamaño.
+
+    La misma apertura sirve para validar y para decodificar: el llamador
+    recibe la imagen abierta (sin decodificar) y debe cerrarla.
+
+    Args:
+        image_path: Ruta de la imagen.
+        expected_size: Tamaño esperado (ancho, alto). Si es None, usa config.
+        check_size: Si False, acepta cualquier tamaño (la imagen se
+            remuestreará al decodificarla).
+
+    Returns:
+        Imagen de PIL abierta.
+
+    Raises:
+        ValidationError: Si la imagen no es válida.
+    """
+    validate_image_format(image_path)
+
+    try:
+        img = Image.open(image_path)
+    except FileNotFoundError:
+        raise ValidationError(f"El archivo no existe: {image_path}")
+    except IsADirectoryError:
+        raise ValidationError(f"La ruta no es un archivo: {image_path}")
+    except IOError as e:
+        raise ValidationError(f"Error al abrir imagen: {e}")
+
+    if check_size:
+        try:
+            check_image_size(img, expected_size)
+        except ValidationError:
+            img.close()
+            raise
+    return img
+
+
 def validate_image_size(
     image_path: str,
     expected_size: Tuple[int, int] = None
@@ -57,20 +145,76 @@ def validate_image_size(
     Raises:
         ValidationError: Si el tamaño no coincide.
     """
-    if expected_size is None:
-        expected_size = config.image.size
-
     try:
         with Image.open(image_path) as img:
-            if img.size != expected_size:
-                raise ValidationError(
-                    f"Tamaño incorrecto. Esperado: {expected_size[0]}x{expected_size[1]}, "
-                    f"Actual: {img.size[0]}x{img.size[1]}"
-                )
+            check_image_size(img, expected_size)
     except IOError as e:
         raise ValidationError(f"Error al abrir imagen: {e}")
 
 
+def validate_image_files(
+    image_paths: Iterable[Union[str, Path]],
+    expected_size: Tuple[int, int] = None
+) -> Dict[str, str]:
+    """
+    Valida un lote de imágenes leyendo solo sus cabeceras.
+
+    A diferencia de las demás validaciones, no se detiene en el primer
+    error: revisa todos los archivos y reporta cada uno que no es válido.
+
+    Args:
+        image_paths: Rutas de las imágenes.
+        expected_size: Tamaño esperado (ancho, alto). Si es None, usa config.
+
+    Returns:
+        Diccionario {ruta: mensaje de error} con los archivos inválidos
+        (vacío si todos son válidos).
+    """
+    errors = {}
+    for path in image_paths:
+        try:
+            with open_image(path, expected_size):
+                pass
+        except ValidationError as e:
+            errors[str(path)] = str(e)
+    return errors
+
+
+def validate_image_directory(
+    directory: Union[str, Path],
+    expected_size: Tuple[int, int] = None
+) -> Dict[str, str]:
+    """
+    Valida todas las imágenes de un directorio leyendo solo sus cabeceras.
+
+    Se consideran los archivos con extensión de SUPPORTED_FORMATS; el
+    listado usa os.scandir, que obtiene el tipo de cada entrada sin un
+    stat adicional por archivo.
+
+    Args:
+        directory: Directorio con imágenes.
+        expected_size: Tamaño esperado (ancho, alto). Si es None, usa config.
+
+    Returns:
+        Diccionario {ruta: mensaje de error} con los archivos inválidos
+        (vacío si todos son válidos).
+
+    Raises:
+        ValidationError: Si el directorio no existe.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            paths = sorted(
+                entry.path for entry in entries
+                if entry.is_file()
+                and Path(entry.name).suffix.lower().lstrip('.') in config.image.SUPPORTED_FORMATS
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        raise ValidationError(f"El directorio no existe: {directory}")
+
+    return validate_image_files(paths, expected_size)
+
+
 def validate_pattern(pattern: np.ndarray, expected_size: int = None) -> None:
     """
     Valida que un patrón tenga el formato correcto.
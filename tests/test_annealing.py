@@ -0,0 +1,49 @@
+"""
+Tests para los programas de recocido.
+"""
+
+import unittest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Agregar directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.annealing import annealing_schedule
+
+
+class TestAnnealingSchedule(unittest.TestCase):
+    """Tests para annealing_schedule."""
+
+    def test_named_schedules(self):
+        """Test de los programas predefinidos."""
+        geometric = annealing_schedule('geometric', 5, 1.0, 0.01)
+        linear = annealing_schedule('linear', 3, 1.0, 0.0)
+        constant = annealing_schedule('constant', 4, 0.5, 0.1)
+
+        np.testing.assert_allclose(geometric, [1.0, 0.316228, 0.1, 0.031623, 0.01], rtol=1e-5)
+        np.testing.assert_allclose(linear, [1.0, 0.5, 0.0])
+        np.testing.assert_allclose(constant, [0.5] * 4)
+
+    def test_custom_schedules(self):
+        """Test de programas dados como secuencia o función."""
+        np.testing.assert_allclose(annealing_schedule([0.4, 0.2], 10, 1, 1), [0.4, 0.2])
+        np.testing.assert_allclose(
+            annealing_schedule(lambda k: 1.0 / (k + 1), 3, 1, 1), [1.0, 0.5, 1 / 3]
+        )
+
+    def test_invalid_schedules_raise_error(self):
+        """Test que se rechazan programas inválidos."""
+        with self.assertRaises(ValueError):
+            annealing_schedule('cubic', 5, 1.0, 0.1)
+        with self.assertRaises(ValueError):
+            annealing_schedule('geometric', 5, 1.0, 0.0)
+        with self.assertRaises(ValueError):
+            annealing_schedule([0.5, -0.1], 2, 1.0, 0.1)
+        with self.assertRaises(ValueError):
+            annealing_schedule([], 2, 1.0, 0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
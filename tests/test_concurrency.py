@@ -0,0 +1,113 @@
+"""
+Tests de concurrencia: predicciones simultáneas sobre la misma red.
+"""
+
+import unittest
+import numpy as np
+import tempfile
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Agregar directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.hopfield_network import HopfieldNetwork
+from src.models.convergence import CycleDetection, EnergyPlateau, StoredPatternMatch
+from src.models.prediction_cache import PredictionCache
+from src.models.schedulers import RandomPermutationScheduler
+
+N_THREADS = 8
+N_CALLS = 200
+
+
+class TestConcurrentInference(unittest.TestCase):
+    """Tests de inferencia concurrente con un pool de hilos."""
+
+    def setUp(self):
+        """Configura patrones y entradas corruptas."""
+        rng = np.random.default_rng(0)
+        self.patterns = rng.choice([-1, 1], size=(10, 400))
+        self.inputs = self.patterns[rng.integers(0, 10, size=N_CALLS)].copy()
+        for row in self.inputs:
+            row[rng.choice(400, rng.integers(40, 160), replace=False)] *= -1
+
+    def _hammer(self, function):
+        """Ejecuta function sobre todas las entradas con N_THREADS hilos."""
+        with ThreadPoolExecutor(max_workers=N_THREADS) as pool:
+            return list(pool.map(function, self.inputs))
+
+    def test_async_predict_matches_sequential(self):
+        """Test que el estado por llamada no se mezcla entre hilos."""
+        criterion = StoredPatternMatch() | (CycleDetection() & EnergyPlateau(patience=2))
+        network = HopfieldNetwork(
+            (20, 20), convergence=criterion,
+            scheduler=RandomPermutationScheduler(seed=4)
+        )
+        network.train(self.patterns)
+
+        expected = [network.predict(row, return_info=True) for row in self.inputs]
+        results = self._hammer(lambda row: network.predict(row, return_info=True))
+
+        for (state, info), (expected_state, expected_info) in zip(results, expected):
+            np.testing.assert_array_equal(state, expected_state)
+            self.assertEqual(info, expected_info)
+
+    def test_convergence_checker_history_is_per_call(self):
+        """Test que el historial publicado corresponde a una sola llamada."""
+        network = HopfieldNetwork((20, 20))
+        network.train(self.patterns)
+
+        results = self._hammer(lambda row: network.predict(row, return_info=True))
+        sync_results = self._hammer(lambda row: network.predict_sync(row, return_info=True))
+
+        history = network.convergence_checker.get_history()
+        lengths = {info['iterations'] for _, info in results + sync_results}
+        self.assertIn(len(history), lengths)
+        for state, info in results:
+            self.assertEqual(info['reason'], 'threshold')
+
+    def test_lazy_checkpoint_builds_weights_once(self):
+        """Test que los pesos de un checkpoint se reconstruyen una sola vez."""
+        network = HopfieldNetwork((20, 20), learning_rule='storkey')
+        network.train(self.patterns)
+        expected = network.predict_batch(self.inputs)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'checkpoint.hopfield'
+            network.save(path, compact=True)
+            loaded = HopfieldNetwork.load(path)
+
+        builds = []
+        build_storage = loaded._build_storage
+
+        def counting_build(patterns):
+            builds.append(1)
+            return build_storage(patterns)
+
+        loaded._build_storage = counting_build
+        results = self._hammer(loaded.predict)
+
+        self.assertEqual(len(builds), 1)
+        np.testing.assert_array_equal(np.array(results), expected)
+
+    def test_prediction_cache_counters(self):
+        """Test que los contadores de la caché cuadran bajo concurrencia."""
+        network = HopfieldNetwork((20, 20))
+        network.train(self.patterns)
+        cache = PredictionCache()
+
+        results = self._hammer(lambda row: cache.predict(network, row))
+        results += self._hammer(lambda row: cache.predict(network, row))
+
+        stats = cache.stats()
+        served = stats['hits'] + stats['stored_hits'] + stats['misses']
+        self.assertEqual(served, 2 * N_CALLS)
+        self.assertLessEqual(stats['misses'], N_CALLS)
+        np.testing.assert_array_equal(
+            np.array(results[:N_CALLS]), network.predict_batch(self.inputs)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Tests para los criterios de convergencia.
+"""
+
+import unittest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Agregar directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.hopfield_network import HopfieldNetwork
+from src.models.convergence import (
+    AllOf,
+    AnyOf,
+    CycleDetection,
+    EnergyPlateau,
+    FlipThreshold,
+    StoredPatternMatch,
+    ZeroFlips,
+)
+
+
+class TestConvergenceCriteria(unittest.TestCase):
+    """Tests para los criterios de convergencia."""
+
+    def setUp(self):
+        """Configura una red entrenada y un patrón corrupto."""
+        rng = np.random.default_rng(0)
+        self.patterns = rng.choice([-1, 1], size=(4, 100))
+        self.corrupted = self.patterns[2].copy()
+        self.corrupted[rng.choice(100, 15, replace=False)] *= -1
+
+    def _network(self, criterion):
+        network = HopfieldNetwork((10, 10), convergence=criterion)
+        network.train(self.patterns)
+        return network
+
+    def test_criteria_reach_same_fixed_point(self):
+        """Test que los criterios básicos reconstruyen el mismo patrón."""
+        reference = self._network(None).predict(self.corrupted)
+
+        for criterion in (ZeroFlips(), FlipThreshold(0), EnergyPlateau()):
+            result = self._network(criterion).predict(self.corrupted)
+            np.testing.assert_array_equal(result, reference)
+
+    def test_stored_pattern_match_stops_early(self):
+        """Test que la coincidencia exacta detiene la predicción."""
+        criterion = StoredPatternMatch()
+        network = self._network(criterion)
+
+        result, history = network.predict(self.corrupted, return_history=True)
+
+        np.testing.assert_array_equal(result, self.patterns[2])
+        self.assertEqual(criterion.matched, 2)
+        self.assertEqual(criterion.reason, 'stored_pattern')
+        # El patrón se alcanza en el primer barrido, sin un barrido extra
+        self.assertEqual(len(history), 2)
+
+    def test_composition_reports_reason(self):
+        """Test que las combinaciones informan qué criterio se cumplió."""
+        any_criterion = StoredPatternMatch() | FlipThreshold(1000)
+        self._network(any_criterion).predict(self.corrupted)
+        self.assertIsInstance(any_criterion, AnyOf)
+        self.assertEqual(any_criterion.reason, 'stored_pattern')
+
+        all_criterion = StoredPatternMatch() & ZeroFlips()
+        network = self._network(all_criterion)
+        _, history = network.predict(self.corrupted, return_history=True)
+        self.assertIsInstance(all_criterion, AllOf)
+        self.assertEqual(all_criterion.reason, 'stored_pattern & zero_flips')
+        self.assertEqual(len(history), 3)
+
+    def test_energy_plateau_patience(self):
+        """Test que la meseta exige barridos consecutivos."""
+        criterion = EnergyPlateau(tolerance=0.5, patience=2)
+        criterion.start(None, np.ones(4), energy=0.0)
+
+        self.assertFalse(criterion.end_sweep(3, -1.0))
+        self.assertFalse(criterion.end_sweep(1, -1.2))
+        self.assertTrue(criterion.end_sweep(0, -1.2))
+
+    def test_cycle_detection_hash(self):
+        """Test que el hash incremental detecta un estado repetido."""
+        criterion = CycleDetection()
+        state = np.array([1, -1, 1, -1])
+        criterion.start(None, state, energy=0.0)
+
+        criterion.on_flip(0, -1)
+        self.assertFalse(criterion.end_sweep(1, 0.0))
+        criterion.on_flip(0, 1)
+        self.assertTrue(criterion.end_sweep(1, 0.0))
+        self.assertEqual(criterion.reason, 'cycle')
+
+    def test_convergence_checker_history_from_flips(self):
+        """Test que el verificador por umbral registra el cambio por barrido."""
+        network = self._network(None)
+        _, history = network.predict(self.corrupted, return_history=True)
+
+        changes = network.convergence_checker.get_history()
+        expected = [
+            np.sum(np.abs(after - before)) / 100
+            for before, after in zip(history, history[1:])
+        ]
+        np.testing.assert_allclose(changes, expected)
+
+    def test_invalid_parameters_raise_error(self):
+        """Test que se validan los parámetros."""
+        with self.assertRaises(ValueError):
+            FlipThreshold(-1)
+        with self.assertRaises(ValueError):
+            EnergyPlateau(patience=0)
+        with self.assertRaises(ValueError):
+            AnyOf()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Tests para la reconstrucción por conjunto de reinicios.
+"""
+
+import unittest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Agregar directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.hopfield_network import HopfieldNetwork
+from src.models.ensemble import attach_network, release_shared, share_network
+
+
+class TestEnsemble(unittest.TestCase):
+    """Tests para predict_ensemble."""
+
+    def setUp(self):
+        """Configura una red entrenada y un patrón corrupto."""
+        rng = np.random.default_rng(0)
+        self.patterns = rng.choice([-1, 1], size=(12, 144))
+        self.corrupted = self.patterns[5].copy()
+        self.corrupted[rng.choice(144, 50, replace=False)] *= -1
+
+    def _network(self, **kwargs):
+        network = HopfieldNetwork((12, 12), **kwargs)
+        network.train(self.patterns)
+        return network
+
+    def test_pool_matches_in_process(self):
+        """Test que el pool de procesos da el mismo resultado que en serie."""
+        for kwargs in ({}, {'weight_mode': 'sparse', 'density': 0.5}):
+            network = self._network(**kwargs)
+            serial, serial_info = network.predict_ensemble(
+                self.corrupted, n_restarts=4, n_workers=1, seed=7,
+                perturbation=0.05, return_info=True
+            )
+            pooled, pooled_info = network.predict_ensemble(
+                self.corrupted, n_restarts=4, n_workers=2, seed=7,
+                perturbation=0.05, return_info=True
+            )
+            np.testing.assert_array_equal(serial, pooled)
+            np.testing.assert_array_equal(
+                serial_info['results'], pooled_info['results']
+            )
+
+    def test_energy_vote_returns_lowest_energy(self):
+        """Test que el voto por energía elige el reinicio de menor energía."""
+        network = self._network()
+        state, info = network.predict_ensemble(
+            self.corrupted, n_restarts=6, n_workers=1, seed=1,
+            perturbation=0.1, return_info=True
+        )
+
+        best = int(np.argmin(info['energies']))
+        np.testing.assert_array_equal(state, info['results'][best])
+        self.assertAlmostEqual(info['energies'][best], network.energy(state))
+        self.assertGreater(info['agreement'], 0)
+        self.assertLessEqual(info['unique_results'], 6)
+
+    def test_majority_vote(self):
+        """Test que el voto por mayoría se calcula por neurona."""
+        network = self._network()
+        state, info = network.predict_ensemble(
+            self.corrupted, n_restarts=5, vote='majority', n_workers=1,
+            seed=2, perturbation=0.2, return_info=True
+        )
+
+        expected = np.where(info['results'].sum(axis=0) > 0, 1, -1)
+        np.testing.assert_array_equal(state, expected)
+        self.assertGreaterEqual(info['neuron_agreement'], 0.5)
+
+    def test_shared_network_is_read_only(self):
+        """Test que la red adjuntada usa los pesos compartidos sin copiarlos."""
+        network = self._network()
+        spec, handles = share_network(network)
+        try:
+            attached, attached_handles = attach_network(spec)
+            np.testing.assert_array_equal(
+                attached.get_weights(), network.get_weights()
+            )
+            np.testing.assert_array_equal(
+                attached.predict(self.corrupted), network.predict(self.corrupted)
+            )
+            self.assertFalse(attached._storage.matrix.flags.writeable)
+            for block in attached_handles:
+                block.close()
+        finally:
+            release_shared(handles)
+
+    def test_invalid_parameters_raise_error(self):
+        """Test que se validan los parámetros."""
+        network = self._network()
+        with self.assertRaises(ValueError):
+            network.predict_ensemble(self.corrupted, n_restarts=0)
+        with self.assertRaises(ValueError):
+            network.predict_ensemble(self.corrupted, method='parallel_tempering')
+        with self.assertRaises(ValueError):
+            network.predict_ensemble(self.corrupted, vote='median')
+        with self.assertRaises(ValueError):
+            network.predict_ensemble(self.corrupted, perturbation=1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
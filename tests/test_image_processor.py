@@ -7,12 +7,14 @@ import numpy as np
 import tempfile
 import sys
 from pathlib import Path
+from unittest import mock
 from PIL import Image
 
 # Agregar directorio raíz al path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.image_processor import ImageProcessor
+from src.utils.validators import ValidationError
 from src.config.settings import config
 
 
@@ -61,6 +63,33 @@ class TestImageProcessor(unittest.TestCase):
 
         self.assertEqual(len(pattern), config.image.total_pixels)
 
+    def test_load_pattern_dtype(self):
+        """Test que el patrón usa el tipo de estado configurado."""
+        path = self.create_test_image('test.png')
+
+        pattern = ImageProcessor.load_pattern(path)
+
+        self.assertEqual(pattern.dtype, np.dtype(config.network.STATE_DTYPE))
+
+    def test_load_pattern_opens_once(self):
+        """Test que validar y decodificar usan una sola apertura."""
+        path = self.create_test_image('once.png')
+
+        with mock.patch('src.utils.validators.Image.open', wraps=Image.open) as opened:
+            ImageProcessor.load_pattern(path, validate=True)
+
+        self.assertEqual(opened.call_count, 1)
+
+    def test_load_pattern_invalid(self):
+        """Test que validate=True rechaza archivos inexistentes y tamaños incorrectos."""
+        with self.assertRaises(ValidationError):
+            ImageProcessor.load_pattern(str(Path(self.temp_dir) / 'missing.png'))
+
+        path = Path(self.temp_dir) / 'small.png'
+        Image.new('RGBA', (10, 10)).save(path)
+        with self.assertRaises(ValidationError):
+            ImageProcessor.load_pattern(str(path))
+
     def test_load_multiple_patterns(self):
         """Test carga de múltiples patrones."""
         paths = [
@@ -81,6 +110,108 @@ class TestImageProcessor(unittest.TestCase):
         self.assertEqual(img.size, config.image.size)
         self.assertEqual(img.mode, 'RGBA')
 
+    def test_load_pattern_near_white_threshold(self):
+        """Test que R + G + B > 600 es blanco y el resto negro."""
+        pixels = np.zeros((config.image.HEIGHT, config.image.WIDTH, 3), dtype=np.uint8)
+        pixels[0, 0] = (201, 201, 201)
+        pixels[0, 1] = (200, 200, 200)
+        pixels[0, 2] = (255, 255, 91)
+        path = Path(self.temp_dir) / 'gray.png'
+        Image.fromarray(pixels, 'RGB').save(path)
+
+        pattern = ImageProcessor.load_pattern(str(path))
+
+        np.testing.assert_array_equal(pattern[:3], [1, -1, 1])
+        self.assertTrue(np.all(pattern[3:] == -1))
+
+    def test_load_pattern_grayscale(self):
+        """Test que las imágenes en gris usan el mismo umbral que RGB."""
+        gray = np.full((config.image.HEIGHT, config.image.WIDTH), 200, dtype=np.uint8)
+        gray[:, :10] = 201
+        path = Path(self.temp_dir) / 'gray_l.png'
+        Image.fromarray(gray, 'L').save(path)
+
+        pattern = ImageProcessor.load_pattern(str(path))
+
+        expected = np.where(gray > 200, 1, -1).ravel()
+        np.testing.assert_array_equal(pattern, expected)
+
+    def test_pattern_image_round_trip(self):
+        """Test que guardar y volver a cargar conserva el patrón."""
+        pattern = ImageProcessor.corrupt_pattern(
+            np.ones(config.image.total_pixels, dtype=np.int8), 0.5, seed=3
+        )
+        path = str(Path(self.temp_dir) / 'round_trip.png')
+
+        img = ImageProcessor.pattern_to_image(pattern, save_path=path)
+
+        self.assertIn(img.getpixel((0, 0)), (config.image.WHITE_PIXEL, config.image.BLACK_PIXEL))
+        np.testing.assert_array_equal(ImageProcessor.load_pattern(path), pattern)
+
+    def test_pattern_to_image_one_bit(self):
+        """Test salida en PNG de 1 bit."""
+        pattern = ImageProcessor.corrupt_pattern(
+            np.ones(config.image.total_pixels, dtype=np.int8), 0.3, seed=4
+        )
+        path = str(Path(self.temp_dir) / 'one_bit.png')
+
+        ImageProcessor.pattern_to_image(pattern, save_path=path, one_bit=True)
+
+        with Image.open(path) as img:
+            self.assertEqual(img.mode, '1')
+            self.assertEqual(img.size, config.image.size)
+        np.testing.assert_array_equal(ImageProcessor.load_pattern(path), pattern)
+
+    def test_pattern_to_image_wrong_size(self):
+        """Test que un patrón de tamaño incorrecto es rechazado."""
+        with self.assertRaises(ValueError):
+            ImageProcessor.pattern_to_image(np.ones(10))
+
+    def test_resample_brightness_integer_factor(self):
+        """Test que reducir por un factor entero promedia cada bloque."""
+        brightness = np.arange(24, dtype=np.uint16).reshape(4, 6)
+
+        resampled = ImageProcessor.resample_brightness(brightness, (3, 2))
+
+        expected = brightness.reshape(2, 2, 3, 2).mean(axis=(1, 3))
+        np.testing.assert_allclose(resampled, expected)
+
+    def test_resample_brightness_fractional_factor(self):
+        """Test del promedio por área con un factor no entero."""
+        rng = np.random.default_rng(0)
+        brightness = rng.integers(0, 766, size=(7, 5)).astype(np.uint16)
+
+        resampled = ImageProcessor.resample_brightness(brightness, (2, 3))
+
+        # Referencia: sobremuestrear a una malla común y promediar bloques
+        fine = np.kron(brightness.astype(float), np.ones((3, 2)))
+        expected = fine.reshape(3, 7, 2, 5).mean(axis=(1, 3))
+        np.testing.assert_allclose(resampled, expected)
+
+    def test_load_pattern_resample(self):
+        """Test que una imagen más grande se lleva al tamaño de la red."""
+        small = (22, 30)
+        pattern = ImageProcessor.corrupt_pattern(
+            np.ones(small[0] * small[1], dtype=np.int8), 0.5, seed=5
+        )
+        path = str(Path(self.temp_dir) / 'large.png')
+        ImageProcessor.pattern_to_image(pattern, size=small).resize(
+            (small[0] * 5, small[1] * 5), Image.NEAREST
+        ).save(path)
+
+        with self.assertRaises(ValidationError):
+            ImageProcessor.load_pattern(path, size=small)
+        resampled = ImageProcessor.load_pattern(path, size=small, resample=True)
+
+        np.testing.assert_array_equal(resampled, pattern)
+
+    def test_load_pattern_threshold(self):
+        """Test del umbral de binarización configurable."""
+        path = self.create_test_image('gray.png', (120, 120, 120, 255))
+
+        self.assertTrue(np.all(ImageProcessor.load_pattern(path) == -1))
+        self.assertTrue(np.all(ImageProcessor.load_pattern(path, threshold=300) == 1))
+
     def test_corrupt_pattern(self):
         """Test corrupción de patrón."""
         pattern = np.ones(100)
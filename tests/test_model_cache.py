@@ -0,0 +1,135 @@
+"""
+Tests para la caché de redes entrenadas.
+"""
+
+import unittest
+import numpy as np
+import os
+import tempfile
+import sys
+from pathlib import Path
+
+# Agregar directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.model_cache import ModelCache, model_key
+
+
+class TestModelCache(unittest.TestCase):
+    """Tests para ModelCache."""
+
+    def setUp(self):
+        """Configura patrones y un directorio temporal."""
+        rng = np.random.default_rng(0)
+        self.patterns = rng.choice([-1, 1], size=(4, 120))
+        self.other_patterns = rng.choice([-1, 1], size=(4, 120))
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Limpia archivos temporales."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_memory_hit_returns_same_network(self):
+        """Test que los mismos patrones y opciones no reentrenan."""
+        cache = ModelCache()
+        first = cache.get_or_train(self.patterns, (10, 12))
+        second = cache.get_or_train(self.patterns.astype(np.int64), (10, 12))
+
+        self.assertIs(first, second)
+        self.assertEqual(first.fingerprint(), model_key(self.patterns, (10, 12)))
+        self.assertTrue(first.is_trained())
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_key_depends_on_patterns_and_options(self):
+        """Test que la clave resuelve los valores por defecto."""
+        key = model_key(self.patterns, (10, 12))
+        self.assertEqual(key, model_key(self.patterns, (10, 12), weight_dtype='float64'))
+        self.assertNotEqual(key, model_key(self.other_patterns, (10, 12)))
+        self.assertNotEqual(key, model_key(self.patterns, (12, 10)))
+        self.assertNotEqual(key, model_key(self.patterns, (10, 12), learning_rule='storkey'))
+
+    def test_lru_eviction(self):
+        """Test que se descarta la red usada hace más tiempo."""
+        cache = ModelCache(max_entries=2)
+        cache.get_or_train(self.patterns, (10, 12))
+        cache.get_or_train(self.other_patterns, (10, 12))
+        cache.get_or_train(self.patterns, (10, 12))
+        cache.get_or_train(self.patterns, (10, 12), weight_mode='low_rank')
+
+        self.assertEqual(len(cache), 2)
+        self.assertIn(model_key(self.patterns, (10, 12)), cache)
+        self.assertNotIn(model_key(self.other_patterns, (10, 12)), cache)
+
+    def test_disk_tier_survives_new_cache(self):
+        """Test que otra instancia carga la red del disco sin entrenar."""
+        trained = ModelCache(directory=self.temp_dir).get_or_train(
+            self.patterns, (10, 12), learning_rule='storkey'
+        )
+
+        cache = ModelCache(directory=self.temp_dir)
+        key = model_key(self.patterns, (10, 12), learning_rule='storkey')
+        self.assertTrue(cache.prewarm(key))
+        loaded = cache.get_or_train(self.patterns, (10, 12), learning_rule='storkey')
+
+        np.testing.assert_array_equal(loaded.get_weights(), trained.get_weights())
+        self.assertEqual(cache.stats()['disk_hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 0)
+
+    def test_disk_tier_is_compact_unless_disabled(self):
+        """Test que por defecto se guardan checkpoints compactos."""
+        key = model_key(self.patterns, (10, 12))
+        ModelCache(directory=self.temp_dir).get_or_train(self.patterns, (10, 12))
+        compact_size = (Path(self.temp_dir) / f"{key}.hopfield").stat().st_size
+        self.assertLess(compact_size, 120 * 120 * 8)
+
+        ModelCache(directory=self.temp_dir).clear(disk=True)
+        ModelCache(directory=self.temp_dir, compact=False).get_or_train(
+            self.patterns, (10, 12)
+        )
+        loaded = ModelCache(directory=self.temp_dir).get(key)
+        self.assertIsInstance(loaded.weights, np.memmap)
+
+    def test_disk_tier_evicts_least_recently_used(self):
+        """Test que el directorio no supera max_disk_entries archivos."""
+        rng = np.random.default_rng(1)
+        keys = []
+        for i in range(3):
+            patterns = rng.choice([-1, 1], size=(4, 120))
+            ModelCache(directory=self.temp_dir, max_disk_entries=2).get_or_train(
+                patterns, (10, 12)
+            )
+            key = model_key(patterns, (10, 12))
+            # Fechas explícitas: el sistema de archivos puede no distinguirlas
+            os.utime(Path(self.temp_dir) / f"{key}.hopfield", ns=(i * 10**9, i * 10**9))
+            keys.append(key)
+
+        files = {path.stem for path in Path(self.temp_dir).glob('*.hopfield')}
+        self.assertEqual(files, set(keys[1:]))
+
+    def test_invalid_disk_entry_is_retrained(self):
+        """Test que un archivo dañado se descarta y se entrena de nuevo."""
+        key = model_key(self.patterns, (10, 12))
+        (Path(self.temp_dir) / f"{key}.hopfield").write_bytes(b'corrupt')
+
+        cache = ModelCache(directory=self.temp_dir)
+        network = cache.get_or_train(self.patterns, (10, 12))
+
+        self.assertTrue(network.is_trained())
+        self.assertEqual(cache.stats()['misses'], 1)
+        self.assertIsNotNone(ModelCache(directory=self.temp_dir).get(key))
+
+    def test_invalid_options_raise_error(self):
+        """Test que se rechazan opciones que no son de entrenamiento."""
+        cache = ModelCache()
+        with self.assertRaises(ValueError):
+            cache.get_or_train(self.patterns, (10, 12), scheduler='random')
+        with self.assertRaises(ValueError):
+            ModelCache(max_entries=0)
+        with self.assertRaises(ValueError):
+            ModelCache(max_disk_entries=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,7 @@ Tests para la Red de Hopfield.
 import unittest
 import numpy as np
 import sys
+import tracemalloc
 from pathlib import Path
 
 # Agregar directorio raíz al path
@@ -12,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.models.hopfield_network import HopfieldNetwork
 from src.models.network_interface import ConvergenceChecker
+from src.models.weight_storage import DenseWeights
 
 
 class TestHopfieldNetwork(unittest.TestCase):
@@ -88,6 +90,585 @@ class TestHopfieldNetwork(unittest.TestCase):
         prediction = self.network.predict(pattern[0], max_iterations=100)
         np.testing.assert_array_equal(prediction, pattern[0])
 
+    def test_predict_matches_neuron_by_neuron_update(self):
+        """Test que el campo incremental reproduce la actualización directa."""
+        rng = np.random.default_rng(0)
+        network = HopfieldNetwork((10, 10))
+
+        for _ in range(20):
+            patterns = rng.choice([-1, 1], size=(int(rng.integers(1, 8)), 100))
+            network.train(patterns)
+
+            corrupted = patterns[0].copy()
+            corrupted[rng.choice(100, 30, replace=False)] *= -1
+
+            # Referencia: W[i]·s recalculado para cada neurona
+            expected = corrupted.copy()
+            for _ in range(50):
+                previous = expected.copy()
+                for i in range(100):
+                    activation = np.dot(network.weights[i], expected)
+                    expected[i] = 1 if activation > 0 else -1
+                if np.sum(np.abs(expected - previous)) / 100 < 0.001:
+                    break
+
+            prediction = network.predict(corrupted, max_iterations=50)
+            np.testing.assert_array_equal(prediction, expected)
+
+    def test_predict_stops_at_fixed_point(self):
+        """Test que un punto fijo termina tras un solo barrido."""
+        pattern = np.array([[1, -1, 1, -1, 1, -1, 1, -1, 1]])
+        network = HopfieldNetwork((3, 3), use_convergence=False)
+        network.train(pattern)
+
+        _, history = network.predict(
+            pattern[0], max_iterations=100, return_history=True
+        )
+
+        # Estado inicial + un barrido sin cambios
+        self.assertEqual(len(history), 2)
+
+    def test_predict_energy_trace_matches_full_energy(self):
+        """Test que la energía incremental coincide con la forma cuadrática."""
+        rng = np.random.default_rng(3)
+        network = HopfieldNetwork((10, 10))
+        patterns = rng.choice([-1, 1], size=(8, 100))
+        network.train(patterns)
+
+        state, history, energies = network.predict(
+            rng.choice([-1, 1], size=100), return_history=True, return_energy=True
+        )
+
+        self.assertEqual(len(energies), len(history))
+        for snapshot, energy in zip(history, energies):
+            self.assertAlmostEqual(energy, network.energy(snapshot), places=9)
+        self.assertTrue(np.all(np.diff(energies) <= 1e-12))
+
+        result = network.predict(state, return_energy=True)
+        self.assertEqual(len(result), 2)
+        np.testing.assert_array_equal(result[0], state)
+
+    def test_energy_requires_training(self):
+        """Test que energy valida la red y el patrón."""
+        with self.assertRaises(ValueError):
+            self.network.energy(np.ones(9))
+
+        self.network.train(np.array([[1, -1, 1, -1, 1, -1, 1, -1, 1]]))
+        with self.assertRaises(ValueError):
+            self.network.energy(np.ones(4))
+
+    def test_predict_stochastic_returns_lowest_energy_replica(self):
+        """Test que el recocido retorna la réplica de menor energía."""
+        rng = np.random.default_rng(4)
+        network = HopfieldNetwork((10, 10))
+        patterns = rng.choice([-1, 1], size=(5, 100))
+        network.train(patterns)
+        corrupted = patterns[0].copy()
+        corrupted[:30] *= -1
+
+        state, info = network.predict_stochastic(
+            corrupted, n_replicas=6, n_sweeps=10, seed=1, return_info=True
+        )
+
+        self.assertEqual(info['replicas'].shape, (6, 100))
+        self.assertEqual(len(info['temperatures']), 10)
+        self.assertAlmostEqual(info['energies'].min(), network.energy(state))
+        np.testing.assert_array_equal(state, info['replicas'][info['best']])
+
+        # Cada réplica termina en un punto fijo y la semilla fija el resultado
+        for replica in info['replicas']:
+            np.testing.assert_array_equal(network.predict(replica), replica)
+        np.testing.assert_array_equal(
+            network.predict_stochastic(corrupted, n_replicas=6, n_sweeps=10, seed=1),
+            state
+        )
+
+    def test_predict_stochastic_zero_temperature(self):
+        """Test que a temperatura cero la dinámica es determinista."""
+        network = HopfieldNetwork((3, 3))
+        pattern = np.array([1, -1, 1, -1, 1, -1, 1, -1, 1])
+        network.train(pattern[np.newaxis])
+
+        result = network.predict_stochastic(pattern, n_replicas=2, schedule=[0.0])
+        np.testing.assert_array_equal(result, pattern)
+
+        with self.assertRaises(ValueError):
+            network.predict_stochastic(pattern, n_replicas=0)
+
+    def test_predict_batch_matches_single_predictions(self):
+        """Test que el lote da el mismo resultado que fila a fila."""
+        rng = np.random.default_rng(1)
+        network = HopfieldNetwork((10, 10))
+        patterns = rng.choice([-1, 1], size=(5, 100))
+        network.train(patterns)
+
+        corrupted = patterns[rng.integers(0, 5, size=8)].copy()
+        for row in corrupted:
+            row[rng.choice(100, 25, replace=False)] *= -1
+
+        batch = network.predict_batch(corrupted, mode='async', max_iterations=50)
+        batch_sync = network.predict_batch(corrupted, mode='sync', max_iterations=50)
+
+        for i, row in enumerate(corrupted):
+            np.testing.assert_array_equal(
+                batch[i], network.predict(row, max_iterations=50)
+            )
+            np.testing.assert_array_equal(
+                batch_sync[i], network.predict_sync(row, max_iterations=50)
+            )
+
+    def test_predict_batch_returns_iterations(self):
+        """Test que se reportan las iteraciones de cada fila."""
+        patterns = np.array([
+            [1, -1, 1, -1, 1, -1, 1, -1, 1],
+            [-1, 1, -1, 1, -1, 1, -1, 1, -1]
+        ])
+        self.network.train(patterns)
+
+        corrupted = np.array([
+            [1, -1, 1, -1, 1, -1, 1, -1, 1],
+            [1, -1, 1, 1, 1, -1, 1, -1, 1]
+        ])
+        result, iterations = self.network.predict_batch(
+            corrupted, max_iterations=100, return_iterations=True
+        )
+
+        self.assertEqual(result.shape, (2, 9))
+        self.assertEqual(iterations.shape, (2,))
+        self.assertEqual(iterations[0], 1)
+        np.testing.assert_array_equal(result[1], patterns[0])
+
+    def test_predict_sync_matches_reference_update(self):
+        """Test que la versión vectorizada reproduce la iteración síncrona."""
+        rng = np.random.default_rng(2)
+        network = HopfieldNetwork((10, 10), use_convergence=False)
+        patterns = rng.choice([-1, 1], size=(12, 100))
+        network.train(patterns)
+        weights = network.get_weights()
+
+        for _ in range(5):
+            pattern = rng.choice([-1, 1], size=100)
+            expected = pattern.copy()
+            for _ in range(31):
+                expected = np.where(np.dot(weights, expected) > 0, 1, -1)
+
+            np.testing.assert_array_equal(
+                network.predict_sync(pattern, max_iterations=31), expected
+            )
+
+    def test_predict_sync_detects_two_cycle(self):
+        """Test que un ciclo de período 2 se detecta sin agotar iteraciones."""
+        network = HopfieldNetwork((1, 2))
+        network.train(np.array([[1, 1]]))
+        start = np.array([1, -1])
+
+        state, info = network.predict_sync(start, max_iterations=100, return_info=True)
+        self.assertEqual(info['status'], 'cycle')
+        self.assertEqual(info['period'], 2)
+        self.assertEqual(info['iterations'], 2)
+        np.testing.assert_array_equal(state, [1, -1])
+
+        # Con un número impar de iteraciones termina en el otro estado
+        odd = network.predict_sync(start, max_iterations=101)
+        np.testing.assert_array_equal(odd, [-1, 1])
+
+        batch, iterations = network.predict_batch(
+            np.array([start, [1, 1]]), mode='sync', max_iterations=101,
+            return_iterations=True
+        )
+        np.testing.assert_array_equal(batch, [[-1, 1], [1, 1]])
+        self.assertEqual(iterations[0], 2)
+
+    def test_predict_sync_reports_fixed_point(self):
+        """Test que se informa el punto fijo alcanzado."""
+        network = HopfieldNetwork((1, 2), use_convergence=False)
+        network.train(np.array([[1, 1]]))
+
+        state, info = network.predict_sync(np.array([1, 1]), return_info=True)
+        self.assertEqual(info['status'], 'fixed_point')
+        self.assertEqual(info['iterations'], 1)
+        self.assertIsNone(info['period'])
+
+    def test_predict_batch_rejects_invalid_input(self):
+        """Test que el lote valida forma y modo."""
+        patterns = np.array([[1, -1, 1, -1, 1, -1, 1, -1, 1]])
+        self.network.train(patterns)
+
+        with self.assertRaises(ValueError):
+            self.network.predict_batch(patterns[0])
+
+        with self.assertRaises(ValueError):
+            self.network.predict_batch(patterns, mode='random')
+
+    def test_low_rank_matches_dense_weights(self):
+        """Test que el modo de bajo rango define la misma matriz de Hebb."""
+        rng = np.random.default_rng(2)
+        patterns = rng.choice([-1, 1], size=(4, 100))
+
+        dense = HopfieldNetwork((10, 10))
+        low_rank = HopfieldNetwork((10, 10), weight_mode='low_rank')
+        dense.train(patterns)
+        low_rank.train(patterns)
+
+        self.assertIsNone(low_rank.weights)
+        np.testing.assert_array_equal(low_rank.get_weights(), dense.get_weights())
+        self.assertAlmostEqual(
+            low_rank.get_training_info()['weights_norm'],
+            dense.get_training_info()['weights_norm']
+        )
+        self.assertLess(
+            low_rank.get_training_info()['weights_nbytes'],
+            dense.get_training_info()['weights_nbytes']
+        )
+
+        corrupted = patterns[1].copy()
+        corrupted[rng.choice(100, 20, replace=False)] *= -1
+        np.testing.assert_array_equal(
+            low_rank.predict(corrupted, max_iterations=50),
+            dense.predict(corrupted, max_iterations=50)
+        )
+
+    def test_invalid_weight_mode_raises_error(self):
+        """Test que un modo de pesos desconocido lanza error."""
+        with self.assertRaises(ValueError):
+            HopfieldNetwork((3, 3), weight_mode='sparse_magic')
+
+    def test_weight_dtypes_share_dynamics(self):
+        """Test que float32 e int16 reconstruyen igual que float64."""
+        rng = np.random.default_rng(3)
+        patterns = rng.choice([-1, 1], size=(5, 100)).astype(np.int8)
+        corrupted = patterns[2].copy()
+        corrupted[rng.choice(100, 20, replace=False)] *= -1
+
+        reference = HopfieldNetwork((10, 10), weight_dtype='float64')
+        reference.train(patterns)
+        expected = reference.predict(corrupted, max_iterations=50)
+
+        for dtype, nbytes in (('float32', 4), ('int16', 2)):
+            network = HopfieldNetwork((10, 10), weight_dtype=dtype)
+            network.train(patterns)
+
+            info = network.get_training_info()
+            self.assertEqual(info['weight_dtype'], dtype)
+            self.assertEqual(info['weights_nbytes'], 100 * 100 * nbytes)
+            np.testing.assert_allclose(
+                network.get_weights(), reference.get_weights(), rtol=1e-6
+            )
+            np.testing.assert_array_equal(
+                network.predict(corrupted, max_iterations=50), expected
+            )
+
+    def test_predict_returns_state_dtype(self):
+        """Test que los estados usan el tipo de la política (int8)."""
+        patterns = np.array([[1, -1, 1, -1, 1, -1, 1, -1, 1]])
+        self.network.train(patterns)
+
+        self.assertEqual(self.network.predict(patterns[0]).dtype, np.int8)
+        self.assertEqual(self.network.predict_sync(patterns[0]).dtype, np.int8)
+        self.assertEqual(self.network.predict_batch(patterns).dtype, np.int8)
+
+    def test_invalid_weight_dtype_raises_error(self):
+        """Test que un tipo de pesos desconocido lanza error."""
+        with self.assertRaises(ValueError):
+            HopfieldNetwork((3, 3), weight_dtype='float16')
+
+    def test_add_patterns_matches_retraining(self):
+        """Test que agregar patrones equivale a reentrenar con todos."""
+        rng = np.random.default_rng(4)
+        patterns = rng.choice([-1, 1], size=(6, 100))
+
+        for dtype in ('float64', 'float32', 'int16'):
+            incremental = HopfieldNetwork((10, 10), weight_dtype=dtype)
+            incremental.add_patterns(patterns[:4])
+            incremental.add_patterns(patterns[4:])
+
+            retrained = HopfieldNetwork((10, 10), weight_dtype=dtype)
+            retrained.train(patterns)
+
+            np.testing.assert_array_equal(
+                incremental.get_weights(), retrained.get_weights()
+            )
+            self.assertEqual(
+                incremental.get_training_info()['n_patterns_trained'], 6
+            )
+
+    def test_remove_patterns_matches_retraining(self):
+        """Test que eliminar patrones equivale a reentrenar sin ellos."""
+        rng = np.random.default_rng(5)
+        patterns = rng.choice([-1, 1], size=(5, 100))
+
+        for mode in ('dense', 'low_rank'):
+            network = HopfieldNetwork((10, 10), weight_mode=mode)
+            network.train(patterns)
+            network.remove_patterns(patterns[[1, 3]])
+
+            retrained = HopfieldNetwork((10, 10), weight_mode=mode)
+            retrained.train(patterns[[0, 2, 4]])
+
+            np.testing.assert_array_equal(
+                network.get_weights(), retrained.get_weights()
+            )
+            self.assertEqual(network.get_training_info()['n_patterns_trained'], 3)
+
+    def test_remove_patterns_rejects_invalid_requests(self):
+        """Test que no se eliminan patrones ausentes ni todos los patrones."""
+        patterns = np.array([
+            [1, -1, 1, -1, 1, -1, 1, -1, 1],
+            [-1, 1, -1, 1, -1, 1, -1, 1, -1]
+        ])
+
+        with self.assertRaises(ValueError):
+            self.network.remove_patterns(patterns[:1])
+
+        self.network.train(patterns)
+
+        with self.assertRaises(ValueError):
+            self.network.remove_patterns(np.ones((1, 9), dtype=int))
+
+        with self.assertRaises(ValueError):
+            self.network.remove_patterns(patterns)
+
+    def test_storkey_matches_reference_rule(self):
+        """Test que la versión vectorizada coincide con la definición."""
+        rng = np.random.default_rng(6)
+        patterns = rng.choice([-1, 1], size=(3, 9))
+
+        # Referencia elemento a elemento (Storkey, 1997)
+        expected = np.zeros((9, 9))
+        for xi in patterns:
+            local = np.array([[
+                sum(expected[i, k] * xi[k] for k in range(9) if k not in (i, j))
+                for j in range(9)] for i in range(9)
+            ])
+            delta = (np.outer(xi, xi) - xi[:, None] * local.T - local * xi[None, :]) / 9
+            expected = expected + delta
+            np.fill_diagonal(expected, 0)
+
+        network = HopfieldNetwork((3, 3), learning_rule='storkey')
+        weights = network.train(patterns)
+
+        np.testing.assert_allclose(weights, expected, atol=1e-12)
+        np.testing.assert_allclose(weights, weights.T, atol=1e-12)
+        self.assertEqual(network.get_training_info()['learning_rule'], 'storkey')
+
+    def test_storkey_stores_correlated_patterns(self):
+        """Test que Storkey estabiliza patrones que Hebb no puede."""
+        rng = np.random.default_rng(7)
+        patterns = np.tile(rng.choice([-1, 1], size=100), (12, 1))
+        for row in patterns:
+            row[rng.choice(100, 25, replace=False)] *= -1
+
+        stable = {}
+        for rule in ('hebbian', 'storkey'):
+            network = HopfieldNetwork((10, 10), learning_rule=rule)
+            network.train(patterns)
+            result = network.predict_batch(patterns, max_iterations=1)
+            stable[rule] = np.all(result == patterns, axis=1).sum()
+
+        self.assertGreater(stable['storkey'], stable['hebbian'])
+
+    def test_storkey_incremental_updates(self):
+        """Test que Storkey agrega y elimina patrones como al reentrenar."""
+        rng = np.random.default_rng(8)
+        patterns = rng.choice([-1, 1], size=(4, 100))
+
+        network = HopfieldNetwork((10, 10), learning_rule='storkey')
+        network.train(patterns[:3])
+        network.add_patterns(patterns[3:])
+
+        retrained = HopfieldNetwork((10, 10), learning_rule='storkey')
+        retrained.train(patterns)
+        np.testing.assert_allclose(network.get_weights(), retrained.get_weights())
+
+        network.remove_patterns(patterns[:1])
+        retrained.train(patterns[1:])
+        np.testing.assert_allclose(network.get_weights(), retrained.get_weights())
+        self.assertEqual(network.get_training_info()['n_patterns_trained'], 3)
+
+    def test_storkey_requires_dense_float_weights(self):
+        """Test que Storkey rechaza pesos de bajo rango o int16."""
+        with self.assertRaises(ValueError):
+            HopfieldNetwork((3, 3), learning_rule='storkey', weight_mode='low_rank')
+
+        with self.assertRaises(ValueError):
+            HopfieldNetwork((3, 3), learning_rule='storkey', weight_dtype='int16')
+
+        with self.assertRaises(ValueError):
+            HopfieldNetwork((3, 3), learning_rule='oja')
+
+    def test_pseudo_inverse_stores_correlated_patterns_exactly(self):
+        """Test que la regla de proyección fija todos los patrones."""
+        rng = np.random.default_rng(9)
+        patterns = np.tile(rng.choice([-1, 1], size=100), (20, 1))
+        for row in patterns:
+            row[rng.choice(100, 25, replace=False)] *= -1
+
+        network = HopfieldNetwork((10, 10), learning_rule='pseudo_inverse')
+        weights = network.train(patterns)
+
+        np.testing.assert_array_equal(np.diag(weights), np.zeros(100))
+        np.testing.assert_allclose(weights, weights.T, atol=1e-12)
+
+        result, iterations = network.predict_batch(
+            patterns, return_iterations=True
+        )
+        np.testing.assert_array_equal(result, patterns)
+        self.assertTrue(np.all(iterations == 1))
+
+    def test_pseudo_inverse_incremental_updates(self):
+        """Test que Greville agrega patrones como al reentrenar."""
+        rng = np.random.default_rng(10)
+        patterns = rng.choice([-1, 1], size=(8, 100))
+
+        network = HopfieldNetwork((10, 10), learning_rule='pseudo_inverse')
+        network.train(patterns[:5])
+        network.add_patterns(patterns[5:])
+        # Un patrón repetido no cambia el proyector
+        network.add_patterns(patterns[:1])
+
+        retrained = HopfieldNetwork((10, 10), learning_rule='pseudo_inverse')
+        retrained.train(patterns)
+        np.testing.assert_allclose(
+            network.get_weights(), retrained.get_weights(), atol=1e-10
+        )
+        self.assertEqual(network.get_training_info()['n_patterns_trained'], 9)
+
+        network.remove_patterns(patterns[:1])
+        self.assertEqual(network.get_training_info()['n_patterns_trained'], 8)
+        np.testing.assert_allclose(
+            network.get_weights(), retrained.get_weights(), atol=1e-10
+        )
+
+    def test_sparse_full_density_matches_dense(self):
+        """Test que sin poda los pesos dispersos reproducen la red densa."""
+        rng = np.random.default_rng(6)
+        patterns = rng.choice([-1, 1], size=(6, 100))
+        dense = HopfieldNetwork((10, 10))
+        sparse = HopfieldNetwork((10, 10), weight_mode='sparse', density=1.0)
+        dense.train(patterns)
+        sparse.train(patterns)
+
+        np.testing.assert_allclose(sparse.get_weights(), dense.get_weights())
+        corrupted = rng.choice([-1, 1], size=(4, 100))
+        for row in corrupted:
+            np.testing.assert_array_equal(sparse.predict(row), dense.predict(row))
+            np.testing.assert_array_equal(sparse.predict_sync(row), dense.predict_sync(row))
+        np.testing.assert_array_equal(
+            sparse.predict_batch(corrupted), dense.predict_batch(corrupted)
+        )
+
+    def test_sparse_pruned_matches_dense_with_empty_rows(self):
+        """Test que con filas vacías al final los campos siguen siendo exactos."""
+        rng = np.random.default_rng(36)
+        patterns = rng.choice([-1, 1], size=(5, 50))
+        sparse = HopfieldNetwork((5, 10), weight_mode='sparse', density=0.05)
+        sparse.train(patterns)
+        storage = sparse._storage
+        weights = storage.to_dense()
+        self.assertEqual(storage.indptr[-2], storage.indptr[-1])
+
+        # Red densa con la misma matriz podada
+        dense = HopfieldNetwork((5, 10))
+        dense.train(patterns)
+        dense._storage = DenseWeights(weights.copy())
+
+        states = rng.choice([-1, 1], size=(6, 50))
+        np.testing.assert_allclose(storage.fields(states), states @ weights)
+        for state in states:
+            np.testing.assert_allclose(storage.field(state), weights @ state)
+            self.assertAlmostEqual(sparse.energy(state), -0.5 * state @ weights @ state)
+            np.testing.assert_array_equal(sparse.predict(state), dense.predict(state))
+            np.testing.assert_array_equal(sparse.predict_sync(state), dense.predict_sync(state))
+        np.testing.assert_array_equal(
+            sparse.predict_batch(states), dense.predict_batch(states)
+        )
+
+    def test_sparse_hebbian_matches_pruned_dense_matrix(self):
+        """Test que la poda sin matriz densa conserva los mismos pesos."""
+        rng = np.random.default_rng(9)
+        patterns = rng.choice([-1, 1], size=(5, 120))
+
+        for pruning in ('magnitude', 'random', 'local'):
+            for weight_dtype in ('float64', 'float32'):
+                network = HopfieldNetwork(
+                    (10, 12), weight_mode='sparse', pruning=pruning,
+                    density=0.1, weight_dtype=weight_dtype
+                )
+                network.train(patterns)
+                dense = HopfieldNetwork((10, 12), weight_dtype=weight_dtype)
+                dense.train(patterns)
+                expected = network._sparse_storage(dense.weights)
+
+                np.testing.assert_array_equal(network._storage.indptr, expected.indptr)
+                np.testing.assert_array_equal(
+                    network._storage.to_dense(), expected.to_dense()
+                )
+                self.assertEqual(network._storage.data.dtype, np.dtype(weight_dtype))
+
+    def test_sparse_training_memory_grows_with_kept_weights(self):
+        """Test que entrenar en modo disperso no reserva la matriz N x N."""
+        rng = np.random.default_rng(10)
+        patterns = rng.choice([-1, 1], size=(8, 2640)).astype(np.int8)
+        dense_nbytes = 2640 * 2640 * 8
+
+        for pruning in ('magnitude', 'random', 'local'):
+            network = HopfieldNetwork(
+                (44, 60), weight_mode='sparse', pruning=pruning, density=0.02
+            )
+            tracemalloc.start()
+            try:
+                network.train(patterns)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            self.assertLess(peak, dense_nbytes / 3)
+
+    def test_sparse_pruning_masks(self):
+        """Test que cada estrategia de poda conserva una matriz simétrica."""
+        rng = np.random.default_rng(7)
+        patterns = rng.choice([-1, 1], size=(5, 100))
+
+        for pruning in ('magnitude', 'random', 'local'):
+            network = HopfieldNetwork(
+                (10, 10), weight_mode='sparse', pruning=pruning, density=0.1
+            )
+            network.train(patterns)
+            weights = network.get_weights()
+            kept = np.count_nonzero(weights) / (100 * 99)
+
+            np.testing.assert_array_equal(weights, weights.T)
+            np.testing.assert_array_equal(np.diag(weights), np.zeros(100))
+            self.assertLess(kept, 0.5)
+            self.assertLess(
+                network.get_training_info()['weights_nbytes'], 100 * 100 * 8
+            )
+
+        # La poda local solo conecta vecinas en la imagen (10 columnas)
+        local = np.flatnonzero(network.get_weights()[55])
+        self.assertTrue(np.all(np.abs(local // 10 - 5) <= 2))
+        self.assertTrue(np.all(np.abs(local % 10 - 5) <= 2))
+
+    def test_sparse_add_patterns_prunes_again(self):
+        """Test que agregar patrones en modo disperso equivale a reentrenar."""
+        rng = np.random.default_rng(8)
+        patterns = rng.choice([-1, 1], size=(6, 100))
+        network = HopfieldNetwork((10, 10), weight_mode='sparse', density=0.2)
+        reference = HopfieldNetwork((10, 10), weight_mode='sparse', density=0.2)
+
+        network.train(patterns[:4])
+        network.add_patterns(patterns[4:])
+        reference.train(patterns)
+        np.testing.assert_array_equal(network.get_weights(), reference.get_weights())
+
+    def test_invalid_sparse_options_raise_error(self):
+        """Test que se rechazan opciones de poda inválidas."""
+        with self.assertRaises(ValueError):
+            HopfieldNetwork((3, 3), weight_mode='sparse', pruning='largest')
+        with self.assertRaises(ValueError):
+            HopfieldNetwork((3, 3), weight_mode='sparse', density=0)
+        with self.assertRaises(ValueError):
+            HopfieldNetwork((3, 3), weight_mode='sparse', weight_dtype='int16')
+
     def test_get_training_info(self):
         """Test de información de entrenamiento."""
         patterns = np.array([
@@ -0,0 +1,83 @@
+"""
+Tests para PackedPatterns.
+"""
+
+import unittest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Agregar directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.packed_patterns import PackedPatterns
+from src.utils.image_processor import ImageProcessor
+
+
+class TestPackedPatterns(unittest.TestCase):
+    """Tests para PackedPatterns."""
+
+    def setUp(self):
+        """Configura el entorno de test."""
+        rng = np.random.default_rng(0)
+        # 100 neuronas: no es múltiplo de 64, prueba el relleno
+        self.patterns = rng.choice([-1, 1], size=(6, 100)).astype(np.int8)
+        self.packed = PackedPatterns.from_patterns(self.patterns)
+
+    def test_round_trip(self):
+        """Test que empaquetar y desempaquetar conserva los patrones."""
+        np.testing.assert_array_equal(self.packed.to_patterns(), self.patterns)
+        self.assertEqual(len(self.packed), 6)
+        self.assertEqual(self.packed.bits.shape, (6, 16))
+
+    def test_hamming_one_vs_many(self):
+        """Test de distancia de Hamming contra toda la colección."""
+        query = self.patterns[2].copy()
+        query[:7] *= -1
+
+        distances = self.packed.hamming(query)
+
+        expected = np.sum(self.patterns != query, axis=1)
+        np.testing.assert_array_equal(distances, expected)
+        self.assertEqual(distances[2], 7)
+
+    def test_pairwise_hamming_and_overlap(self):
+        """Test de distancias y solapamientos de todos contra todos."""
+        others = self.patterns[::-1][:4]
+
+        distances = self.packed.pairwise_hamming(others)
+        overlaps = self.packed.pairwise_overlap(others)
+
+        expected = np.dot(self.patterns.astype(int), others.T.astype(int)) / 100
+        self.assertEqual(distances.shape, (6, 4))
+        np.testing.assert_allclose(overlaps, expected)
+        np.testing.assert_allclose(distances, (1 - expected) * 50)
+
+    def test_similarity_matches_image_processor(self):
+        """Test que la similitud coincide con calculate_similarity."""
+        query = -self.patterns[0]
+
+        similarities = self.packed.similarity(query)
+
+        for pattern, similarity in zip(self.patterns, similarities):
+            self.assertAlmostEqual(
+                similarity,
+                ImageProcessor.calculate_similarity(pattern, query)
+            )
+
+    def test_memory_is_one_bit_per_neuron(self):
+        """Test que la memoria ocupada es ~1 bit por neurona."""
+        patterns = np.ones((10, 2640), dtype=np.int64)
+        packed = PackedPatterns.from_patterns(patterns)
+
+        self.assertEqual(packed.nbytes, 10 * 2688 // 8)
+        self.assertGreater(patterns.nbytes / packed.nbytes, 60)
+
+    def test_size_mismatch_raises_error(self):
+        """Test que comparar tamaños distintos lanza error."""
+        with self.assertRaises(ValueError):
+            self.packed.hamming(np.ones(50))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Tests para PatternDataset.
+"""
+
+import unittest
+import numpy as np
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config.settings import config
+from src.models.hopfield_network import HopfieldNetwork
+from src.utils.image_processor import ImageProcessor
+from src.utils.pattern_dataset import PatternDataset, build_dataset, parse_pattern_filename
+
+
+class TestPatternDataset(unittest.TestCase):
+    """Tests para el formato de conjunto de datos empaquetado."""
+
+    def setUp(self):
+        """Crea patrones limpios y corruptos con la convención de nombres."""
+        self.temp_dir = tempfile.mkdtemp()
+        root = Path(self.temp_dir)
+        (root / 'patterns').mkdir()
+        (root / 'corrupted').mkdir()
+
+        rng = np.random.default_rng(0)
+        self.clean = rng.choice([-1, 1], size=(3, config.image.total_pixels)).astype(np.int8)
+        for letter, pattern in zip('AEI', self.clean):
+            ImageProcessor.pattern_to_image(
+                pattern, save_path=str(root / 'patterns' / f'pattern_{letter}.png')
+            )
+            for rate in (10, 20):
+                corrupted = ImageProcessor.corrupt_pattern(pattern, rate / 100, seed=rate)
+                ImageProcessor.pattern_to_image(
+                    corrupted, save_path=str(root / 'corrupted' / f'corrupted_{letter}_{rate}.png')
+                )
+
+        self.sources = [str(root / 'patterns'), str(root / 'corrupted')]
+        self.path = root / 'letters.dataset'
+
+    def tearDown(self):
+        """Limpia archivos temporales."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_parse_pattern_filename(self):
+        """Test de la convención de nombres de data/README.md."""
+        self.assertEqual(parse_pattern_filename('corrupted_A_20.png'), ('A', 0.2))
+        self.assertEqual(parse_pattern_filename('corrupted_pattern_B_5.png'), ('B', 0.05))
+        self.assertEqual(parse_pattern_filename('data/patterns/pattern_C.png'), ('C', 0.0))
+        letter, rate = parse_pattern_filename('scan_001.png')
+        self.assertIsNone(letter)
+        self.assertTrue(np.isnan(rate))
+
+    def test_round_trip_with_index(self):
+        """Test que guardar y abrir conserva patrones e índice."""
+        build_dataset(self.sources).save(self.path)
+
+        dataset = PatternDataset.open(self.path)
+
+        self.assertEqual(len(dataset), 9)
+        self.assertEqual(dataset.letters, ['A', 'E', 'I'])
+        self.assertEqual(dataset.pattern_size, config.image.size)
+        clean = dataset.select(corrupted=False)
+        np.testing.assert_array_equal(dataset.packed[clean].to_patterns(), self.clean)
+        self.assertEqual([dataset.filename(i) for i in clean],
+                         ['pattern_A.png', 'pattern_E.png', 'pattern_I.png'])
+
+        index = dataset.select(letter='E', corrupted=True)
+        self.assertEqual(len(index), 2)
+        self.assertEqual(dataset.letter(index[0]), 'E')
+        np.testing.assert_allclose(sorted(dataset.corruption[index]), [0.1, 0.2])
+        self.assertEqual(len(dataset.select(letter='Z')), 0)
+
+    def test_open_is_memory_mapped(self):
+        """Test que abrir el conjunto no copia los arrays."""
+        build_dataset(self.sources).save(self.path)
+
+        dataset = PatternDataset.open(self.path)
+
+        self.assertIsInstance(dataset.packed.bits.base, np.memmap)
+        for array in (dataset.labels, dataset.corruption, dataset.filenames):
+            self.assertIsInstance(array, np.memmap)
+        batch = next(dataset.batches(4))
+        self.assertTrue(np.shares_memory(batch.bits, dataset.packed.bits))
+
+    def test_train_and_predict_from_dataset(self):
+        """Test que la red entrena y predice directamente con PackedPatterns."""
+        build_dataset(self.sources).save(self.path)
+        dataset = PatternDataset.open(self.path)
+
+        from_packed = HopfieldNetwork(config.image.size)
+        from_packed.train(dataset.packed[dataset.select(corrupted=False)])
+        from_array = HopfieldNetwork(config.image.size)
+        from_array.train(self.clean)
+
+        self.assertEqual(from_packed.fingerprint(), from_array.fingerprint())
+        self.assertEqual(
+            from_packed.fingerprint(dataset.packed[dataset.select(corrupted=False)]),
+            from_array.fingerprint(self.clean)
+        )
+
+        corrupted = dataset.select(corrupted=True)
+        results = np.concatenate([
+            from_packed.predict_batch(batch) for batch in dataset.batches(4)
+        ])
+        expected = from_array.predict_batch(dataset.packed.to_patterns())
+        np.testing.assert_array_equal(results, expected)
+        for i in corrupted:
+            np.testing.assert_array_equal(results[i], self.clean[dataset.labels[i]])
+
+    def test_open_rejects_other_files(self):
+        """Test que un modelo guardado no se abre como conjunto de datos."""
+        network = HopfieldNetwork(config.image.size)
+        network.train(self.clean)
+        model_path = Path(self.temp_dir) / 'model.hopfield'
+        network.save(model_path)
+
+        with self.assertRaises(ValueError):
+            PatternDataset.open(model_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
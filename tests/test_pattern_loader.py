@@ -0,0 +1,154 @@
+"""
+Tests para la carga de directorios con caché de patrones decodificados.
+"""
+
+import unittest
+import numpy as np
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Agregar directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config.settings import config
+from src.utils.image_processor import ImageProcessor
+from src.utils.packed_patterns import PackedPatterns
+from src.utils.pattern_loader import cache_path_for, find_image_files, load_patterns
+from src.utils.validators import ValidationError
+
+
+class TestPatternLoader(unittest.TestCase):
+    """Tests para load_patterns."""
+
+    def setUp(self):
+        """Crea un directorio con imágenes de patrones aleatorios."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.image_dir = Path(self.temp_dir) / 'images'
+        self.image_dir.mkdir()
+        self.cache_path = Path(self.temp_dir) / 'cache' / 'patterns.patterns'
+
+        rng = np.random.default_rng(0)
+        self.patterns = rng.choice([-1, 1], size=(5, config.image.total_pixels)).astype(np.int8)
+        for i, pattern in enumerate(self.patterns):
+            self.save(f'pattern_{i}.png', pattern)
+        (self.image_dir / 'README.txt').write_text('no es una imagen')
+
+    def tearDown(self):
+        """Limpia archivos temporales."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def save(self, name, pattern):
+        """Guarda un patrón como imagen en el directorio de prueba."""
+        path = self.image_dir / name
+        ImageProcessor.pattern_to_image(pattern, save_path=str(path))
+        return path
+
+    def count_decodes(self, **kwargs):
+        """Carga el directorio contando las imágenes decodificadas."""
+        with mock.patch.object(
+            ImageProcessor, 'load_pattern', wraps=ImageProcessor.load_pattern
+        ) as decoded:
+            paths, patterns = load_patterns(self.image_dir, **kwargs)
+        return paths, patterns, decoded.call_count
+
+    def test_find_image_files(self):
+        """Test que se listan solo las imágenes, ordenadas, en directorio o glob."""
+        paths = find_image_files(self.image_dir)
+        self.assertEqual([Path(p).name for p in paths], [f'pattern_{i}.png' for i in range(5)])
+        self.assertEqual(find_image_files(str(self.image_dir / 'pattern_[0-1].png')), paths[:2])
+
+    def test_missing_file_raises_validation_error(self):
+        """Test que una ruta inexistente lanza ValidationError."""
+        with self.assertRaises(ValidationError):
+            load_patterns(self.image_dir / 'missing.png')
+
+    def test_load_without_cache(self):
+        """Test que la carga sin caché decodifica todas las imágenes."""
+        paths, patterns, decoded = self.count_decodes(n_workers=2)
+
+        self.assertEqual(len(paths), 5)
+        self.assertEqual(decoded, 5)
+        self.assertEqual(patterns.dtype, np.dtype(config.network.STATE_DTYPE))
+        np.testing.assert_array_equal(patterns, self.patterns)
+
+    def test_warm_load_skips_decoding(self):
+        """Test que con la caché al día no se decodifica ninguna imagen."""
+        self.count_decodes(cache_path=self.cache_path)
+        self.assertTrue(self.cache_path.exists())
+
+        _, patterns, decoded = self.count_decodes(cache_path=self.cache_path)
+
+        self.assertEqual(decoded, 0)
+        np.testing.assert_array_equal(patterns, self.patterns)
+
+    def test_only_changed_images_are_decoded(self):
+        """Test que solo se decodifican las imágenes nuevas o modificadas."""
+        self.count_decodes(cache_path=self.cache_path)
+
+        changed = -self.patterns[1]
+        path = self.save('pattern_1.png', changed)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.save('pattern_5.png', self.patterns[0])
+
+        paths, patterns, decoded = self.count_decodes(cache_path=self.cache_path)
+
+        self.assertEqual(decoded, 2)
+        self.assertEqual(len(paths), 6)
+        np.testing.assert_array_equal(patterns[1], changed)
+        np.testing.assert_array_equal(patterns[5], self.patterns[0])
+
+    def test_packed_warm_load_is_memory_mapped(self):
+        """Test que packed=True retorna los bits sobre el archivo mapeado."""
+        load_patterns(self.image_dir, cache_path=self.cache_path)
+
+        _, library = load_patterns(self.image_dir, cache_path=self.cache_path, packed=True)
+
+        self.assertIsInstance(library, PackedPatterns)
+        self.assertIsInstance(library.bits.base, np.memmap)
+        np.testing.assert_array_equal(library.to_patterns(), self.patterns)
+
+    def test_invalid_images_are_reported_together(self):
+        """Test que todas las imágenes inválidas se reportan en un error."""
+        (self.image_dir / 'broken.png').write_bytes(b'no es una imagen')
+        ImageProcessor.pattern_to_image(
+            np.ones(100), size=(10, 10), save_path=str(self.image_dir / 'small.png')
+        )
+
+        with self.assertRaises(ValidationError) as context:
+            load_patterns(self.image_dir, cache_path=self.cache_path)
+
+        self.assertIn('broken.png', str(context.exception))
+        self.assertIn('small.png', str(context.exception))
+        self.assertFalse(self.cache_path.exists())
+
+    def test_resampled_load_uses_its_own_cache(self):
+        """Test que cambiar la resolución invalida los patrones en caché."""
+        load_patterns(self.image_dir, cache_path=self.cache_path)
+
+        _, small, decoded = self.count_decodes(
+            cache_path=self.cache_path, size=(22, 30), resample=True
+        )
+
+        self.assertEqual(decoded, 5)
+        self.assertEqual(small.shape, (5, 22 * 30))
+        _, _, decoded = self.count_decodes(
+            cache_path=self.cache_path, size=(22, 30), resample=True
+        )
+        self.assertEqual(decoded, 0)
+        self.assertNotEqual(
+            cache_path_for(self.image_dir, size=(22, 30)), cache_path_for(self.image_dir)
+        )
+
+    def test_cache_path_for(self):
+        """Test que la ruta de caché depende del directorio cargado."""
+        self.assertEqual(cache_path_for(self.image_dir), cache_path_for(str(self.image_dir)))
+        self.assertNotEqual(cache_path_for(self.image_dir), cache_path_for(self.temp_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+Tests para la persistencia de modelos entrenados.
+"""
+
+import unittest
+import numpy as np
+import struct
+import tempfile
+import sys
+from pathlib import Path
+
+# Agregar directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.hopfield_network import HopfieldNetwork
+from src.models.persistence import FORMAT_VERSION, MAGIC, read_metadata, read_model
+
+
+class TestPersistence(unittest.TestCase):
+    """Tests para save/load de HopfieldNetwork."""
+
+    def setUp(self):
+        """Configura patrones, una entrada corrupta y un directorio temporal."""
+        rng = np.random.default_rng(0)
+        self.patterns = rng.choice([-1, 1], size=(6, 120))
+        self.corrupted = self.patterns[1].copy()
+        self.corrupted[rng.choice(120, 20, replace=False)] *= -1
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / 'model.hopfield'
+
+    def tearDown(self):
+        """Limpia archivos temporales."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip_all_modes(self):
+        """Test que la red cargada reproduce pesos y predicciones."""
+        configurations = (
+            {},
+            {'weight_dtype': 'int16'},
+            {'weight_dtype': 'float32'},
+            {'weight_mode': 'low_rank'},
+            {'weight_mode': 'sparse', 'pruning': 'random', 'density': 0.3},
+            {'learning_rule': 'pseudo_inverse'},
+        )
+        for kwargs in configurations:
+            network = HopfieldNetwork((10, 12), **kwargs)
+            network.train(self.patterns)
+            network.save(self.path)
+
+            for mmap_mode in (None, 'r'):
+                loaded = HopfieldNetwork.load(self.path, mmap_mode=mmap_mode)
+                np.testing.assert_array_equal(
+                    loaded.get_weights(), network.get_weights()
+                )
+                np.testing.assert_array_equal(
+                    loaded.stored_patterns, network.stored_patterns
+                )
+                np.testing.assert_array_equal(
+                    loaded.predict(self.corrupted), network.predict(self.corrupted)
+                )
+                self.assertEqual(
+                    loaded.get_training_info(), network.get_training_info()
+                )
+
+    def test_mmap_weights_are_shared_and_copied_on_update(self):
+        """Test que los pesos mapeados se copian antes de modificarse."""
+        network = HopfieldNetwork((10, 12), learning_rule='storkey')
+        network.train(self.patterns[:4])
+        network.save(self.path)
+
+        loaded = HopfieldNetwork.load(self.path, mmap_mode='r')
+        self.assertIsInstance(loaded.weights, np.memmap)
+        self.assertFalse(loaded.weights.flags.writeable)
+
+        loaded.add_patterns(self.patterns[4:])
+        network.add_patterns(self.patterns[4:])
+        np.testing.assert_allclose(loaded.get_weights(), network.get_weights())
+
+        # El archivo no cambia
+        reloaded = HopfieldNetwork.load(self.path)
+        self.assertEqual(reloaded.get_training_info()['n_patterns_trained'], 4)
+
+    def test_updates_never_write_to_the_model_file(self):
+        """Test que add_patterns no modifica el archivo y 'r+' se rechaza."""
+        network = HopfieldNetwork((10, 12))
+        network.train(self.patterns[:4])
+        network.save(self.path)
+        saved = network.get_weights()
+
+        with self.assertRaises(ValueError):
+            HopfieldNetwork.load(self.path, mmap_mode='r+')
+
+        for mmap_mode in (None, 'r', 'c'):
+            loaded = HopfieldNetwork.load(self.path, mmap_mode=mmap_mode)
+            loaded.add_patterns(self.patterns[4:])
+
+            reloaded = HopfieldNetwork.load(self.path)
+            np.testing.assert_array_equal(reloaded.get_weights(), saved)
+            self.assertEqual(reloaded.get_training_info()['n_patterns_trained'], 4)
+
+    def test_compact_checkpoint_rebuilds_weights_lazily(self):
+        """Test que el checkpoint compacto reconstruye los mismos pesos."""
+        configurations = (
+            {},
+            {'learning_rule': 'storkey'},
+            {'weight_mode': 'low_rank'},
+            {'weight_mode': 'sparse', 'pruning': 'random', 'density': 0.3},
+        )
+        for kwargs in configurations:
+            network = HopfieldNetwork((10, 12), **kwargs)
+            network.pruning_seed = 5
+            network.train(self.patterns)
+            network.save(self.path, compact=True)
+
+            metadata = read_metadata(self.path)
+            self.assertIsNone(metadata['storage'])
+            self.assertEqual(list(metadata['arrays']), ['patterns'])
+            self.assertLess(self.path.stat().st_size, 1024)
+
+            loaded = HopfieldNetwork.load(self.path)
+            self.assertTrue(loaded.is_trained())
+            self.assertIsNone(loaded._weight_storage)
+
+            np.testing.assert_array_equal(
+                loaded.predict(self.corrupted), network.predict(self.corrupted)
+            )
+            self.assertIsInstance(loaded._weight_storage, type(network._storage))
+            np.testing.assert_array_equal(loaded.get_weights(), network.get_weights())
+
+    def test_metadata(self):
+        """Test que los metadatos se leen sin cargar los pesos."""
+        network = HopfieldNetwork((10, 12), weight_mode='low_rank')
+        network.train(self.patterns)
+        network.save(self.path)
+
+        metadata = read_metadata(self.path)
+        self.assertEqual(metadata['format_version'], FORMAT_VERSION)
+        self.assertEqual(metadata['pattern_size'], [10, 12])
+        self.assertEqual(metadata['weight_mode'], 'low_rank')
+        self.assertEqual(metadata['storage']['class'], 'LowRankWeights')
+        self.assertEqual(len(metadata['pattern_hash']), 64)
+        for entry in metadata['arrays'].values():
+            self.assertEqual(entry['offset'] % 64, 0)
+
+    def test_invalid_files_raise_error(self):
+        """Test que se rechazan archivos ajenos, versiones y huellas inválidas."""
+        network = HopfieldNetwork((10, 12))
+        with self.assertRaises(ValueError):
+            network.save(self.path)
+
+        network.train(self.patterns)
+        network.save(self.path)
+
+        # Alterar un bit de los patrones rompe la huella
+        _, arrays = read_model(self.path, mmap_mode='r+')
+        arrays['patterns'][0, 0] ^= 1
+        arrays['patterns'].flush()
+        del arrays
+        with self.assertRaises(ValueError):
+            HopfieldNetwork.load(self.path)
+
+        self.path.write_bytes(struct.pack('<8sII', MAGIC, FORMAT_VERSION + 1, 0))
+        with self.assertRaises(ValueError):
+            HopfieldNetwork.load(self.path)
+
+        self.path.write_bytes(b'not a model')
+        with self.assertRaises(ValueError):
+            HopfieldNetwork.load(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+"""
+Tests para la caché de resultados de predicción.
+"""
+
+import unittest
+import numpy as np
+import tempfile
+import sys
+from pathlib import Path
+
+# Agregar directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.hopfield_network import HopfieldNetwork
+from src.models.prediction_cache import PredictionCache
+from src.models.schedulers import RandomPermutationScheduler
+
+
+class TestPredictionCache(unittest.TestCase):
+    """Tests para PredictionCache."""
+
+    def setUp(self):
+        """Configura una red entrenada, entradas corruptas y un directorio."""
+        rng = np.random.default_rng(0)
+        self.patterns = rng.choice([-1, 1], size=(6, 120))
+        self.network = HopfieldNetwork((10, 12))
+        self.network.train(self.patterns)
+
+        self.corrupted = self.patterns[2].copy()
+        self.corrupted[rng.choice(120, 30, replace=False)] *= -1
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Limpia archivos temporales."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_repeated_prediction_hits(self):
+        """Test que la segunda predicción sale de la caché."""
+        cache = PredictionCache()
+        expected = self.network.predict(self.corrupted)
+
+        first = cache.predict(self.network, self.corrupted)
+        second = cache.predict(self.network, self.corrupted)
+
+        np.testing.assert_array_equal(first, expected)
+        np.testing.assert_array_equal(second, expected)
+        self.assertEqual(second.dtype, self.network.state_dtype)
+        self.assertEqual(cache.stats()['misses'], 1)
+        self.assertEqual(cache.stats()['hits'], 1)
+
+    def test_engine_options_and_model_are_part_of_key(self):
+        """Test que otro modo, planificador o modelo no reutiliza resultados."""
+        cache = PredictionCache()
+        cache.predict(self.network, self.corrupted)
+        cache.predict(self.network, self.corrupted, mode='sync')
+        cache.predict(self.network, self.corrupted, max_iterations=1)
+
+        self.network.scheduler = RandomPermutationScheduler(seed=1)
+        result = cache.predict(self.network, self.corrupted)
+        np.testing.assert_array_equal(result, self.network.predict(self.corrupted))
+
+        extra = np.where(np.arange(120) % 2 == 0, 1, -1)
+        self.network.add_patterns(extra[np.newaxis])
+        result = cache.predict(self.network, self.corrupted)
+        np.testing.assert_array_equal(result, self.network.predict(self.corrupted))
+
+        self.assertEqual(cache.stats()['misses'], 5)
+        self.assertEqual(cache.stats()['hits'], 0)
+
+    def test_unseeded_random_scheduler_is_not_cached(self):
+        """Test que sin semilla la predicción asíncrona no se cachea."""
+        cache = PredictionCache()
+        self.network.scheduler = RandomPermutationScheduler(seed=None)
+
+        cache.predict(self.network, self.corrupted)
+        cache.predict(self.network, self.corrupted)
+
+        self.assertEqual(cache.stats()['misses'], 2)
+        self.assertEqual(cache.stats()['hits'], 0)
+        self.assertEqual(len(cache), 0)
+
+        # La dinámica síncrona no usa el planificador
+        cache.predict(self.network, self.corrupted, mode='sync')
+        cache.predict(self.network, self.corrupted, mode='sync')
+        self.assertEqual(cache.stats()['hits'], 1)
+
+    def test_convergence_threshold_is_part_of_key(self):
+        """Test que redes con otro umbral de convergencia no comparten resultados."""
+        pattern = np.random.default_rng(1).choice([-1, 1], size=120)
+        loose = HopfieldNetwork((10, 12))
+        loose.train(self.patterns)
+        loose.convergence_checker.threshold = 0.2
+        self.assertEqual(loose.fingerprint(), self.network.fingerprint())
+
+        for mode, predict in (('sync', 'predict_sync'), ('async', 'predict')):
+            cache = PredictionCache()
+            cache.predict(self.network, pattern, mode=mode)
+            result = cache.predict(loose, pattern, mode=mode)
+
+            np.testing.assert_array_equal(result, getattr(loose, predict)(pattern))
+            self.assertEqual(cache.stats()['misses'], 2)
+            self.assertEqual(cache.stats()['hits'], 0)
+
+        self.assertFalse(np.array_equal(
+            self.network.predict_sync(pattern), loose.predict_sync(pattern)
+        ))
+
+    def test_stored_pattern_short_circuits(self):
+        """Test que un patrón almacenado estable no ejecuta la dinámica."""
+        stable = self.network.fixed_points(self.patterns)
+        self.assertTrue(stable.all())
+
+        cache = PredictionCache()
+        result = cache.predict(self.network, self.patterns[4])
+
+        np.testing.assert_array_equal(result, self.patterns[4])
+        self.assertEqual(cache.stats()['stored_hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 0)
+
+    def test_unstable_stored_pattern_runs_dynamics(self):
+        """Test que un patrón almacenado inestable no se toma como resultado."""
+        base = np.random.default_rng(1).choice([-1, 1], size=120)
+        correlated = np.tile(base, (3, 1))
+        correlated[1, :20] *= -1
+        correlated[2, 20:40] *= -1
+        network = HopfieldNetwork((10, 12))
+        network.train(correlated)
+
+        fixed = network.fixed_points(correlated)
+        self.assertFalse(fixed.all())
+
+        cache = PredictionCache()
+        for row in correlated:
+            result = cache.predict(network, row)
+            np.testing.assert_array_equal(result, network.predict(row))
+        self.assertEqual(cache.stats()['stored_hits'], int(fixed.sum()))
+
+    def test_sqlite_persistence_and_lru(self):
+        """Test que SQLite conserva resultados descartados de la memoria."""
+        path = Path(self.temp_dir) / 'predictions.sqlite'
+        cache = PredictionCache(max_entries=1, path=path)
+        other = self.patterns[3].copy()
+        other[:25] *= -1
+
+        cache.predict(self.network, self.corrupted)
+        cache.predict(self.network, other)
+        self.assertEqual(len(cache), 1)
+
+        result = cache.predict(self.network, self.corrupted)
+        np.testing.assert_array_equal(result, self.network.predict(self.corrupted))
+        self.assertEqual(cache.stats()['database_hits'], 1)
+        cache.close()
+
+        reopened = PredictionCache(path=path)
+        reopened.predict(self.network, other)
+        self.assertEqual(reopened.stats()['database_hits'], 1)
+        self.assertEqual(reopened.stats()['misses'], 0)
+        reopened.close()
+
+    def test_invalid_parameters_raise_error(self):
+        """Test que se validan la entrada, el modo y el tamaño."""
+        cache = PredictionCache()
+        with self.assertRaises(ValueError):
+            cache.predict(self.network, self.corrupted, mode='stochastic')
+        with self.assertRaises(ValueError):
+            cache.predict(self.network, np.append(self.corrupted, -1))
+        with self.assertRaises(ValueError):
+            cache.predict(self.network, np.zeros(120))
+        with self.assertRaises(ValueError):
+            cache.predict(HopfieldNetwork((10, 12)), self.corrupted)
+        with self.assertRaises(ValueError):
+            PredictionCache(max_entries=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
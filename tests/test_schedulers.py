@@ -0,0 +1,94 @@
+"""
+Tests para los planificadores de actualización asíncrona.
+"""
+
+import unittest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Agregar directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.hopfield_network import HopfieldNetwork
+from src.models.schedulers import (
+    BlockScheduler,
+    RandomPermutationScheduler,
+    UnstableSetScheduler,
+)
+
+
+class TestSchedulers(unittest.TestCase):
+    """Tests para los planificadores."""
+
+    def setUp(self):
+        """Configura patrones y entradas corruptas."""
+        rng = np.random.default_rng(0)
+        self.patterns = rng.choice([-1, 1], size=(8, 144))
+        self.corrupted = self.patterns[rng.integers(0, 8, size=6)].copy()
+        for row in self.corrupted:
+            row[rng.choice(144, 40, replace=False)] *= -1
+
+    def _network(self, scheduler, **kwargs):
+        network = HopfieldNetwork(
+            (12, 12), use_convergence=False, scheduler=scheduler, **kwargs
+        )
+        network.train(self.patterns)
+        return network
+
+    def _assert_fixed_point(self, network, state):
+        fields = np.dot(network.get_weights(), state)
+        np.testing.assert_array_equal(np.where(fields > 0, 1, -1), state)
+
+    def test_block_matches_sequential_order(self):
+        """Test que Gauss-Seidel por bloques reproduce el orden secuencial."""
+        for kwargs in ({}, {'weight_mode': 'low_rank'}, {'weight_dtype': 'int16'}):
+            sequential = self._network(None, **kwargs)
+            block = self._network(BlockScheduler(block_size=10), **kwargs)
+            for row in self.corrupted:
+                np.testing.assert_array_equal(
+                    block.predict(row), sequential.predict(row)
+                )
+
+    def test_random_permutation_is_reproducible(self):
+        """Test que la semilla fija el resultado y se alcanza un punto fijo."""
+        first = self._network(RandomPermutationScheduler(seed=3))
+        second = self._network(RandomPermutationScheduler(seed=3))
+
+        for row in self.corrupted:
+            state = first.predict(row)
+            np.testing.assert_array_equal(state, second.predict(row))
+            np.testing.assert_array_equal(state, first.predict(row))
+            self._assert_fixed_point(first, state)
+
+    def test_unstable_set_reaches_fixed_point(self):
+        """Test que el planificador por eventos termina en un punto fijo."""
+        network = self._network(UnstableSetScheduler())
+        for row in self.corrupted:
+            self._assert_fixed_point(network, network.predict(row))
+
+    def test_unstable_set_reduces_evaluations(self):
+        """Test que con poca corrupción se evalúan muy pocas neuronas."""
+        pattern = self.patterns[0].copy()
+        pattern[:3] *= -1
+
+        sequential = self._network('sequential')
+        unstable = self._network('unstable_set')
+        expected, sequential_info = sequential.predict(pattern, return_info=True)
+        result, unstable_info = unstable.predict(pattern, return_info=True)
+
+        np.testing.assert_array_equal(result, expected)
+        self.assertEqual(sequential_info['evaluations'], 2 * 144)
+        self.assertLess(unstable_info['evaluations'], 10)
+        self.assertEqual(unstable_info['reason'], 'zero_flips')
+
+    def test_invalid_scheduler_raises_error(self):
+        """Test que se rechazan planificadores inválidos."""
+        with self.assertRaises(ValueError):
+            HopfieldNetwork((3, 3), scheduler='reverse')
+        with self.assertRaises(ValueError):
+            BlockScheduler(block_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,7 +13,10 @@ from PIL import Image
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.validators import (
+    open_image,
+    validate_image_directory,
     validate_image_file,
+    validate_image_files,
     validate_image_size,
     validate_pattern,
     validate_patterns_array,
@@ -78,6 +81,47 @@ class TestValidators(unittest.TestCase):
         with self.assertRaises(ValidationError):
             validate_image_size(path)
 
+    def test_validate_image_file_directory(self):
+        """Test que un directorio no es un archivo válido."""
+        with self.assertRaises(ValidationError):
+            validate_image_file(self.temp_dir)
+
+    def test_open_image_validates_size(self):
+        """Test que open_image retorna la imagen o rechaza el tamaño."""
+        path = self.create_test_image('ok.png')
+        with open_image(path) as img:
+            self.assertEqual(img.size, config.image.size)
+
+        wrong = self.create_test_image('wrong.png', size=(10, 10))
+        with self.assertRaises(ValidationError):
+            open_image(wrong)
+        with self.assertRaises(ValidationError):
+            open_image(Path(self.temp_dir) / 'missing.png')
+
+    def test_validate_image_files_reports_all_errors(self):
+        """Test que la validación por lotes reporta cada archivo inválido."""
+        good = self.create_test_image('good.png')
+        wrong = self.create_test_image('wrong.png', size=(10, 10))
+        broken = Path(self.temp_dir) / 'broken.png'
+        broken.write_bytes(b'no es una imagen')
+        missing = str(Path(self.temp_dir) / 'missing.png')
+
+        errors = validate_image_files([good, wrong, str(broken), missing])
+
+        self.assertEqual(set(errors), {wrong, str(broken), missing})
+        self.assertIn('Tamaño incorrecto', errors[wrong])
+
+    def test_validate_image_directory(self):
+        """Test validación de un directorio completo."""
+        self.create_test_image('a.png')
+        wrong = self.create_test_image('b.png', size=(10, 10))
+        (Path(self.temp_dir) / 'notas.txt').write_text('ignorado')
+
+        self.assertEqual(list(validate_image_directory(self.temp_dir)), [wrong])
+
+        with self.assertRaises(ValidationError):
+            validate_image_directory(Path(self.temp_dir) / 'missing')
+
     def test_validate_pattern_valid(self):
         """Test validación de patrón válido."""
         pattern = np.array([1, -1, 1, -1])